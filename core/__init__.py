@@ -0,0 +1,13 @@
+"""
+GUI-free engine of the video splitter: the segment model and project
+files. It imports neither tkinter nor customtkinter, so services and
+worker processes can use it without a display. Decoding and export live
+in the top-level decoder, playback, frame_store and video_utils modules;
+VideoProject imports them only when it opens a video, so the segment
+model can be used without them.
+"""
+
+from core.project import VideoProject
+from core.segments import Segment, SegmentManager
+
+__all__ = ["Segment", "SegmentManager", "VideoProject"]
@@ -0,0 +1,183 @@
+import json
+
+from core.segments import SegmentManager
+
+
+class VideoProject:
+    """A source video, its segments and the project file they are saved
+    to. Frames of the preview are read through a pool of decoders."""
+
+    def __init__(
+        self,
+        video_path,
+        output_path=None,
+        video_info=None,
+        backend="opencv",
+        decoder_handles=3,
+    ):
+        """
+        Args:
+            video_path (str): Path to the source video
+            output_path (str, optional): Output directory
+            video_info (dict, optional): Cached "fps" and "total_frames" of
+                the video. If given, the video is not opened until
+                open_video() is called.
+            backend (str): Video backend ("opencv" or "ffmpeg")
+            decoder_handles (int): Maximum number of preview decoders
+        """
+        self._file_path = None
+        self.backend = backend
+        self.decoder_handles = decoder_handles
+        self.video_path = video_path
+        # Video decoded for the editor preview (the source or its proxy)
+        self.preview_path = video_path
+        self.output_path = output_path
+        self.cap = None
+        self.reader = None
+        if video_info is None:
+            self.open_video()
+        else:
+            self.fps = video_info["fps"]
+            self.total_frames = video_info["total_frames"]
+        self.segments = SegmentManager(self.fps, self.total_frames)
+
+    @property
+    def is_video_open(self):
+        return self.cap is not None
+
+    def open_video(self):
+        """Open the video and probe its frame rate and frame count"""
+        self.attach_video(*self.probe_video())
+
+    def probe_video(self):
+        """
+        Open the video without changing the project, so it can run on a
+        worker thread.
+        Returns:
+            tuple: (cap, total_frames, fps) like video_utils.load_video()
+        """
+        import video_utils
+
+        cap, total_frames, fps = video_utils.load_video(
+            self.video_path, backend=self.backend
+        )
+        if not cap.isOpened():
+            cap.release()
+            raise ValueError(f"Failed to open video: {self.video_path}")
+        return cap, total_frames, fps
+
+    def attach_video(self, cap, total_frames, fps):
+        """Use a probed video; segments built from cached metadata are
+        moved to the probed values"""
+        segments = getattr(self, "segments", None)
+        if segments is not None and (
+            fps != self.fps or total_frames != self.total_frames
+        ):
+            self.segments = SegmentManager.from_dicts(
+                fps, total_frames, [s.to_dict() for s in segments]
+            )
+        self.cap, self.total_frames, self.fps = cap, total_frames, fps
+        self.reader = self._create_reader_pool(cap)
+
+    def _create_reader_pool(self, cap):
+        import decoder
+        import video_utils
+
+        return decoder.ReaderPool(
+            lambda: video_utils.open_capture(self.preview_path, self.backend),
+            limit=self.decoder_handles,
+            cap=cap,
+        )
+
+    def set_total_frames(self, total_frames):
+        """Use the exact frame count of a packet scan done after the video
+        was opened; frame numbers of the segments are unchanged"""
+        self.total_frames = total_frames
+        self.segments.total_frames = total_frames
+
+    def use_preview(self, preview_path):
+        """Decode the preview from another file with the same frames"""
+        import video_utils
+
+        cap, total_frames, _ = video_utils.load_video(
+            preview_path, backend=self.backend
+        )
+        if total_frames != self.total_frames:
+            cap.release()
+            raise ValueError("Frame count mismatch")
+        self.reader.release()
+        self.cap = cap
+        self.preview_path = preview_path
+        self.reader = self._create_reader_pool(cap)
+
+    def __del__(self):
+        if self.reader is not None:
+            self.reader.release()
+
+    def to_dict(self):
+        return {
+            "video_path": self.video_path,
+            "output_path": self.output_path,
+            "segments": [segment.to_dict() for segment in self.segments],
+        }
+
+    @property
+    def duration(self):
+        return self.total_frames / self.fps
+
+    @property
+    def file_path(self):
+        return self._file_path
+
+    def save(self, file_path):
+        project_data = {
+            "video_path": self.video_path,
+            "output_path": self.output_path,
+            # Lets the project open before the video is probed
+            "video_info": {
+                "fps": self.fps,
+                "total_frames": self.total_frames,
+            },
+            "segment_list": [segment.to_dict() for segment in self.segments],
+        }
+
+        with open(file_path, "w", encoding="utf-8") as f:
+            json.dump(project_data, f, ensure_ascii=False, indent=2)
+
+        # Update the file path after saving
+        self._file_path = file_path
+
+    @classmethod
+    def load(cls, file_path, lazy=False, **kwargs):
+        """
+        Load a project file.
+        Args:
+            file_path (str): Project file
+            lazy (bool): Build the segments from the video info cached in
+                the project file and leave opening the video to
+                open_video(). Ignored for files without cached info.
+            **kwargs: Passed to the constructor
+        """
+        if not file_path:
+            raise ValueError("No project file selected")
+
+        with open(file_path, "r", encoding="utf-8") as f:
+            project_data = json.load(f)
+
+        video_path = project_data.get("video_path")
+        output_path = project_data.get("output_path")
+
+        video_info = project_data.get("video_info") if lazy else None
+        instance = cls(
+            video_path=video_path,
+            output_path=output_path,
+            video_info=video_info,
+            **kwargs,
+        )
+        instance.segments = SegmentManager.from_dicts(
+            instance.fps,
+            instance.total_frames,
+            project_data.get("segment_list", []),
+        )
+        instance._file_path = file_path
+        return instance
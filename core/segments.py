@@ -0,0 +1,775 @@
+import bisect
+
+
+class Segment:
+    def __init__(self, fps, segment_id, layer, title, start_frame, end_frame):
+        self.fps = fps
+        self.segment_id = segment_id
+        self.layer = layer
+        self.title = title
+        self.start_frame = start_frame
+        self.end_frame = end_frame
+        self._ui = {}
+
+    def to_dict(self):
+        return {
+            "id": self.segment_id,
+            "layer": self.layer,
+            "title": self.title,
+            "start": self.start_time,
+            "end": self.end_time,
+        }
+
+    @property
+    def duration(self):
+        return (self.end_frame - self.start_frame) / self.fps
+
+    @property
+    def start_time(self):
+        return self.start_frame / self.fps
+
+    @start_time.setter
+    def start_time(self, value):
+        self.start_frame = round(value * self.fps)
+
+    @property
+    def end_time(self):
+        return self.end_frame / self.fps
+
+    @end_time.setter
+    def end_time(self, value):
+        self.end_frame = round(value * self.fps)
+
+    @property
+    def ui(self):
+        return self._ui
+
+    @ui.setter
+    def ui(self, value):
+        self._ui = value
+
+    @ui.deleter
+    def ui(self):
+        self._ui = {}
+
+
+class SegmentManager:
+    def __init__(self, fps, total_frames, items=None):
+        self.fps = fps
+        self.total_frames = total_frames
+        # Adjacency index: (layer, frame) -> segments starting/ending there
+        self._starts_at = {}
+        self._ends_at = {}
+        # Incremented on every change that affects segment ranges or IDs
+        self.version = 0
+        # layer -> (version, frame arrays) cache for seekbar rendering
+        self._frame_arrays = {}
+        self.items = items if items is not None else []
+        self._ui = {}
+
+    @property
+    def items(self):
+        return self._items
+
+    @items.setter
+    def items(self, segments):
+        self._items = segments
+        self._rebuild_adjacency()
+
+    def _rebuild_adjacency(self):
+        """Rebuild the boundary adjacency index from scratch"""
+        self.version += 1
+        self._starts_at = {}
+        self._ends_at = {}
+        for segment in self._items:
+            self._index_segment(segment)
+
+    def _index_segment(self, segment):
+        self._starts_at.setdefault(
+            (segment.layer, segment.start_frame), []
+        ).append(segment)
+        self._ends_at.setdefault(
+            (segment.layer, segment.end_frame), []
+        ).append(segment)
+
+    def _unindex_segment(self, segment):
+        for index, frame in (
+            (self._starts_at, segment.start_frame),
+            (self._ends_at, segment.end_frame),
+        ):
+            key = (segment.layer, frame)
+            bucket = index.get(key)
+            if bucket is None:
+                continue
+            bucket[:] = [s for s in bucket if s is not segment]
+            if not bucket:
+                del index[key]
+
+    def __iter__(self):
+        return iter(self.items)
+
+    def __len__(self):
+        return len(self.items)
+
+    @classmethod
+    def from_dicts(cls, fps, total_frames, dicts):
+        segments = []
+        for d in dicts:
+            segment = Segment(
+                fps=fps,
+                segment_id=d.get("id", d.get("segment_id")),
+                layer=d.get("layer", 1),
+                title=d["title"],
+                start_frame=round(d.get("start", d.get("start_time")) * fps),
+                end_frame=round(d.get("end", d.get("end_time")) * fps),
+            )
+            segments.append(segment)
+        return cls(fps, total_frames, segments)
+
+    def get_max_list_index(self):
+        """Get the maximum ID in the full segment list"""
+        if not self.items:
+            return 0
+        return max(segment.segment_id for segment in self.items)
+
+    def set_items(self, segments):
+        self.items = segments
+
+    def append(self, layer, start_frame, end_frame, title=None):
+        if title is None:
+            title = f"part{len(self.filter_by_layers([layer]))+1:03d}"
+
+        segment = Segment(
+            fps=self.fps,
+            segment_id=self.get_max_list_index() + 1,
+            layer=layer,
+            title=title,
+            start_frame=start_frame,
+            end_frame=end_frame,
+        )
+        self.items.append(segment)
+        self._index_segment(segment)
+        self.version += 1
+
+    def extend_records(self, records):
+        """Append segment records in one batch.
+
+        Args:
+            records (list): (layer, title, start_frame, end_frame) tuples.
+                A title of None gets the default "partNNN" name.
+
+        Returns:
+            list: The new Segment objects
+        """
+        next_id = self.get_max_list_index() + 1
+        layer_counts = {}
+        segments = []
+        for layer, title, start_frame, end_frame in records:
+            if layer not in layer_counts:
+                layer_counts[layer] = len(self.filter_by_layers([layer]))
+            layer_counts[layer] += 1
+            if title is None:
+                title = f"part{layer_counts[layer]:03d}"
+            segments.append(
+                Segment(
+                    fps=self.fps,
+                    segment_id=next_id + len(segments),
+                    layer=layer,
+                    title=title,
+                    start_frame=start_frame,
+                    end_frame=end_frame,
+                )
+            )
+        # Assigning items rebuilds the adjacency index once
+        self.items = self.items + segments
+        return segments
+
+    def generate_chunks(
+        self, chunk_frames, start_frame=0, end_frame=None, keyframes=None
+    ):
+        """Get back-to-back chunk ranges of a fixed length.
+
+        Args:
+            chunk_frames (int): Nominal chunk length in frames
+            start_frame (int): First frame of the first chunk
+            end_frame (int, optional): End of the last chunk. Defaults to
+                the end of the video.
+            keyframes (list, optional): Sorted keyframe positions. When
+                given, every inner boundary snaps to the nearest keyframe.
+
+        Returns:
+            list: (start_frame, end_frame) tuples
+        """
+        if chunk_frames <= 0:
+            raise ValueError("Chunk length must be positive")
+        if end_frame is None:
+            end_frame = self.total_frames
+
+        boundaries = list(
+            range(start_frame + chunk_frames, end_frame, chunk_frames)
+        )
+        if keyframes:
+            snapped = []
+            for boundary in boundaries:
+                i = bisect.bisect_left(keyframes, boundary)
+                candidates = keyframes[max(0, i - 1) : i + 1]
+                nearest = min(candidates, key=lambda k: abs(k - boundary))
+                previous = snapped[-1] if snapped else start_frame
+                if previous < nearest < end_frame:
+                    snapped.append(nearest)
+            boundaries = snapped
+
+        edges = [start_frame] + boundaries + [end_frame]
+        return list(zip(edges[:-1], edges[1:]))
+
+    def add_chunks(
+        self,
+        layer,
+        chunk_frames,
+        start_frame=0,
+        end_frame=None,
+        keyframes=None,
+        replace=False,
+    ):
+        """Fill a layer with back-to-back chunks (see generate_chunks).
+
+        Args:
+            replace (bool): Remove the existing segments of the layer first.
+                Otherwise the chunks are clipped to the free time of the
+                layer, as segments in a layer must not overlap.
+
+        Returns:
+            list: The new Segment objects
+        """
+        ranges = self.generate_chunks(
+            chunk_frames, start_frame, end_frame, keyframes
+        )
+        if replace:
+            self.clear([layer])
+        else:
+            ranges = self.subtract_ranges(
+                ranges, self.get_merged_ranges([layer])
+            )
+        return self.extend_records(
+            [
+                (layer, f"chunk{i+1:03d}", start, end)
+                for i, (start, end) in enumerate(ranges)
+            ]
+        )
+
+    def get_segment_by_id(self, segment_id):
+        """Get the segment by its ID"""
+        for segment in self.items:
+            if segment.segment_id == segment_id:
+                return segment
+        return None
+
+    def get_segment_by_time(
+        self, time_sec, layer, include_start=True, include_end=True
+    ):
+        """Get the segment by time (in seconds)"""
+        for segment in self.items:
+            if segment.layer != layer:
+                continue
+
+            start = segment.start_time
+            end = segment.end_time
+
+            if include_start and include_end:
+                if start <= time_sec <= end:
+                    return segment
+            elif include_start:
+                if start <= time_sec < end:
+                    return segment
+            elif include_end:
+                if start < time_sec <= end:
+                    return segment
+            else:
+                if start < time_sec < end:
+                    return segment
+        return None
+
+    def get_segments_by_time(
+        self, time_sec, layer, include_start=True, include_end=True
+    ):
+        """Get the segment by time (in seconds)"""
+        segments = []
+        for segment in self.items:
+            if segment.layer != layer:
+                continue
+
+            start = segment.start_time
+            end = segment.end_time
+
+            if include_start and include_end:
+                if start <= time_sec <= end:
+                    segments.append(segment)
+            elif include_start:
+                if start <= time_sec < end:
+                    segments.append(segment)
+            elif include_end:
+                if start < time_sec <= end:
+                    segments.append(segment)
+            else:
+                if start < time_sec < end:
+                    segments.append(segment)
+        return segments
+
+    def get_index_by_id(self, segment_id):
+        """Get the index of the segment by its ID"""
+        layer = self.get_segment_by_id(segment_id).layer
+        filtered_segments = self.filter_by_layers([layer])
+        for i, segment in enumerate(filtered_segments):
+            if segment.segment_id == segment_id:
+                return i
+        return None
+
+    def filter_by_layers(self, layers):
+        return [s for s in self.items if s.layer in layers]
+
+    def clear(self, layers=None):
+        if layers is None:
+            self.items = []
+        else:
+            self.items = [
+                segment
+                for segment in self.items
+                if segment.layer not in layers
+            ]
+
+    def remove_segment_by_id(self, segment_id):
+        removed = [s for s in self.items if s.segment_id == segment_id]
+        for segment in removed:
+            self._unindex_segment(segment)
+        self._items = [
+            segment
+            for segment in self.items
+            if segment.segment_id != segment_id
+        ]
+        self.version += 1
+
+    def get_linked_prev_segments(self, segment):
+        """Get the segments in the same layer ending at this segment's start"""
+        return [
+            s
+            for s in self._ends_at.get((segment.layer, segment.start_frame), [])
+            if s is not segment
+        ]
+
+    def get_linked_next_segments(self, segment):
+        """Get the segments in the same layer starting at this segment's end"""
+        return [
+            s
+            for s in self._starts_at.get((segment.layer, segment.end_frame), [])
+            if s is not segment
+        ]
+
+    def set_segment_frames(self, segment, start_frame=None, end_frame=None):
+        """Move the boundaries of a segment and keep the adjacency index"""
+        self.apply_boundary_changes(
+            [
+                (segment, side, frame)
+                for side, frame in (("start", start_frame), ("end", end_frame))
+                if frame is not None
+            ]
+        )
+
+    def apply_boundary_changes(self, changes):
+        """Apply boundary changes as a single batch.
+
+        Args:
+            changes (list): (segment, "start" | "end", frame) tuples
+
+        Returns:
+            list: The segments that were changed, in order of first change
+
+        Raises:
+            ValueError: If any resulting segment would be empty, inverted or
+                out of range. Nothing is changed in that case.
+        """
+        planned = {}
+        for segment, side, frame in changes:
+            if side not in ("start", "end"):
+                raise ValueError('Boundary side must be "start" or "end"')
+            start, end = planned.get(
+                id(segment), (segment.start_frame, segment.end_frame)
+            )
+            if side == "start":
+                start = int(frame)
+            else:
+                end = int(frame)
+            planned[id(segment)] = (start, end)
+
+        changed = []
+        for segment, _, _ in changes:
+            if segment in changed:
+                continue
+            start, end = planned[id(segment)]
+            if start < 0 or end > self.total_frames:
+                raise ValueError("Time out of range")
+            if start >= end:
+                raise ValueError("Start time must be before end time")
+            changed.append(segment)
+
+        for segment in changed:
+            self._unindex_segment(segment)
+            segment.start_frame, segment.end_frame = planned[id(segment)]
+            self._index_segment(segment)
+        self.version += 1
+        return changed
+
+    def move_boundary(self, segment, side, frame, link=False):
+        """Move a segment boundary, optionally dragging linked neighbors.
+
+        Neighbors are looked up in the adjacency index, so each linked
+        segment costs O(1) instead of a scan over the layer.
+
+        Returns:
+            list: The segments that were changed
+        """
+        changes = [(segment, side, frame)]
+        if link:
+            if side == "start":
+                neighbors = self.get_linked_prev_segments(segment)
+                changes += [(s, "end", frame) for s in neighbors]
+            else:
+                neighbors = self.get_linked_next_segments(segment)
+                changes += [(s, "start", frame) for s in neighbors]
+        return self.apply_boundary_changes(changes)
+
+    def get_next_free_time(self, start_time, layer):
+        """Get the next free time after start_time in the selected layer"""
+        segment = self.get_segment_by_time(start_time, layer, True, False)
+
+        if segment is None:
+            if start_time >= self.total_frames / self.fps:
+                return None
+            return start_time
+        else:
+            return self.get_next_free_time(segment.end_time, layer)
+
+    def get_previous_free_time(self, end_time, layer):
+        """Get the previous free time before end_time in the selected layer"""
+        segment = self.get_segment_by_time(end_time, layer, False, True)
+
+        if segment is None:
+            if end_time <= 0:
+                return None
+            return end_time
+        else:
+            return self.get_previous_free_time(segment.start_time, layer)
+
+    def get_next_segment(self, current_segment):
+        """Get the next segment in the same layer"""
+        filtered_segments = sorted(
+            [
+                segment
+                for segment in self.items
+                if segment.layer == current_segment.layer
+                and segment.start_time > current_segment.start_time
+            ],
+            key=lambda x: x.start_time,
+        )
+
+        if len(filtered_segments) > 0:
+            return filtered_segments[0]
+        else:
+            return None
+
+    def get_prev_segment(self, current_segment):
+        """Get the previous segment in the same layer"""
+        filtered_segments = sorted(
+            [
+                segment
+                for segment in self.items
+                if segment.layer == current_segment.layer
+                and segment.end_time < current_segment.end_time
+            ],
+            key=lambda x: x.end_time,
+            reverse=True,
+        )
+
+        if len(filtered_segments) > 0:
+            return filtered_segments[0]
+        else:
+            return None
+
+    def get_next_segment_by_time(self, time, layer):
+        """Get the next segment after the specified time (in seconds)"""
+        same_layer_segments = sorted(
+            [
+                segment
+                for segment in self.items
+                if segment.layer == layer and segment.start_time > time
+            ],
+            key=lambda x: x.start_time,
+        )
+
+        if same_layer_segments:
+            return same_layer_segments[0]
+        return None
+
+    def get_prev_segment_by_time(self, time, layer):
+        """Get the previous segment before the specified time (in seconds)"""
+        same_layer_segments = sorted(
+            [
+                segment
+                for segment in self.items
+                if segment.layer == layer and segment.end_time < time
+            ],
+            key=lambda x: x.start_time,
+            reverse=True,
+        )
+
+        if same_layer_segments:
+            return same_layer_segments[0]
+        return None
+
+    def reset_list_indexes(self):
+        """Reassign IDs to segments based on their order in the full list"""
+        for i, segment in enumerate(self.items):
+            segment.segment_id = i + 1
+        self.version += 1
+
+    def get_segments_before_time(self, time_sec, layer=None):
+        """Get the segments before the specified time (in seconds)"""
+        if layer is None:
+            layer = self.selected_layer
+
+        filtered_segment_list = [
+            segment
+            for segment in self.items
+            if segment.layer == layer and segment.end_time <= time_sec
+        ]
+
+        # Return sorted list
+        return sorted(filtered_segment_list, key=lambda x: x.end_time)
+
+    def get_segments_after_time(self, time_sec, layer=None):
+        """Get the segments after the specified time (in seconds)"""
+        if layer is None:
+            layer = self.selected_layer
+
+        filtered_segment_list = [
+            segment
+            for segment in self.items
+            if segment.layer == layer and segment.start_time >= time_sec
+        ]
+
+        # Return sorted list
+        return sorted(filtered_segment_list, key=lambda x: x.start_time)
+
+    def sort_segments_by_title(self):
+        """Sort segments by their title"""
+        self.items.sort(key=lambda segment: segment.title)
+
+    def sort_segments_by_start_time(self):
+        """Sort segments by their start time"""
+        self.items.sort(key=lambda segment: segment.start_time)
+
+    def reset_indices(self):
+        """Reset segment IDs based on their order in the list"""
+        for index, segment in enumerate(self.items):
+            segment.segment_id = index + 1
+        self.version += 1
+
+    def get_frame_arrays(self, layer):
+        """Get the start frames, end frames and IDs of a layer as arrays.
+
+        The arrays are cached until the segment list changes.
+
+        Returns:
+            tuple: (starts, ends, segment_ids) numpy arrays
+        """
+        import numpy as np
+
+        cached = self._frame_arrays.get(layer)
+        if cached is not None and cached[0] == self.version:
+            return cached[1]
+        segments = self.filter_by_layers([layer])
+        arrays = (
+            np.fromiter(
+                (s.start_frame for s in segments),
+                dtype=np.int64,
+                count=len(segments),
+            ),
+            np.fromiter(
+                (s.end_frame for s in segments),
+                dtype=np.int64,
+                count=len(segments),
+            ),
+            np.fromiter(
+                (s.segment_id for s in segments),
+                dtype=np.int64,
+                count=len(segments),
+            ),
+        )
+        self._frame_arrays[layer] = (self.version, arrays)
+        return arrays
+
+    @staticmethod
+    def get_coverage_runs(starts, ends, visible_start, visible_end, columns):
+        """Bin ranges into pixel columns and merge the covered columns.
+
+        Every range covers at least one column, so short segments stay
+        visible when zoomed out.
+
+        Args:
+            starts (numpy.ndarray): Start frames
+            ends (numpy.ndarray): End frames
+            visible_start (float): First visible frame
+            visible_end (float): Last visible frame
+            columns (int): Number of pixel columns
+
+        Returns:
+            list: (first_column, end_column) tuples of covered runs
+        """
+        import numpy as np
+
+        visible = (ends >= visible_start) & (starts <= visible_end)
+        starts, ends = starts[visible], ends[visible]
+        if columns <= 0 or visible_end <= visible_start or len(starts) == 0:
+            return []
+        frames_per_column = (visible_end - visible_start) / columns
+        first = np.floor((starts - visible_start) / frames_per_column)
+        last = np.ceil((ends - visible_start) / frames_per_column)
+        first = np.clip(first, 0, columns - 1).astype(np.int64)
+        last = np.clip(last, first + 1, columns).astype(np.int64)
+
+        coverage = np.zeros(columns + 1, dtype=np.int64)
+        np.add.at(coverage, first, 1)
+        np.add.at(coverage, last, -1)
+        covered = np.cumsum(coverage[:-1]) > 0
+
+        edges = np.diff(np.concatenate(([0], covered.astype(np.int8), [0])))
+        run_starts = np.flatnonzero(edges == 1)
+        run_ends = np.flatnonzero(edges == -1)
+        return list(zip(run_starts.tolist(), run_ends.tolist()))
+
+    def get_merged_ranges(self, layers):
+        """Get the union of the segments in the layers as frame ranges.
+
+        Args:
+            layers (list): Layers to merge
+
+        Returns:
+            list: Sorted, non-overlapping (start_frame, end_frame) tuples
+        """
+        ranges = sorted(
+            (segment.start_frame, segment.end_frame)
+            for segment in self.items
+            if segment.layer in layers
+        )
+        merged = []
+        for start, end in ranges:
+            if merged and start <= merged[-1][1]:
+                if end > merged[-1][1]:
+                    merged[-1] = (merged[-1][0], end)
+            else:
+                merged.append((start, end))
+        return merged
+
+    @staticmethod
+    def intersect_ranges(ranges_a, ranges_b):
+        """Intersect two sorted, non-overlapping range lists in one sweep"""
+        result = []
+        i = j = 0
+        while i < len(ranges_a) and j < len(ranges_b):
+            start = max(ranges_a[i][0], ranges_b[j][0])
+            end = min(ranges_a[i][1], ranges_b[j][1])
+            if start < end:
+                result.append((start, end))
+            if ranges_a[i][1] < ranges_b[j][1]:
+                i += 1
+            else:
+                j += 1
+        return result
+
+    @staticmethod
+    def subtract_ranges(ranges_a, ranges_b):
+        """Subtract ranges_b from ranges_a (both sorted, non-overlapping)"""
+        result = []
+        j = 0
+        for start, end in ranges_a:
+            while j < len(ranges_b) and ranges_b[j][1] <= start:
+                j += 1
+            k = j
+            while k < len(ranges_b) and ranges_b[k][0] < end:
+                if ranges_b[k][0] > start:
+                    result.append((start, ranges_b[k][0]))
+                start = max(start, ranges_b[k][1])
+                k += 1
+            if start < end:
+                result.append((start, end))
+        return result
+
+    def union_layers(self, layers):
+        """Get the merged ranges covered by any of the layers"""
+        return self.get_merged_ranges(layers)
+
+    def intersect_layers(self, layers):
+        """Get the merged ranges covered by all of the layers"""
+        if not layers:
+            return []
+        result = self.get_merged_ranges([layers[0]])
+        for layer in layers[1:]:
+            result = self.intersect_ranges(
+                result, self.get_merged_ranges([layer])
+            )
+        return result
+
+    def subtract_layers(self, layers, subtract_layers):
+        """Get the merged ranges of layers not covered by subtract_layers"""
+        return self.subtract_ranges(
+            self.get_merged_ranges(layers),
+            self.get_merged_ranges(subtract_layers),
+        )
+
+    def derive_layer(self, operation, layers, subtract_layers=None):
+        """Build a derived layer from a boolean operation on layers.
+
+        The derived segments are not added to the manager. Their layer is a
+        label describing the operation (e.g. "1+2", "1&2" or "1-(2+3)"),
+        which is used in the exported file names.
+
+        Args:
+            operation (str): "union", "intersection" or "difference"
+            layers (list): Source layers
+            subtract_layers (list, optional): Layers removed by "difference"
+
+        Returns:
+            list: Segment objects covering the merged ranges
+        """
+
+        def group(source):
+            label = "+".join(str(layer) for layer in source)
+            return f"({label})" if len(source) > 1 else label
+
+        if operation == "union":
+            ranges = self.union_layers(layers)
+            label = "+".join(str(layer) for layer in layers)
+        elif operation == "intersection":
+            ranges = self.intersect_layers(layers)
+            label = "&".join(str(layer) for layer in layers)
+        elif operation == "difference":
+            subtract_layers = subtract_layers or []
+            ranges = self.subtract_layers(layers, subtract_layers)
+            # Both sides are grouped, so [1, 2] - [3] and [1] - [2, 3]
+            # get different labels
+            label = group(layers)
+            if subtract_layers:
+                label += "-" + group(subtract_layers)
+        else:
+            raise ValueError(f"Unknown layer operation: {operation}")
+
+        return [
+            Segment(
+                fps=self.fps,
+                segment_id=i + 1,
+                layer=label,
+                title=f"{operation}{i+1:03d}",
+                start_frame=start,
+                end_frame=end,
+            )
+            for i, (start, end) in enumerate(ranges)
+        ]
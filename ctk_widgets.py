@@ -1,5 +1,6 @@
 import tkinter as tk
 import customtkinter as ctk
+from PIL import Image, ImageTk
 
 
 class CTkSpinbox(ctk.CTkFrame):
@@ -112,3 +113,237 @@ class CTkSpinbox(ctk.CTkFrame):
     def get(self):
         """Alias for get_value()"""
         return self.get_value()
+
+
+class CTkVirtualList(ctk.CTkFrame):
+    """Scrollable list that only creates widgets for the visible rows.
+
+    Row widgets are created once by create_row(parent) and recycled while
+    scrolling: bind_row(row, item) fills a row with an item, and
+    unbind_row(row) (optional) is called before a row is reused or hidden.
+    Rows should be row_height high.
+    """
+
+    def __init__(
+        self,
+        master,
+        row_height,
+        create_row,
+        bind_row,
+        unbind_row=None,
+        **kwargs,
+    ):
+        super().__init__(master, **kwargs)
+
+        self.row_height = row_height
+        self.create_row = create_row
+        self.bind_row = bind_row
+        self.unbind_row = unbind_row
+
+        self.items = []
+        self.first_index = 0
+        self.rows = []  # Recycled row widgets
+        self.row_items = []  # Item bound to each row (or None)
+        self._rendering = False
+
+        self.body = ctk.CTkFrame(self, fg_color="transparent")
+        self.body.grid(row=0, column=0, sticky="nsew")
+        self.scrollbar = ctk.CTkScrollbar(self, command=self._on_scrollbar)
+        self.scrollbar.grid(row=0, column=1, sticky="ns")
+        self.grid_rowconfigure(0, weight=1)
+        self.grid_columnconfigure(0, weight=1)
+
+        self.body.bind("<Configure>", lambda event: self._render())
+        self.bind_all("<MouseWheel>", self._on_mouse_wheel, add="+")
+        self.bind_all("<Button-4>", self._on_mouse_wheel, add="+")
+        self.bind_all("<Button-5>", self._on_mouse_wheel, add="+")
+
+    def visible_count(self):
+        """Number of rows that fit in the list"""
+        # winfo_height() is in physical pixels, row_height in CTk units
+        row_height = self._apply_widget_scaling(self.row_height)
+        height = self.body.winfo_height()
+        if height <= 1:
+            height = row_height * 10
+        return max(1, int(height // row_height))
+
+    def set_items(self, items):
+        """Replace all items; only the visible rows are rebound"""
+        self.items = list(items)
+        self._render(force=True)
+
+    def append(self, item):
+        """Append an item and scroll it into view"""
+        self.items.append(item)
+        self.see(len(self.items) - 1)
+
+    def refresh_item(self, item):
+        """Rebind the row showing item, if it is visible"""
+        if self._rendering:
+            return
+        for row, bound_item in zip(self.rows, self.row_items):
+            if bound_item is item:
+                self.bind_row(row, item)
+
+    def refresh(self):
+        """Rebind all visible rows in place"""
+        self._render(force=True)
+
+    def see(self, index):
+        """Scroll so that the item at index is visible"""
+        count = self.visible_count()
+        if index < self.first_index:
+            self.first_index = index
+        elif index >= self.first_index + count:
+            self.first_index = index - count + 1
+        self._render()
+
+    def yview(self, *args):
+        """Scroll like a Tk widget: ("moveto", f) or ("scroll", n, what)"""
+        count = self.visible_count()
+        max_first = max(0, len(self.items) - count)
+        if args[0] == "moveto":
+            first = round(float(args[1]) * len(self.items))
+        elif args[0] == "scroll":
+            step = count if args[2] == "pages" else 1
+            first = self.first_index + int(args[1]) * step
+        else:
+            return
+        self.first_index = max(0, min(first, max_first))
+        self._render()
+
+    def _on_scrollbar(self, *args):
+        self.yview(*args)
+
+    def _on_mouse_wheel(self, event):
+        if not str(event.widget).startswith(str(self)):
+            return
+        if event.num == 4:
+            direction = -1
+        elif event.num == 5:
+            direction = 1
+        else:
+            direction = -1 if event.delta > 0 else 1
+        self.yview("scroll", direction * 3, "units")
+
+    def _render(self, force=False):
+        count = self.visible_count()
+        max_first = max(0, len(self.items) - count)
+        self.first_index = max(0, min(self.first_index, max_first))
+
+        self._rendering = True
+        try:
+            while len(self.rows) < count:
+                self.rows.append(self.create_row(self.body))
+                self.row_items.append(None)
+
+            for i, row in enumerate(self.rows):
+                index = self.first_index + i
+                item = self.items[index] if index < len(self.items) else None
+                if i >= count:
+                    item = None
+
+                if item is None:
+                    if self.row_items[i] is not None:
+                        if self.unbind_row:
+                            self.unbind_row(row)
+                        self.row_items[i] = None
+                    row.place_forget()
+                    continue
+
+                if self.row_items[i] is not item:
+                    if self.row_items[i] is not None and self.unbind_row:
+                        self.unbind_row(row)
+                    self.row_items[i] = item
+                    self.bind_row(row, item)
+                elif force:
+                    self.bind_row(row, item)
+                row.place(x=0, y=i * self.row_height, relwidth=1)
+        finally:
+            self._rendering = False
+
+        if self.items:
+            first = self.first_index / len(self.items)
+            last = min(1.0, (self.first_index + count) / len(self.items))
+        else:
+            first, last = 0.0, 1.0
+        self.scrollbar.set(first, last)
+
+
+class CTkFrameView(ctk.CTkFrame):
+    """Video frame display that reuses one PhotoImage.
+
+    BGR frames are resized into a preallocated buffer, converted to RGB in
+    a second buffer and pasted into a PhotoImage sized to fit the view, so
+    steady playback allocates no new images. The buffers and the
+    PhotoImage are only recreated when the fitted size changes.
+    """
+
+    def __init__(self, master, text="", **kwargs):
+        super().__init__(master, **kwargs)
+
+        self.frame = None  # Last shown BGR frame
+        self._photo = None
+        self._resized = None
+        self._rgb = None
+
+        self.text_label = ctk.CTkLabel(self, text=text)
+        self.text_label.pack(expand=True, fill="both")
+        self.image_label = tk.Label(self, borderwidth=0, highlightthickness=0)
+        self._update_image_background()
+
+        self.bind("<Configure>", self._on_configure)
+
+    def _update_image_background(self):
+        color = self.cget("fg_color")
+        if color == "transparent":
+            color = self.cget("bg_color")
+        self.image_label.configure(
+            background=self._apply_appearance_mode(color)
+        )
+
+    def _set_appearance_mode(self, mode_string):
+        super()._set_appearance_mode(mode_string)
+        self._update_image_background()
+
+    def fit_size(self, width, height):
+        """Size of a width x height frame scaled to fit the view"""
+        view_width = self.winfo_width()
+        view_height = self.winfo_height()
+        if view_width <= 1 or view_height <= 1:
+            view_width = self._apply_widget_scaling(1000)
+            view_height = self._apply_widget_scaling(600)
+        scale = min(view_width / width, view_height / height)
+        return max(1, round(width * scale)), max(1, round(height * scale))
+
+    def show(self, frame):
+        """Display a BGR frame"""
+        import cv2
+        import numpy as np
+
+        self.frame = frame
+        h, w = frame.shape[:2]
+        new_w, new_h = self.fit_size(w, h)
+
+        if self._photo is None or self._rgb.shape[:2] != (new_h, new_w):
+            self._resized = np.empty((new_h, new_w, 3), dtype=np.uint8)
+            self._rgb = np.empty((new_h, new_w, 3), dtype=np.uint8)
+            self._photo = ImageTk.PhotoImage("RGB", (new_w, new_h))
+            self.image_label.configure(image=self._photo)
+
+        if self.text_label.winfo_manager():
+            self.text_label.pack_forget()
+            self.image_label.place(relx=0.5, rely=0.5, anchor="center")
+
+        # Shrink before converting so fewer pixels go through cvtColor
+        cv2.resize(frame, (new_w, new_h), dst=self._resized)
+        cv2.cvtColor(self._resized, cv2.COLOR_BGR2RGB, dst=self._rgb)
+        self._photo.paste(
+            Image.frombuffer(
+                "RGB", (new_w, new_h), self._rgb, "raw", "RGB", 0, 1
+            )
+        )
+
+    def _on_configure(self, event):
+        if self.frame is not None:
+            self.show(self.frame)
@@ -0,0 +1,332 @@
+import bisect
+import collections
+import os
+import time
+from pathlib import Path
+
+import video_utils
+
+index_cache_dir = Path.home() / ".cache" / "video_splitter" / "index"
+
+
+class FrameIndex:
+    """
+    Keyframe positions and per-frame timestamps of a video.
+    Built once from a packet scan and persisted as a sidecar keyed by the
+    video fingerprint.
+    """
+
+    def __init__(self, keyframes, timestamps):
+        import numpy as np
+
+        self.keyframes = [int(k) for k in keyframes]
+        self.timestamps = np.asarray(timestamps, dtype=np.float64)
+        if not self.keyframes or self.keyframes[0] != 0:
+            # Decoding always starts at the first frame
+            self.keyframes.insert(0, 0)
+
+    @property
+    def total_frames(self):
+        return len(self.timestamps)
+
+    @property
+    def gop_length(self):
+        """Longest distance between keyframes (and to the end)"""
+        bounds = self.keyframes + [self.total_frames]
+        return max(b - a for a, b in zip(bounds, bounds[1:]))
+
+    def keyframe_before(self, frame):
+        """Last keyframe at or before frame"""
+        return self.keyframes[bisect.bisect_right(self.keyframes, frame) - 1]
+
+    def keyframe_after(self, frame):
+        """First keyframe after frame, or None"""
+        index = bisect.bisect_right(self.keyframes, frame)
+        return self.keyframes[index] if index < len(self.keyframes) else None
+
+    def frame_at_time(self, time_msec):
+        """Frame shown at time_msec"""
+        import numpy as np
+
+        index = int(np.searchsorted(self.timestamps, time_msec, "right")) - 1
+        return max(0, min(index, self.total_frames - 1))
+
+    def save(self, path):
+        import numpy as np
+
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(path, "wb") as f:
+            np.savez(
+                f,
+                keyframes=np.asarray(self.keyframes, dtype=np.int64),
+                timestamps=self.timestamps,
+            )
+
+    @classmethod
+    def load(cls, path):
+        import numpy as np
+
+        with np.load(path) as data:
+            return cls(data["keyframes"], data["timestamps"])
+
+    @classmethod
+    def for_video(cls, video_path, cache_dir=None, cancel_event=None):
+        """
+        Load the index of a video from its sidecar, scanning it first if
+        there is none.
+        Args:
+            video_path (str): Path to the video
+            cache_dir (str, optional): Sidecar directory
+            cancel_event (threading.Event, optional): Set to stop the scan
+        Returns:
+            FrameIndex: The index, or None if the packets cannot be read
+        """
+        if cache_dir is None:
+            cache_dir = index_cache_dir
+        path = Path(cache_dir) / (
+            video_utils.video_fingerprint(video_path) + ".npz"
+        )
+        if path.exists():
+            try:
+                return cls.load(path)
+            except (OSError, ValueError, KeyError):
+                pass  # Rebuild a damaged sidecar
+
+        packets = video_utils.scan_packets(video_path, cancel_event)
+        if packets is None or not packets[1]:
+            return None
+        index = cls(*packets)
+        index.save(str(path))
+        return index
+
+
+class SeekPlanner:
+    """
+    Choose how to reach a frame from costs measured on this video.
+    The cost of a grab() and of a container seek are tracked as moving
+    averages. A target behind the current position, or one that would be
+    cheaper to reach from its keyframe, is sought; anything else is
+    grabbed forward. A hop that does not cross a keyframe is always
+    grabbed, because a seek would decode the same frames again. Decisions
+    are kept for diagnostics.
+    """
+
+    default_grab_cost = 0.005
+    default_seek_cost = 0.05
+    smoothing = 0.2
+
+    def __init__(self, history=256):
+        self.grab_cost = self.default_grab_cost
+        self.seek_cost = self.default_seek_cost
+        # (frame, action, position) of the latest requests
+        self.decisions = collections.deque(maxlen=history)
+        self.counts = collections.Counter()
+
+    def plan(self, frame, position, keyframe=None):
+        """
+        Args:
+            frame (int): Target frame
+            position (int | None): Frame the capture reads next
+            keyframe (int, optional): Keyframe before the target, if known
+        Returns:
+            str: "grab" or "seek"
+        """
+        action = (
+            "grab" if self.prefers_grab(frame, position, keyframe) else "seek"
+        )
+        self.record_decision(frame, action, position)
+        return action
+
+    def prefers_grab(self, frame, position, keyframe=None):
+        """Whether grabbing forward from position beats seeking to frame"""
+        if position is None or position > frame:
+            return False
+        if keyframe is not None and position >= keyframe:
+            return True
+        grab = (frame - position) * self.grab_cost
+        seek = self.seek_cost
+        if keyframe is not None:
+            seek += (frame - keyframe) * self.grab_cost
+        return grab <= seek
+
+    def record_decision(self, frame, action, position=None):
+        self.decisions.append((frame, action, position))
+        self.counts[action] += 1
+
+    def record_grab(self, count, seconds):
+        if count > 0:
+            self.grab_cost += self.smoothing * (
+                seconds / count - self.grab_cost
+            )
+
+    def record_seek(self, seconds):
+        self.seek_cost += self.smoothing * (seconds - self.seek_cost)
+
+    def summary(self):
+        """Decision counts and current cost estimates"""
+        return {
+            "counts": dict(self.counts),
+            "grab_cost": self.grab_cost,
+            "seek_cost": self.seek_cost,
+        }
+
+
+class FrameReader:
+    """
+    Read frames by number from a capture.
+    A SeekPlanner decides between grabbing forward and seeking. With a
+    FrameIndex, a seek goes to the keyframe before the target and grabs
+    forward, which is exact and bounded by the GOP length. Without an
+    index it falls back to CAP_PROP_POS_FRAMES.
+    """
+
+    def __init__(self, cap, index=None, position=0, planner=None):
+        self.cap = cap
+        self.index = index
+        self.planner = planner if planner is not None else SeekPlanner()
+        # Frame the next cap.read() returns, None if unknown
+        self.position = position
+        # False if the last fallback seek did not land on its target
+        self.last_seek_exact = True
+
+    def record_cache_hit(self, frame):
+        """Note a frame served from a cache without touching the capture"""
+        self.planner.record_decision(frame, "cache", self.position)
+
+    def seek(self, frame):
+        import cv2
+
+        self.last_seek_exact = True
+        if self.position == frame:
+            return
+
+        keyframe = (
+            self.index.keyframe_before(frame)
+            if self.index is not None
+            else None
+        )
+        if self.planner.plan(frame, self.position, keyframe) == "seek":
+            target = keyframe if keyframe is not None else frame
+            start = time.perf_counter()
+            self.cap.set(cv2.CAP_PROP_POS_FRAMES, target)
+            self.planner.record_seek(time.perf_counter() - start)
+            if keyframe is None:
+                self.last_seek_exact = (
+                    self.cap.get(cv2.CAP_PROP_POS_FRAMES) == frame
+                )
+                self.position = frame if self.last_seek_exact else None
+                return
+            self.position = keyframe
+
+        count = frame - self.position
+        start = time.perf_counter()
+        for _ in range(count):
+            if not self.cap.grab():
+                self.position = None
+                return
+        self.planner.record_grab(count, time.perf_counter() - start)
+        self.position = frame
+
+    def read(self, frame):
+        """
+        Read a frame.
+        Returns:
+            tuple: (ret, image) like cv2.VideoCapture.read()
+        """
+        self.seek(frame)
+        ret, image = self.cap.read()
+        self.position = frame + 1 if ret else None
+        return ret, image
+
+
+class ReaderPool:
+    """
+    A few FrameReaders over the same video sharing one planner and index.
+    A request goes to the handle whose position is the nearest at or
+    before the target if grabbing forward from there beats a seek, so
+    toggling between two distant frames costs two short forward decodes
+    instead of two seeks.
+    Otherwise a new handle is opened while below the limit, or the least
+    recently used handle is sought.
+    """
+
+    def __init__(self, open_capture, limit=3, index=None, cap=None):
+        """
+        Args:
+            open_capture (callable): Returns a new capture of the video
+            limit (int): Maximum number of open handles
+            index (FrameIndex, optional): Keyframe index of the video
+            cap (cv2.VideoCapture, optional): Already open first handle
+        """
+        self.open_capture = open_capture
+        self.limit = limit
+        self.planner = SeekPlanner()
+        self._index = index
+        # The handle passed in stays open; its owner may still query it
+        self._cap = cap
+        # Least recently used first
+        self.readers = []
+        if cap is not None:
+            self.readers.append(self._new_reader(cap))
+
+    @property
+    def index(self):
+        return self._index
+
+    @index.setter
+    def index(self, index):
+        self._index = index
+        for reader in self.readers:
+            reader.index = index
+
+    def _new_reader(self, cap):
+        return FrameReader(cap, self._index, planner=self.planner)
+
+    def record_cache_hit(self, frame):
+        """Note a frame served from a cache without touching a capture"""
+        self.planner.record_decision(frame, "cache")
+
+    def acquire(self, frame):
+        """
+        Pick the handle to read frame with.
+        Returns:
+            FrameReader: The reader, most recently used from now on
+        """
+        for reader in list(self.readers):
+            if len(self.readers) <= max(1, self.limit):
+                break
+            if reader.cap is not self._cap:
+                self.readers.remove(reader)
+                reader.cap.release()
+
+        keyframe = (
+            self._index.keyframe_before(frame)
+            if self._index is not None
+            else None
+        )
+        behind = [
+            reader
+            for reader in self.readers
+            if reader.position is not None and reader.position <= frame
+        ]
+        reader = max(behind, key=lambda r: r.position, default=None)
+        if reader is None or not self.planner.prefers_grab(
+            frame, reader.position, keyframe
+        ):
+            if len(self.readers) < max(1, self.limit):
+                reader = self._new_reader(self.open_capture())
+            else:
+                reader = self.readers.pop(0)
+        else:
+            self.readers.remove(reader)
+        self.readers.append(reader)
+        return reader
+
+    def read(self, frame):
+        """Read a frame like FrameReader.read() with the nearest handle"""
+        return self.acquire(frame).read(frame)
+
+    def release(self):
+        for reader in self.readers:
+            reader.cap.release()
+        self.readers = []
@@ -0,0 +1,141 @@
+import json
+import os
+from pathlib import Path
+
+import video_utils
+
+frame_store_dir = Path.home() / ".cache" / "video_splitter" / "frames"
+
+
+class FrameStore:
+    """
+    Downscaled BGR frames of a whole video in a memory-mapped raw file.
+    Every frame has the same stride, so any decoded frame is a zero-copy
+    slice of the map. Frames are decoded in order, and the number of
+    decoded frames is kept in a JSON sidecar so an interrupted build
+    resumes where it stopped.
+    """
+
+    def __init__(self, path, total_frames, width, height):
+        import numpy as np
+
+        self.path = str(path)
+        self.total_frames = total_frames
+        self.width = width
+        self.height = height
+        self.decoded = 0
+
+        shape = (total_frames, height, width, 3)
+        meta = self._read_meta()
+        if (
+            meta is not None
+            and meta.get("shape") == list(shape)
+            and os.path.exists(self.path)
+        ):
+            mode = "r+"
+            self.decoded = meta.get("decoded", 0)
+        else:
+            mode = "w+"
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        self.frames = np.memmap(
+            self.path, dtype=np.uint8, mode=mode, shape=shape
+        )
+
+    @classmethod
+    def for_video(cls, video_path, total_frames, frame_size, height=360):
+        """
+        Open the store of a video in the frame store directory.
+        Args:
+            video_path (str): Path to the video (used for the fingerprint)
+            total_frames (int): Total number of frames
+            frame_size (tuple): (width, height) of the video
+            height (int): Height of the stored frames
+        """
+        width = max(2, round(frame_size[0] * height / frame_size[1]) // 2 * 2)
+        fingerprint = video_utils.video_fingerprint(video_path)
+        path = frame_store_dir / f"{fingerprint}_{height}p.raw"
+        return cls(path, total_frames, width, height)
+
+    @property
+    def meta_path(self):
+        return self.path + ".json"
+
+    @property
+    def complete(self):
+        return self.decoded >= self.total_frames
+
+    def _read_meta(self):
+        try:
+            with open(self.meta_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _write_meta(self):
+        with open(self.meta_path, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "shape": list(self.frames.shape),
+                    "decoded": self.decoded,
+                },
+                f,
+            )
+
+    def get(self, frame):
+        """Get a decoded frame as a view into the map, or None"""
+        if 0 <= frame < self.decoded:
+            return self.frames[frame]
+        return None
+
+    def build(
+        self,
+        video_path,
+        backend="opencv",
+        progress_callback=None,
+        cancel_event=None,
+        flush_interval=300,
+    ):
+        """
+        Decode the remaining frames sequentially into the map.
+        Args:
+            video_path (str): Video to decode (same frames as the source)
+            backend (str): Video backend
+            progress_callback (callable, optional): Called with
+                (decoded, total_frames) after every flush
+            cancel_event (threading.Event, optional): Set to stop early
+            flush_interval (int): Frames between flushes of the map
+        Returns:
+            bool: True if every frame has been decoded
+        """
+        import cv2
+
+        if self.complete:
+            return True
+
+        cap = video_utils.open_capture(video_path, backend)
+        if self.decoded > 0:
+            cap.set(cv2.CAP_PROP_POS_FRAMES, self.decoded)
+        try:
+            while not self.complete:
+                if cancel_event is not None and cancel_event.is_set():
+                    break
+                ret, frame = cap.read()
+                if not ret:
+                    break
+                cv2.resize(
+                    frame,
+                    (self.width, self.height),
+                    dst=self.frames[self.decoded],
+                    interpolation=cv2.INTER_AREA,
+                )
+                self.decoded += 1
+                if self.decoded % flush_interval == 0 or self.complete:
+                    self.frames.flush()
+                    self._write_meta()
+                    if progress_callback is not None:
+                        progress_callback(self.decoded, self.total_frames)
+        finally:
+            cap.release()
+            self.frames.flush()
+            self._write_meta()
+        return self.complete
@@ -141,6 +141,47 @@ translations = {
         "No video loaded to edit segments.": "No video loaded to edit segments.",
         "Clear cache": "Clear cache",
         "Video cache cleared.": "Video cache cleared.",
+        "Time out of range": "Time out of range",
+        "Boundary side must be \"start\" or \"end\"": "Boundary side must be \"start\" or \"end\"",
+        "Export": "Export",
+        "Segments": "Segments",
+        "Union": "Union",
+        "Intersection": "Intersection",
+        "Difference": "Difference",
+        "Import Segments": "Import Segments",
+        "Cue list": "Cue list",
+        "Segment import failed": "Segment import failed",
+        "[invalid] rows are out of range and [overlap] rows overlap.": "[invalid] rows are out of range and [overlap] rows overlap.",
+        "Import the remaining rows?": "Import the remaining rows?",
+        "[n] segments imported.": "[n] segments imported.",
+        "Split into Chunks": "Split into Chunks",
+        "Chunk length": "Chunk length",
+        "seconds": "seconds",
+        "frames": "frames",
+        "Align to keyframes": "Align to keyframes",
+        "Replace segments in the layer": "Replace segments in the layer",
+        "Chunk length must be positive": "Chunk length must be positive",
+        "Chunks": "Chunks",
+        "Scanning keyframes": "Scanning keyframes",
+        "Keyframes not available. Chunks are not aligned.": "Keyframes not available. Chunks are not aligned.",
+        "[n] chunks added.": "[n] chunks added.",
+        "Filmstrip": "Filmstrip",
+        "Proxy video for editing": "Proxy video for editing",
+        "Off": "Off",
+        "Creating proxy video": "Creating proxy video",
+        "Using proxy video for preview": "Using proxy video for preview",
+        "Failed to create proxy video": "Failed to create proxy video",
+        "Decode whole video to disk": "Decode whole video to disk",
+        "Decoding frames to disk": "Decoding frames to disk",
+        "Decoder handles": "Decoder handles",
+        "Opening video...": "Opening video...",
+        "Codec benchmark": "Codec benchmark",
+        "Run": "Run",
+        "Benchmarking codecs...": "Benchmarking codecs...",
+        "Not measured yet": "Not measured yet",
+        "Layers (e.g. 1,2)": "Layers (e.g. 1,2)",
+        "Invalid layer: [layer]": "Invalid layer: [layer]",
+        "Replace the [n] segments in layer [layer]?": "Replace the [n] segments in layer [layer]?",
     },
     "ja": {
         "Select video file": "動画ファイルを選択",
@@ -278,5 +319,46 @@ translations = {
         "No video loaded to edit segments.": "編集するセグメントの動画が読み込まれていません",
         "Clear cache": "キャッシュをクリア",
         "Video cache cleared.": "ビデオキャッシュをクリアしました",
+        "Time out of range": "時間が範囲外です",
+        "Boundary side must be \"start\" or \"end\"": "境界は \"start\" または \"end\" で指定してください",
+        "Export": "出力対象",
+        "Segments": "セグメント",
+        "Union": "和集合",
+        "Intersection": "積集合",
+        "Difference": "差集合",
+        "Import Segments": "セグメント読み込み",
+        "Cue list": "キューリスト",
+        "Segment import failed": "セグメントの読み込みに失敗しました",
+        "[invalid] rows are out of range and [overlap] rows overlap.": "[invalid] 行が範囲外、[overlap] 行が重複しています。",
+        "Import the remaining rows?": "残りの行を読み込みますか？",
+        "[n] segments imported.": "[n] 個のセグメントを読み込みました。",
+        "Split into Chunks": "チャンク分割",
+        "Chunk length": "チャンク長",
+        "seconds": "秒",
+        "frames": "フレーム",
+        "Align to keyframes": "キーフレームに揃える",
+        "Replace segments in the layer": "レイヤーの既存セグメントを置き換える",
+        "Chunk length must be positive": "チャンク長は正の値を指定してください",
+        "Chunks": "チャンク",
+        "Scanning keyframes": "キーフレームを走査中",
+        "Keyframes not available. Chunks are not aligned.": "キーフレームを取得できません。チャンクは揃えられていません。",
+        "[n] chunks added.": "[n] 個のチャンクを追加しました。",
+        "Filmstrip": "フィルムストリップ",
+        "Proxy video for editing": "編集用プロキシ動画",
+        "Off": "オフ",
+        "Creating proxy video": "プロキシ動画を作成中",
+        "Using proxy video for preview": "プレビューにプロキシ動画を使用中",
+        "Failed to create proxy video": "プロキシ動画の作成に失敗しました",
+        "Decode whole video to disk": "動画全体をディスクにデコード",
+        "Decoding frames to disk": "フレームをディスクにデコード中",
+        "Decoder handles": "デコーダーのハンドル数",
+        "Opening video...": "動画を開いています...",
+        "Codec benchmark": "コーデックのベンチマーク",
+        "Run": "実行",
+        "Benchmarking codecs...": "コーデックを計測しています...",
+        "Not measured yet": "未計測",
+        "Layers (e.g. 1,2)": "レイヤー (例: 1,2)",
+        "Invalid layer: [layer]": "無効なレイヤー: [layer]",
+        "Replace the [n] segments in layer [layer]?": "レイヤー [layer] の [n] 個のセグメントを置き換えますか？",
     },
 }
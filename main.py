@@ -4,15 +4,24 @@ from pathlib import Path
 import re
 import tkinter as tk
 import customtkinter as ctk
-from ctk_widgets import CTkSpinbox
+from ctk_widgets import CTkFrameView, CTkSpinbox, CTkVirtualList
 from tkinter import filedialog, messagebox
-import cv2
+import decoder
+import playback
 import video_utils
-from PIL import Image
+from PIL import Image, ImageTk
 import threading
+import traceback
 import os
 import json
 import configparser
+import core
+
+# Re-exported so that main.Segment etc. keep working
+from core import Segment, SegmentManager
+import frame_store
+import segment_import
+import thumbnails
 import utils
 
 config = configparser.ConfigParser()
@@ -58,373 +67,19 @@ class CustomCTkInputDialog(ctk.CTkInputDialog):
                 input_var.set(self._initialvalue)
 
 
-class Segment:
-    def __init__(self, fps, segment_id, layer, title, start_frame, end_frame):
-        self.fps = fps
-        self.segment_id = segment_id
-        self.layer = layer
-        self.title = title
-        self.start_frame = start_frame
-        self.end_frame = end_frame
-        self._ui = {}
-
-    def to_dict(self):
-        return {
-            "id": self.segment_id,
-            "layer": self.layer,
-            "title": self.title,
-            "start": self.start_time,
-            "end": self.end_time,
-        }
-
-    @property
-    def duration(self):
-        return (self.end_frame - self.start_frame) / self.fps
-
-    @property
-    def start_time(self):
-        return self.start_frame / self.fps
-
-    @start_time.setter
-    def start_time(self, value):
-        self.start_frame = round(value * self.fps)
-
-    @property
-    def end_time(self):
-        return self.end_frame / self.fps
-
-    @end_time.setter
-    def end_time(self, value):
-        self.end_frame = round(value * self.fps)
-
-    @property
-    def ui(self):
-        return self._ui
-
-    @ui.setter
-    def ui(self, value):
-        self._ui = value
-
-    @ui.deleter
-    def ui(self):
-        self._ui = {}
-
-
-class SegmentManager:
-    def __init__(self, fps, total_frames, items=None):
-        self.fps = fps
-        self.total_frames = total_frames
-        self.items = items if items is not None else []
-        self._ui = {}
-
-    def __iter__(self):
-        return iter(self.items)
-
-    def __len__(self):
-        return len(self.items)
-
-    @classmethod
-    def from_dicts(cls, fps, total_frames, dicts):
-        segments = []
-        for d in dicts:
-            segment = Segment(
-                fps=fps,
-                segment_id=d.get("id", d.get("segment_id")),
-                layer=d.get("layer", 1),
-                title=d["title"],
-                start_frame=round(d.get("start", d.get("start_time")) * fps),
-                end_frame=round(d.get("end", d.get("end_time")) * fps),
-            )
-            segments.append(segment)
-        return cls(fps, total_frames, segments)
-
-    def get_max_list_index(self):
-        """Get the maximum ID in the full segment list"""
-        if not self.items:
-            return 0
-        return max(segment.segment_id for segment in self.items)
-
-    def set_items(self, segments):
-        self.items = segments
-
-    def append(self, layer, start_frame, end_frame, title=None):
-        if title is None:
-            title = f"part{len(self.filter_by_layers([layer]))+1:03d}"
-
-        self.items.append(
-            Segment(
-                fps=self.fps,
-                segment_id=self.get_max_list_index() + 1,
-                layer=layer,
-                title=title,
-                start_frame=start_frame,
-                end_frame=end_frame,
-            )
-        )
-
-    def get_segment_by_id(self, segment_id):
-        """Get the segment by its ID"""
-        for segment in self.items:
-            if segment.segment_id == segment_id:
-                return segment
-        return None
-
-    def get_segment_by_time(
-        self, time_sec, layer, include_start=True, include_end=True
-    ):
-        """Get the segment by time (in seconds)"""
-        for segment in self.items:
-            if segment.layer != layer:
-                continue
-
-            start = segment.start_time
-            end = segment.end_time
-
-            if include_start and include_end:
-                if start <= time_sec <= end:
-                    return segment
-            elif include_start:
-                if start <= time_sec < end:
-                    return segment
-            elif include_end:
-                if start < time_sec <= end:
-                    return segment
-            else:
-                if start < time_sec < end:
-                    return segment
-        return None
-
-    def get_segments_by_time(
-        self, time_sec, layer, include_start=True, include_end=True
-    ):
-        """Get the segment by time (in seconds)"""
-        segments = []
-        for segment in self.items:
-            if segment.layer != layer:
-                continue
-
-            start = segment.start_time
-            end = segment.end_time
-
-            if include_start and include_end:
-                if start <= time_sec <= end:
-                    segments.append(segment)
-            elif include_start:
-                if start <= time_sec < end:
-                    segments.append(segment)
-            elif include_end:
-                if start < time_sec <= end:
-                    segments.append(segment)
-            else:
-                if start < time_sec < end:
-                    segments.append(segment)
-        return segments
-
-    def get_index_by_id(self, segment_id):
-        """Get the index of the segment by its ID"""
-        layer = self.get_segment_by_id(segment_id).layer
-        filtered_segments = self.filter_by_layers([layer])
-        for i, segment in enumerate(filtered_segments):
-            if segment.segment_id == segment_id:
-                return i
-        return None
-
-    def filter_by_layers(self, layers):
-        return [s for s in self.items if s.layer in layers]
-
-    def clear(self, layers=None):
-        if layers is None:
-            self.items = []
-        else:
-            self.items = [
-                segment
-                for segment in self.items
-                if segment.layer not in layers
-            ]
-
-    def remove_segment_by_id(self, segment_id):
-        self.items = [
-            segment
-            for segment in self.items
-            if segment.segment_id != segment_id
-        ]
-
-    def get_next_free_time(self, start_time, layer):
-        """Get the next free time after start_time in the selected layer"""
-        segment = self.get_segment_by_time(start_time, layer, True, False)
-
-        if segment is None:
-            if start_time >= self.total_frames / self.fps:
-                return None
-            return start_time
-        else:
-            return self.get_next_free_time(segment.end_time, layer)
-
-    def get_previous_free_time(self, end_time, layer):
-        """Get the previous free time before end_time in the selected layer"""
-        segment = self.get_segment_by_time(end_time, layer, False, True)
-
-        if segment is None:
-            if end_time <= 0:
-                return None
-            return end_time
-        else:
-            return self.get_previous_free_time(segment.start_time, layer)
-
-    def get_next_segment(self, current_segment):
-        """Get the next segment in the same layer"""
-        filtered_segments = sorted(
-            [
-                segment
-                for segment in self.items
-                if segment.layer == current_segment.layer
-                and segment.start_time > current_segment.start_time
-            ],
-            key=lambda x: x.start_time,
-        )
-
-        if len(filtered_segments) > 0:
-            return filtered_segments[0]
-        else:
-            return None
-
-    def get_prev_segment(self, current_segment):
-        """Get the previous segment in the same layer"""
-        filtered_segments = sorted(
-            [
-                segment
-                for segment in self.items
-                if segment.layer == current_segment.layer
-                and segment.end_time < current_segment.end_time
-            ],
-            key=lambda x: x.end_time,
-            reverse=True,
-        )
-
-        if len(filtered_segments) > 0:
-            return filtered_segments[0]
-        else:
-            return None
-
-    def get_next_segment_by_time(self, time, layer):
-        """Get the next segment after the specified time (in seconds)"""
-        same_layer_segments = sorted(
-            [
-                segment
-                for segment in self.items
-                if segment.layer == layer and segment.start_time > time
-            ],
-            key=lambda x: x.start_time,
-        )
-
-        if same_layer_segments:
-            return same_layer_segments[0]
-        return None
-
-    def get_prev_segment_by_time(self, time, layer):
-        """Get the previous segment before the specified time (in seconds)"""
-        same_layer_segments = sorted(
-            [
-                segment
-                for segment in self.items
-                if segment.layer == layer and segment.end_time < time
-            ],
-            key=lambda x: x.start_time,
-            reverse=True,
-        )
-
-        if same_layer_segments:
-            return same_layer_segments[0]
-        return None
-
-    def reset_list_indexes(self):
-        """Reassign IDs to segments based on their order in the full list"""
-        for i, segment in enumerate(self.items):
-            segment.segment_id = i + 1
-
-    def get_segments_before_time(self, time_sec, layer=None):
-        """Get the segments before the specified time (in seconds)"""
-        if layer is None:
-            layer = self.selected_layer
-
-        filtered_segment_list = [
-            segment
-            for segment in self.items
-            if segment.layer == layer and segment.end_time <= time_sec
-        ]
-
-        # Return sorted list
-        return sorted(filtered_segment_list, key=lambda x: x.end_time)
-
-    def get_segments_after_time(self, time_sec, layer=None):
-        """Get the segments after the specified time (in seconds)"""
-        if layer is None:
-            layer = self.selected_layer
-
-        filtered_segment_list = [
-            segment
-            for segment in self.items
-            if segment.layer == layer and segment.start_time >= time_sec
-        ]
-
-        # Return sorted list
-        return sorted(filtered_segment_list, key=lambda x: x.start_time)
+class VideoProject(core.VideoProject):
+    """VideoProject configured from config.ini, with file dialogs"""
 
-    def sort_segments_by_title(self):
-        """Sort segments by their title"""
-        self.items.sort(key=lambda segment: segment.title)
-
-    def sort_segments_by_start_time(self):
-        """Sort segments by their start time"""
-        self.items.sort(key=lambda segment: segment.start_time)
-
-    def reset_indices(self):
-        """Reset segment IDs based on their order in the list"""
-        for index, segment in enumerate(self.items):
-            segment.segment_id = index + 1
-
-
-class VideoProject:
-    def __init__(self, video_path, output_path=None):
-        self._file_path = None
-        self.video_path = video_path
-        self.output_path = output_path
-        self.cap, self.total_frames, self.fps = video_utils.load_video(
-            video_path, backend=config.get("DEFAULT", "backend")
+    def __init__(self, video_path, output_path=None, video_info=None):
+        super().__init__(
+            video_path,
+            output_path=output_path,
+            video_info=video_info,
+            backend=config.get("DEFAULT", "backend", fallback="opencv"),
+            decoder_handles=config.getint(
+                "DEFAULT", "decoder_handles", fallback=3
+            ),
         )
-        self.segments = SegmentManager(self.fps, self.total_frames)
-
-    def __del__(self):
-        if self.cap is not None:
-            self.cap.release()
-
-    def to_dict(self):
-        return {
-            "video_path": self.video_path,
-            "output_path": self.output_path,
-            "segments": [segment.to_dict() for segment in self.segments],
-        }
-
-    @property
-    def duration(self):
-        return self.total_frames / self.fps
-
-    @property
-    def file_path(self):
-        return self._file_path
-
-    def save(self, file_path):
-        project_data = {
-            "video_path": self.video_path,
-            "output_path": self.output_path,
-            "segment_list": [segment.to_dict() for segment in self.segments],
-        }
-
-        with open(file_path, "w", encoding="utf-8") as f:
-            json.dump(project_data, f, ensure_ascii=False, indent=2)
-
-        # Update the file path after saving
-        self._file_path = file_path
 
     @classmethod
     def open_project_dialog(cls):
@@ -437,30 +92,10 @@ class VideoProject:
         )
 
     @classmethod
-    def load(cls, file_path=None):
+    def load(cls, file_path=None, lazy=False):
         if file_path is None:
             file_path = cls.open_project_dialog()
-
-        if not file_path:
-            raise ValueError("No project file selected")
-
-        with open(file_path, "r", encoding="utf-8") as f:
-            project_data = json.load(f)
-
-        video_path = project_data.get("video_path")
-        output_path = project_data.get("output_path")
-
-        instance = cls(
-            video_path=video_path,
-            output_path=output_path,
-        )
-        instance.segments = SegmentManager.from_dicts(
-            instance.fps,
-            instance.total_frames,
-            project_data.get("segment_list", []),
-        )
-        instance._file_path = file_path
-        return instance
+        return super().load(file_path, lazy=lazy)
 
     def load_video(self):
         return utils.load_video_dialog()
@@ -519,6 +154,84 @@ class StatusText:
         self.text("", duration=0)
 
 
+class RenderScheduler:
+    """Coalesce repaint requests into a single idle-time pass.
+
+    Regions are marked dirty with `mark` and handed to `render` as one set
+    once Tk is idle, so every region is repainted at most once per pass no
+    matter how many times it was marked in the meantime.
+    """
+
+    def __init__(self, app, render):
+        self.app = app
+        self.render = render
+        self.dirty = set()
+        self.pending = None
+
+    def mark(self, *regions):
+        self.dirty.update(regions)
+        if self.pending is None:
+            self.pending = self.app.after_idle(self.flush)
+
+    def flush(self):
+        self.pending = None
+        dirty, self.dirty = self.dirty, set()
+        if dirty:
+            self.render(dirty)
+
+
+class UIEventBus:
+    """Deliver events from worker threads to the Tk thread.
+
+    Workers `post` a callback and its arguments into a locked list and
+    return at once; they never touch Tk. The Tk thread drains the list
+    every `interval_ms`. An event posted with a key replaces an undelivered
+    event with the same key, so a burst of progress updates is shown once.
+    """
+
+    def __init__(self, app, interval_ms=16):
+        self.app = app
+        self.interval_ms = interval_ms
+        self._lock = threading.Lock()
+        self._events = []  # [callback, args] in posting order
+        self._keyed = {}  # key -> undelivered event
+        self._pending = None
+
+    def post(self, callback, *args, key=None):
+        """Queue callback(*args) for the Tk thread. Safe from any thread."""
+        with self._lock:
+            event = self._keyed.get(key) if key is not None else None
+            if event is not None:
+                event[1] = args
+                return
+            event = [callback, args]
+            self._events.append(event)
+            if key is not None:
+                self._keyed[key] = event
+
+    def start(self):
+        if self._pending is None:
+            self._pending = self.app.after(self.interval_ms, self.drain)
+
+    def stop(self):
+        if self._pending is not None:
+            self.app.after_cancel(self._pending)
+            self._pending = None
+
+    def drain(self):
+        """Run the queued callbacks on the Tk thread"""
+        self._pending = None
+        with self._lock:
+            events, self._events = self._events, []
+            self._keyed = {}
+        for callback, args in events:
+            try:
+                callback(*args)
+            except Exception:
+                traceback.print_exc()
+        self.start()
+
+
 class SettingsDialog(ctk.CTkToplevel):
     def __init__(self, parent):
         super().__init__(parent)
@@ -538,7 +251,7 @@ class SettingsDialog(ctk.CTkToplevel):
             row=0, column=0, padx=10, pady=5, sticky="nsew"
         )
         self.content_frame.grid_columnconfigure(0, weight=1)
-        
+
         row = 0
 
         # Language selection
@@ -593,7 +306,7 @@ class SettingsDialog(ctk.CTkToplevel):
         self.cache_size_spinbox.grid(
             row=row, column=1, padx=5, pady=5, sticky="w"
         )
-        
+
         # Clear cache button
         row += 1
         self.clear_cache_label = ctk.CTkLabel(
@@ -634,6 +347,25 @@ class SettingsDialog(ctk.CTkToplevel):
             row=row, column=1, padx=5, pady=5, sticky="w"
         )
 
+        # Decoder handle limit
+        row += 1
+        ctk.CTkLabel(self.content_frame, text=t("Decoder handles") + ":").grid(
+            row=row, column=0, padx=5, pady=5, sticky="w"
+        )
+        self.decoder_handles_spinbox = CTkSpinbox(
+            self.content_frame,
+            initialvalue=config.getint(
+                "DEFAULT", "decoder_handles", fallback=3
+            ),
+            min_value=1,
+            max_value=8,
+            step=1,
+            width=120,
+        )
+        self.decoder_handles_spinbox.grid(
+            row=row, column=1, padx=5, pady=5, sticky="w"
+        )
+
         # Codec selector
         row += 1
         ctk.CTkLabel(
@@ -644,10 +376,35 @@ class SettingsDialog(ctk.CTkToplevel):
         )
         self.codec_option = ctk.CTkOptionMenu(
             self.content_frame,
-            values=[codec for codec, _ in self.parent.available_codecs],
+            values=[self.codec_var.get()],
             variable=self.codec_var,
+            state="disabled",
         )
         self.codec_option.grid(row=row, column=1, padx=5, pady=5, sticky="w")
+        self.update_codec_options()
+
+        # Codec benchmark
+        row += 1
+        ctk.CTkLabel(self.content_frame, text=t("Codec benchmark") + ":").grid(
+            row=row, column=0, padx=5, pady=5, sticky="w"
+        )
+        self.benchmark_button = ctk.CTkButton(
+            self.content_frame,
+            text=t("Run"),
+            command=self.run_codec_benchmark,
+        )
+        self.benchmark_button.grid(
+            row=row, column=1, padx=5, pady=5, sticky="w"
+        )
+        row += 1
+        self.benchmark_label = ctk.CTkLabel(
+            self.content_frame,
+            text=self.parent.format_codec_benchmark(),
+            justify="left",
+        )
+        self.benchmark_label.grid(
+            row=row, column=0, columnspan=2, padx=5, pady=5, sticky="w"
+        )
 
         # Backend selector
         row += 1
@@ -664,6 +421,37 @@ class SettingsDialog(ctk.CTkToplevel):
         )
         self.backend_option.grid(row=row, column=1, padx=5, pady=5, sticky="w")
 
+        # Proxy selector
+        row += 1
+        ctk.CTkLabel(
+            self.content_frame, text=t("Proxy video for editing") + ":"
+        ).grid(row=row, column=0, padx=5, pady=5, sticky="w")
+        proxy_height = config.getint("DEFAULT", "proxy_height", fallback=0)
+        self.proxy_var = ctk.StringVar(
+            value=f"{proxy_height}p" if proxy_height > 0 else t("Off")
+        )
+        self.proxy_option = ctk.CTkOptionMenu(
+            self.content_frame,
+            values=[t("Off"), "360p", "540p", "720p"],
+            variable=self.proxy_var,
+        )
+        self.proxy_option.grid(row=row, column=1, padx=5, pady=5, sticky="w")
+
+        # Frame store
+        row += 1
+        ctk.CTkLabel(
+            self.content_frame, text=t("Decode whole video to disk") + ":"
+        ).grid(row=row, column=0, padx=5, pady=5, sticky="w")
+        self.frame_store_var = ctk.BooleanVar(
+            value=config.getboolean("DEFAULT", "frame_store", fallback=False)
+        )
+        self.frame_store_checkbox = ctk.CTkCheckBox(
+            self.content_frame, text="", variable=self.frame_store_var
+        )
+        self.frame_store_checkbox.grid(
+            row=row, column=1, padx=5, pady=5, sticky="w"
+        )
+
         # Buttons
         self.button_frame = ctk.CTkFrame(self)
         self.button_frame.grid(row=1, column=0, padx=10, pady=10, sticky="e")
@@ -694,7 +482,14 @@ class SettingsDialog(ctk.CTkToplevel):
         config["DEFAULT"]["preload_head_frame_count"] = str(
             preload_head_frame_count
         )
+        decoder_handles = self.decoder_handles_spinbox.get()
+        config["DEFAULT"]["decoder_handles"] = str(decoder_handles)
         config["DEFAULT"]["codec"] = self.codec_var.get()
+        proxy = self.proxy_var.get()
+        config["DEFAULT"]["proxy_height"] = (
+            proxy.rstrip("p") if proxy.endswith("p") else "0"
+        )
+        config["DEFAULT"]["frame_store"] = str(self.frame_store_var.get())
         if config["DEFAULT"]["backend"] != self.backend_var.get():
             config["DEFAULT"]["backend"] = self.backend_var.get()
             messagebox.showinfo(
@@ -710,10 +505,39 @@ class SettingsDialog(ctk.CTkToplevel):
         self.parent.set_layer_count(self.layer_count_var.get())
         self.parent.set_cache_size(cache_size)
         self.parent.set_preload_head_frame_count(preload_head_frame_count)
+        self.parent.set_decoder_handles(decoder_handles)
 
     def on_cancel(self):
         self.destroy()
 
+    def update_codec_options(self):
+        """Fill the codec menu once probing has finished"""
+        if not self.winfo_exists():
+            return
+        if not self.parent.available_codecs_ready.is_set():
+            self.after(100, self.update_codec_options)
+            return
+        self.codec_option.configure(
+            values=list(video_utils.auto_codecs)
+            + [codec for codec, _ in self.parent.available_codecs],
+            state="normal",
+        )
+
+    def run_codec_benchmark(self):
+        if not self.parent.available_codecs_ready.is_set():
+            return
+        self.benchmark_button.configure(state="disabled")
+        self.benchmark_label.configure(text=t("Benchmarking codecs..."))
+        self.parent.start_codec_benchmark(self.show_codec_benchmark)
+
+    def show_codec_benchmark(self):
+        if not self.winfo_exists():
+            return
+        self.benchmark_button.configure(state="normal")
+        self.benchmark_label.configure(
+            text=self.parent.format_codec_benchmark()
+        )
+
     def change_language(self, choice):
         global lang
         lang = choice
@@ -726,6 +550,125 @@ class SettingsDialog(ctk.CTkToplevel):
             ),
         )
 
+
+class ChunkDialog(ctk.CTkToplevel):
+    """Dialog to fill a layer with fixed-duration chunks"""
+
+    def __init__(self, parent):
+        super().__init__(parent)
+
+        self.parent = parent
+
+        self.title(t("Split into Chunks"))
+        self.geometry("360x260")
+
+        self.grid_rowconfigure(0, weight=1)  # Content
+        self.grid_rowconfigure(1, weight=0)  # Buttons
+        self.grid_columnconfigure(0, weight=1)
+
+        # Content
+        self.content_frame = ctk.CTkFrame(self)
+        self.content_frame.grid(
+            row=0, column=0, padx=10, pady=5, sticky="nsew"
+        )
+        self.content_frame.grid_columnconfigure(0, weight=1)
+
+        row = 0
+
+        # Chunk length
+        ctk.CTkLabel(self.content_frame, text=t("Chunk length") + ":").grid(
+            row=row, column=0, padx=5, pady=5, sticky="w"
+        )
+        self.length_entry = ctk.CTkEntry(self.content_frame, width=80)
+        self.length_entry.insert(0, "600")
+        self.length_entry.grid(row=row, column=1, padx=5, pady=5, sticky="w")
+        self.unit_options = {t("seconds"): "seconds", t("frames"): "frames"}
+        self.unit_option = ctk.CTkOptionMenu(
+            self.content_frame,
+            values=list(self.unit_options.keys()),
+            width=90,
+        )
+        self.unit_option.set(t("seconds"))
+        self.unit_option.grid(row=row, column=2, padx=5, pady=5, sticky="w")
+
+        # Target layer
+        row += 1
+        ctk.CTkLabel(self.content_frame, text=t("layer") + ":").grid(
+            row=row, column=0, padx=5, pady=5, sticky="w"
+        )
+        self.layer_option = ctk.CTkOptionMenu(
+            self.content_frame,
+            values=[str(layer) for layer in self.parent.layers],
+            width=80,
+        )
+        self.layer_option.set(str(self.parent.selected_layer))
+        self.layer_option.grid(row=row, column=1, padx=5, pady=5, sticky="w")
+
+        # Options
+        row += 1
+        self.align_keyframes = ctk.CTkCheckBox(
+            self.content_frame, text=t("Align to keyframes")
+        )
+        self.align_keyframes.grid(
+            row=row, column=0, columnspan=3, padx=5, pady=5, sticky="w"
+        )
+
+        row += 1
+        self.replace_existing = ctk.CTkCheckBox(
+            self.content_frame, text=t("Replace segments in the layer")
+        )
+        self.replace_existing.grid(
+            row=row, column=0, columnspan=3, padx=5, pady=5, sticky="w"
+        )
+
+        # Buttons
+        self.button_frame = ctk.CTkFrame(self)
+        self.button_frame.grid(row=1, column=0, padx=10, pady=10, sticky="e")
+
+        self.ok_button = ctk.CTkButton(
+            self.button_frame,
+            text=t("OK"),
+            command=self.on_ok,
+            width=80,
+        )
+        self.ok_button.pack(side="left", padx=5, pady=5)
+        self.cancel_button = ctk.CTkButton(
+            self.button_frame,
+            text=t("Cancel"),
+            command=self.on_cancel,
+            width=80,
+        )
+        self.cancel_button.pack(side="left", padx=5, pady=5)
+
+    def on_ok(self):
+        try:
+            value = float(self.length_entry.get())
+        except ValueError:
+            value = 0
+
+        if self.unit_options[self.unit_option.get()] == "seconds":
+            chunk_frames = round(value * self.parent.vp.fps)
+        else:
+            chunk_frames = round(value)
+
+        if chunk_frames <= 0:
+            messagebox.showwarning(
+                t("Warning"), t("Chunk length must be positive")
+            )
+            return
+
+        self.destroy()
+        self.parent.add_chunks(
+            int(self.layer_option.get()),
+            chunk_frames,
+            align_keyframes=bool(self.align_keyframes.get()),
+            replace=bool(self.replace_existing.get()),
+        )
+
+    def on_cancel(self):
+        self.destroy()
+
+
 def skip_if_entry_focused(func):
     """Decorator to skip function execution if an Entry widget has focus"""
     @functools.wraps(func)
@@ -746,16 +689,21 @@ class VideoSplitterApp(ctk.CTk):
         self.geometry("1400x900")
 
         self.available_codecs = []
-        threading.Thread(
-            target=self._load_available_codecs, daemon=True
-        ).start()
+        # Set once available_codecs is complete
+        self.available_codecs_ready = threading.Event()
+        # Deferred to the first idle pass so that building the window
+        # does not wait for OpenCV to load
+        self.after_idle(self._load_available_codecs)
 
         # Video-related variables
         self.current_frame = 0
         self.is_playing = False
+        self.playback_engine = None
 
         # Split layers
         self.seek_canvases = []
+        # Average pixel width below which seekbar segments are aggregated
+        self.segment_lod_min_width = 3
         self.set_layer_count(
             config.getint("DEFAULT", "layer_count", fallback=3)
         )
@@ -769,6 +717,47 @@ class VideoSplitterApp(ctk.CTk):
         self.video_cache = utils.SimpleCache(max_size=30)
         self.video_cache_for_head = utils.SimpleCache(max_size=0)
         self.video_cache_for_head_frame_count = 300
+        self.head_preload_cancel_event = None
+        self.render_scheduler = RenderScheduler(self, self.render_dirty)
+        # Worker threads reach the UI only through this bus
+        self.events = UIEventBus(self)
+        self.events.start()
+
+        # Seekbar filmstrip
+        self.thumbnail_cache = None
+        self.thumbnail_generator = None
+        self.filmstrip_height = 45
+        self.filmstrip_thumb_width = 80
+        self.filmstrip_photos = {}
+        # Retained image items, and the view they were laid out for
+        self.filmstrip_items = []
+        self.filmstrip_key = None
+
+        # Seekbar hover preview
+        self.hover_thumbnail_cache = None
+        self.hover_thumbnail_generator = None
+        self.hover_preview = None
+        self.hover_frame = None
+        self.hover_max_distance = 0
+        self.hover_pointer = (0, 0)
+
+        # Segment list row thumbnails
+        self.row_thumbnail_cache = None
+        self.row_thumbnail_generator = None
+        self.row_thumbnail_size = (48, 27)
+        self.row_thumbnail_images = {}
+        self.row_thumbnail_blank = ctk.CTkImage(
+            Image.new("RGB", self.row_thumbnail_size, "gray20"),
+            size=self.row_thumbnail_size,
+        )
+        self.row_thumbnail_request_pending = False
+
+        # Editing proxy
+        self.proxy_cancel_event = None
+
+        # Memory-mapped store of all decoded frames
+        self.frame_store = None
+        self.frame_store_cancel_event = None
         self.status_text = None
         self.is_seeking = False
         self.prev_frame_click_count = 0
@@ -814,7 +803,125 @@ class VideoSplitterApp(ctk.CTk):
         self.bind("<a>", self.toggle_mode)
 
     def _load_available_codecs(self):
-        self.available_codecs = video_utils.get_available_codecs()
+        """Use the codec list cached for this OpenCV build, or probe it.
+        Runs in the background because identifying the build loads
+        OpenCV."""
+        cached_key = config.get("DEFAULT", "codec_probe_key", fallback="")
+        cached_codecs = config.get(
+            "DEFAULT", "available_codecs", fallback=""
+        ).split(",")
+
+        def load():
+            key = video_utils.codec_probe_key()
+            if key == cached_key:
+                self.available_codecs = [
+                    (codec, video_utils.codec_and_extensions[codec])
+                    for codec in cached_codecs
+                    if codec in video_utils.codec_and_extensions
+                ]
+                self.available_codecs_ready.set()
+                return
+            codecs = video_utils.get_available_codecs()
+            self.events.post(self._store_available_codecs, key, codecs)
+
+        threading.Thread(target=load, daemon=True).start()
+
+    def get_codec_benchmark_size(self):
+        """Resolution codecs are benchmarked at: that of the source video"""
+        if self.vp is not None and self.vp.is_video_open:
+            info = video_utils.get_video_info(self.vp.video_path)
+            if info is not None and info["width"] > 0 and info["height"] > 0:
+                return info["width"], info["height"]
+        return 1280, 720
+
+    def load_codec_benchmark(self, size=None):
+        """
+        Get the stored codec benchmark of this OpenCV build.
+        Args:
+            size (tuple, optional): Required (width, height)
+        Returns:
+            dict: "size" and "results" (codec -> result), or None
+        """
+        try:
+            data = json.loads(
+                config.get("DEFAULT", "codec_benchmark", fallback="")
+            )
+        except ValueError:
+            return None
+        if data.get("key") != video_utils.codec_probe_key():
+            return None
+        if size is not None and tuple(data.get("size", ())) != tuple(size):
+            return None
+        return data
+
+    def start_codec_benchmark(self, callback=None):
+        """Benchmark the available codecs in the background"""
+        size = self.get_codec_benchmark_size()
+        codecs = list(self.available_codecs)
+
+        def run():
+            results = video_utils.benchmark_codecs(codecs, *size)
+            self.events.post(
+                self.store_codec_benchmark, size, results, callback
+            )
+
+        threading.Thread(target=run, daemon=True).start()
+
+    def store_codec_benchmark(self, size, results, callback=None):
+        config["DEFAULT"]["codec_benchmark"] = json.dumps(
+            {
+                "key": video_utils.codec_probe_key(),
+                "size": list(size),
+                "results": results,
+            }
+        )
+        with open("config.ini", "w") as config_file:
+            config.write(config_file)
+        if callback is not None:
+            callback()
+
+    def format_codec_benchmark(self):
+        data = self.load_codec_benchmark()
+        if data is None:
+            return t("Not measured yet")
+        width, height = data["size"]
+        lines = [f"{width}x{height}"]
+        for codec, result in data["results"].items():
+            if result is None:
+                lines.append(f"{codec}: -")
+            else:
+                lines.append(
+                    f"{codec}: {result['fps']:.0f} fps, "
+                    + f"{result['bytes_per_frame'] / 1024:.1f} KB/frame"
+                )
+        return "\n".join(lines)
+
+    def get_export_codec(self):
+        """Codec from the settings. Automatic choices use the benchmark at
+        the source resolution, which is run first if it is missing."""
+        codec = config.get("DEFAULT", "codec", fallback="mp4v")
+        if codec not in video_utils.auto_codecs:
+            return codec
+        size = self.get_codec_benchmark_size()
+        data = self.load_codec_benchmark(size)
+        if data is None:
+            results = video_utils.benchmark_codecs(
+                self.available_codecs, *size
+            )
+            self.events.post(self.store_codec_benchmark, size, results)
+        else:
+            results = data["results"]
+        return video_utils.select_codec(codec, results)
+
+    def _store_available_codecs(self, key, codecs):
+        self.available_codecs = codecs
+        self.available_codecs_ready.set()
+        config["DEFAULT"]["codec_probe_key"] = key
+        config["DEFAULT"]["available_codecs"] = ",".join(
+            codec for codec, _ in codecs
+        )
+        with open("config.ini", "w") as config_file:
+            config.write(config_file)
 
     def set_layer_count(self, count):
         self.layers = list(range(1, count + 1))
@@ -828,7 +935,11 @@ class VideoSplitterApp(ctk.CTk):
 
     def set_cache_size(self, size):
         self.video_cache.max_size = size
-        
+
+    def set_decoder_handles(self, count):
+        if self.vp is not None and self.vp.reader is not None:
+            self.vp.reader.limit = count
+
     def clear_video_cache(self):
         self.video_cache.clear()
         self.status_text.info(t("Video cache cleared."))
@@ -896,8 +1007,10 @@ class VideoSplitterApp(ctk.CTk):
         self.canvas_frame = ctk.CTkFrame(self.left_frame)
         self.canvas_frame.grid(row=1, column=0, padx=10, pady=5, sticky="nsew")
 
-        self.video_label = ctk.CTkLabel(
-            self.canvas_frame, text=t("Load a video file")
+        self.video_label = CTkFrameView(
+            self.canvas_frame,
+            text=t("Load a video file"),
+            fg_color="transparent",
         )
         self.video_label.pack(expand=True, fill="both")
 
@@ -968,12 +1081,25 @@ class VideoSplitterApp(ctk.CTk):
         self.zoom_range_slider.set(50)
         self.zoom_range_slider.grid(row=0, column=3, padx=5)
 
+        self.filmstrip_checkbox = ctk.CTkCheckBox(
+            self.zoom_scale_control_frame,
+            text=t("Filmstrip"),
+            command=self.toggle_filmstrip,
+        )
+        self.filmstrip_checkbox.grid(row=0, column=4, padx=5)
+
         # Canvas for seekbar (for range display)
         self.seek_canvases_frame = ctk.CTkFrame(self.seekbar_frame)
         self.seek_canvases_frame.grid(
             row=1, column=0, columnspan=3, padx=5, pady=5, sticky="ew"
         )
 
+        self.filmstrip_canvas = tk.Canvas(
+            self.seek_canvases_frame,
+            height=self.filmstrip_height,
+            bg="gray10",
+            highlightthickness=0,
+        )
         self.setup_seekbar_canvases_ui(self.seek_canvases_frame)
 
         # Empty canvas for main seekbar
@@ -1074,6 +1200,18 @@ class VideoSplitterApp(ctk.CTk):
         )
         self.save_project_button.grid(row=0, column=3, padx=5, pady=5)
 
+        # Segment import button
+        self.import_segments_button = ctk.CTkButton(
+            parent,
+            text="📥 " + t("Import Segments"),
+            command=self.import_segments,
+            height=40,
+            width=150,
+            fg_color="gray40",
+            hover_color="gray50",
+        )
+        self.import_segments_button.grid(row=0, column=4, padx=5, pady=5)
+
     def setup_video_control_buttons_ui(self, parent):
         # Play/Pause button
         self.play_button = ctk.CTkButton(
@@ -1170,6 +1308,16 @@ class VideoSplitterApp(ctk.CTk):
         )
         self.snapshot_button.grid(row=0, column=8, padx=5, pady=5)
 
+        # Playback speed, negative for reverse
+        self.speed_selector = ctk.CTkOptionMenu(
+            parent,
+            values=[f"{s}x" for s in playback.playback_speeds],
+            width=70,
+            command=self.on_speed_selector_change,
+        )
+        self.speed_selector.grid(row=0, column=9, padx=5, pady=5)
+        self.speed_selector.set("1x")
+
     def setup_seekbar_canvases_ui(self, parent):
         self.seek_canvases = []
         for layer in self.layers:
@@ -1200,6 +1348,8 @@ class VideoSplitterApp(ctk.CTk):
                 pady=pady,
                 sticky="ew",
             )
+            seek_canvas.bind("<Motion>", self.on_seek_canvas_motion)
+            seek_canvas.bind("<Leave>", self.hide_hover_preview)
 
             self.seek_canvases.append(
                 {
@@ -1212,6 +1362,9 @@ class VideoSplitterApp(ctk.CTk):
         parent.grid_columnconfigure(0, weight=0)
         parent.grid_columnconfigure(1, weight=1)
 
+        if hasattr(self, "filmstrip_checkbox"):
+            self.update_filmstrip_visibility()
+
     def clear_seekbar_canvases_ui(self):
         for seek_canvas_info in self.seek_canvases:
             seek_canvas_info["seek_canvas"].destroy()
@@ -1260,18 +1413,30 @@ class VideoSplitterApp(ctk.CTk):
         )
         self.end_button.grid(row=0, column=3, padx=5, pady=5, sticky="ew")
 
-        self.length_label = ctk.CTkLabel(
+        self.length_label = ctk.CTkLabel(
+            parent,
+            width=80,
+        )
+        self.length_label.grid(row=0, column=4, padx=10, pady=5, sticky="ew")
+        self.update_length_label(False)
+
+        self.chunk_button = ctk.CTkButton(
             parent,
+            text=t("Chunks"),
+            command=self.open_chunk_dialog,
             width=80,
+            fg_color="gray40",
+            hover_color="gray50",
+            state="disabled",
         )
-        self.length_label.grid(row=0, column=4, padx=10, pady=5, sticky="ew")
-        self.update_length_label(False)
+        self.chunk_button.grid(row=0, column=5, padx=5, pady=5)
 
         parent.grid_columnconfigure(0, weight=0)
         parent.grid_columnconfigure(1, weight=0)
         parent.grid_columnconfigure(2, weight=1)
         parent.grid_columnconfigure(3, weight=1)
         parent.grid_columnconfigure(4, weight=1)
+        parent.grid_columnconfigure(5, weight=0)
 
     def set_mode(self, mode):
         """Set the mode selector value
@@ -1461,9 +1626,10 @@ class VideoSplitterApp(ctk.CTk):
         )
         self.layer_label.grid(row=0, column=0, padx=10, pady=5, sticky="w")
 
-        # Segment list display (scrollable)
-        self.list_frame = ctk.CTkScrollableFrame(self.right_frame)
+        # Segment list display (virtualized, scrollable)
+        self.list_frame = ctk.CTkFrame(self.right_frame)
         self.list_frame.grid(row=1, column=0, padx=10, pady=5, sticky="nsew")
+        self.list_frame.grid_rowconfigure(1, weight=1)
         self.list_frame.grid_columnconfigure(0, weight=1)
         self.setup_segment_list_ui(self.list_frame)
 
@@ -1482,6 +1648,31 @@ class VideoSplitterApp(ctk.CTk):
         )
         self.output_button.grid(row=0, column=1, padx=5, pady=5)
 
+        # Export set selection (segments as-is or a derived layer)
+        ctk.CTkLabel(self.output_frame, text=t("Export") + ":").grid(
+            row=0, column=2, padx=5, pady=5
+        )
+        self.export_set_options = {
+            t("Segments"): "segments",
+            t("Union"): "union",
+            t("Intersection"): "intersection",
+            t("Difference"): "difference",
+        }
+        self.export_set_selector = ctk.CTkOptionMenu(
+            self.output_frame,
+            values=list(self.export_set_options.keys()),
+            width=120,
+        )
+        self.export_set_selector.set(t("Segments"))
+        self.export_set_selector.grid(row=0, column=3, padx=5, pady=5)
+        # Layers of a derived set; the listed layers are used when empty
+        self.export_layers_entry = ctk.CTkEntry(
+            self.output_frame,
+            placeholder_text=t("Layers (e.g. 1,2)"),
+            width=120,
+        )
+        self.export_layers_entry.grid(row=0, column=4, padx=5, pady=5)
+
         self.execute_buttons_frame = ctk.CTkFrame(
             self.right_frame, fg_color="transparent"
         )
@@ -1529,39 +1720,49 @@ class VideoSplitterApp(ctk.CTk):
     def setup_segment_list_ui(self, parent):
         # Header
         self.header_frame = ctk.CTkFrame(parent)
-        self.header_frame.grid(row=0, column=0, sticky="ew", pady=5)
+        # Right padding keeps the columns aligned with the list scrollbar
+        self.header_frame.grid(
+            row=0, column=0, sticky="ew", padx=(0, 16), pady=5
+        )
         ctk.CTkLabel(self.header_frame, text=t("ID"), width=30).grid(
             row=0, column=0, padx=2
         )
         ctk.CTkLabel(self.header_frame, text=t("L"), width=30).grid(
             row=0, column=1, padx=2
         )
+        ctk.CTkLabel(
+            self.header_frame, text="", width=self.row_thumbnail_size[0]
+        ).grid(row=0, column=2, padx=2)
         ctk.CTkButton(
             self.header_frame, text=t("Title"), command=self.sort_list_by_title
-        ).grid(row=0, column=2, padx=2)
+        ).grid(row=0, column=3, padx=2)
         ctk.CTkButton(
             self.header_frame,
             text=t("Start"),
             width=90,
             command=self.sort_list_by_start,
-        ).grid(row=0, column=3, padx=2)
+        ).grid(row=0, column=4, padx=2)
         ctk.CTkLabel(self.header_frame, text=t("End"), width=90).grid(
-            row=0, column=4, padx=2
+            row=0, column=5, padx=2
         )
         ctk.CTkLabel(self.header_frame, text=t("Length"), width=80).grid(
-            row=0, column=5, padx=2
+            row=0, column=6, padx=2
         )
         ctk.CTkLabel(self.header_frame, text=t("Del."), width=30).grid(
-            row=0, column=6, padx=2
+            row=0, column=7, padx=2
         )
 
-        self.header_frame.grid_columnconfigure(2, weight=1)
-
-        # List container
-        self.list_container = ctk.CTkFrame(parent)
-        self.list_container.grid(row=1, column=0, sticky="ew")
+        self.header_frame.grid_columnconfigure(3, weight=1)
 
-        self.list_container.grid_columnconfigure(0, weight=1)
+        # List container (only the visible rows have widgets)
+        self.segment_list_view = CTkVirtualList(
+            parent,
+            row_height=34,
+            create_row=self.create_segment_row,
+            bind_row=self.bind_segment_row,
+            unbind_row=self.unbind_segment_row,
+        )
+        self.segment_list_view.grid(row=1, column=0, sticky="nsew")
 
     def sort_list_by_title(self):
         if self.vp is None:
@@ -1580,7 +1781,7 @@ class VideoSplitterApp(ctk.CTk):
         self.status_text.info(t("Segment list sorted by start time."))
 
     def seekbar_resize_event(self, event):
-        self.after(10, self.draw_all_segment_ranges)
+        self.after(10, self.request_render, "segments")
 
     def open_settings(self):
         # Open settings dialog
@@ -1602,6 +1803,31 @@ class VideoSplitterApp(ctk.CTk):
                     t("Error"), t("Failed to load video file." + "\n" + str(e))
                 )
 
+    @property
+    def is_video_ready(self):
+        """Whether a video is open; False while a project's video is probed"""
+        return self.vp is not None and self.vp.is_video_open
+
+    def disable_video_controls(self):
+        """Disable the controls that need the video, see reset_video_controls"""
+        self.pause_video()
+        self.seek_slider.configure(state="disabled")
+        self.zoom_scale_selector.configure(state="disabled")
+        self.zoom_range_slider.configure(state="disabled")
+        self.play_button.configure(state="disabled")
+        self.prev_frame_button.configure(state="disabled")
+        self.next_frame_button.configure(state="disabled")
+        self.prev_section_button.configure(state="disabled")
+        self.next_section_button.configure(state="disabled")
+        self.rewind_10sec_button.configure(state="disabled")
+        self.fast_forward_10sec_button.configure(state="disabled")
+        self.jump_to_button.configure(state="disabled")
+        self.start_button.configure(state="disabled")
+        self.end_button.configure(state="disabled")
+        self.mode_selector.configure(state="disabled")
+        self.snapshot_button.configure(state="disabled")
+        self.chunk_button.configure(state="disabled")
+
     def reset_video_controls(self):
         self.seek_slider.configure(to=self.vp.total_frames - 1, state="normal")
         self.zoom_scale_selector.configure(state="normal")
@@ -1618,88 +1844,293 @@ class VideoSplitterApp(ctk.CTk):
         self.end_button.configure(state="normal")
         self.mode_selector.configure(state="normal")
         self.snapshot_button.configure(state="normal")
+        self.chunk_button.configure(state="normal")
+
+        self.reset_thumbnails()
 
         self.current_frame = 0
         self.update_zoom_range_slider()
         self.update_zoom_range()
-        self.update_frame()
-        self.update_time_label()
-        self.update_seekbar_time_labels()
-        self.draw_all_segment_ranges()
+        self.request_render(
+            "frame", "time_label", "seekbar_labels", "segments"
+        )
 
         self.update_length_label(False)
+        self.start_frame_index()
+        self.start_proxy()
+        self.start_frame_store()
+
+    def start_frame_index(self):
+        """Load or build the keyframe index of the preview video in the
+        background; seeks become exact once it is set on the reader"""
+        vp = self.vp
+        preview_path = vp.preview_path
+
+        def build():
+            index = decoder.FrameIndex.for_video(preview_path)
+            if index is not None:
+                # The one packet scan also verifies the cached metadata
+                video_utils.get_video_info(
+                    preview_path,
+                    vp.backend,
+                    packets=(index.keyframes, index.timestamps),
+                )
+                self.events.post(
+                    self.apply_frame_index, vp, preview_path, index
+                )
+
+        threading.Thread(target=build, daemon=True).start()
+
+    def apply_frame_index(self, vp, preview_path, index):
+        if vp is not self.vp:
+            return
+        if (
+            preview_path == vp.video_path
+            and index.total_frames != vp.total_frames
+        ):
+            # The container only reported an estimate
+            vp.set_total_frames(index.total_frames)
+            if self.playback_engine is not None:
+                # Takes effect from the next play() of a reused engine
+                self.playback_engine.total_frames = vp.total_frames
+            self.current_frame = min(self.current_frame, vp.total_frames - 1)
+            self.seek_slider.configure(to=vp.total_frames - 1)
+            self.update_zoom_range_slider()
+            self.update_zoom_range()
+            self.request_render(
+                "frame", "slider", "time_label", "seekbar_labels", "segments"
+            )
+        if vp.preview_path == preview_path:
+            vp.reader.index = index
+            if (
+                self.playback_engine is not None
+                and self.playback_engine.video_path == preview_path
+            ):
+                self.playback_engine.index = index
+
+    def start_frame_store(self):
+        """Decode the whole video into the frame store in the background"""
+        import cv2
+
+        if self.frame_store_cancel_event is not None:
+            self.frame_store_cancel_event.set()
+            self.frame_store_cancel_event = None
+        self.frame_store = None
+
+        if not config.getboolean("DEFAULT", "frame_store", fallback=False):
+            return
+
+        vp = self.vp
+        backend = config.get("DEFAULT", "backend")
+        cancel_event = threading.Event()
+        self.frame_store_cancel_event = cancel_event
+
+        def on_progress(decoded, total):
+            self.events.post(
+                self.status_text.info,
+                f"{t('Decoding frames to disk')}... {decoded * 100 // total}%",
+                key="frame_store_progress",
+            )
+
+        def build():
+            # Size the store from the source, vp.cap may be the proxy
+            cap = video_utils.open_capture(vp.video_path, backend)
+            try:
+                frame_size = (
+                    cap.get(cv2.CAP_PROP_FRAME_WIDTH),
+                    cap.get(cv2.CAP_PROP_FRAME_HEIGHT),
+                )
+            finally:
+                cap.release()
+            if not frame_size[1] or cancel_event.is_set():
+                return
+            store = frame_store.FrameStore.for_video(
+                vp.video_path, vp.total_frames, frame_size
+            )
+            self.events.post(self.set_frame_store, vp, store, cancel_event)
+            store.build(
+                vp.preview_path,
+                backend,
+                progress_callback=on_progress,
+                cancel_event=cancel_event,
+            )
+
+        threading.Thread(target=build, daemon=True).start()
+
+    def set_frame_store(self, vp, store, cancel_event):
+        """Use a frame store opened by the start_frame_store worker"""
+        if vp is self.vp and cancel_event is self.frame_store_cancel_event:
+            self.frame_store = store
+
+    def start_proxy(self):
+        """Switch the preview to a low-resolution proxy, creating it first
+        in the background if needed. Export always reads the source."""
+        if self.proxy_cancel_event is not None:
+            self.proxy_cancel_event.set()
+            self.proxy_cancel_event = None
+
+        height = config.getint("DEFAULT", "proxy_height", fallback=0)
+        if height <= 0 or self.vp.preview_path != self.vp.video_path:
+            return
+
+        vp = self.vp
+        proxy_path = video_utils.get_proxy_path(vp.video_path, height)
+        if video_utils.is_valid_proxy(proxy_path, vp.total_frames):
+            self.switch_to_proxy(vp, proxy_path)
+            return
+
+        cancel_event = threading.Event()
+        self.proxy_cancel_event = cancel_event
+
+        def on_progress(done, total):
+            self.events.post(
+                self.status_text.info,
+                f"{t('Creating proxy video')}... {done * 100 // total}%",
+                key="proxy_progress",
+            )
+
+        def create():
+            created = video_utils.create_proxy(
+                vp.video_path,
+                proxy_path,
+                height=height,
+                backend=config.get("DEFAULT", "backend"),
+                progress_callback=on_progress,
+                cancel_event=cancel_event,
+                total_frames=vp.total_frames,
+            )
+            if created:
+                self.events.post(self.switch_to_proxy, vp, proxy_path)
+            elif not cancel_event.is_set():
+                self.events.post(
+                    self.status_text.warning,
+                    t("Failed to create proxy video"),
+                )
+
+        threading.Thread(target=create, daemon=True).start()
+
+    def switch_to_proxy(self, vp, proxy_path):
+        if vp is not self.vp:
+            return  # Another video was loaded meanwhile
+
+        try:
+            vp.use_preview(proxy_path)
+        except ValueError:
+            self.status_text.warning(t("Failed to create proxy video"))
+            return
+
+        self.video_cache.clear()
+        self.video_cache_for_head.clear()
+        self.preload_head_frames()
+        self.reset_thumbnails()
+        self.start_frame_index()
+        self.request_render("frame", "segments")
+        self.status_text.info(t("Using proxy video for preview"))
 
     def preload_head_frames(self):
-        """Preload first N frames into cache for to improve stability"""
+        """Preload first N frames into cache for to improve stability.
+        The frames are decoded in the background on a capture of their own
+        and handed to the cache on the UI thread."""
+        if self.head_preload_cancel_event is not None:
+            self.head_preload_cancel_event.set()
         self.status_text.info(f"{t('Start preloading frames')}...")
 
-        # Note: If using set to 0, it may cause unexpected gap in some videos.
-        # self.vp.cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
-
+        vp = self.vp
+        preview_path = vp.preview_path
         max_frames = min(
-            self.video_cache_for_head_frame_count, self.vp.total_frames
+            self.video_cache_for_head_frame_count, vp.total_frames
         )
+        cancel_event = threading.Event()
+        self.head_preload_cancel_event = cancel_event
 
-        for i in range(max_frames):
-            ret, frame = self.vp.cap.read()
-            if ret:
-                self.video_cache_for_head.set(i, frame.copy())
-            else:
-                break
+        def preload():
+            frames = []
+            cap = video_utils.open_capture(preview_path, vp.backend)
+            try:
+                for _ in range(max_frames):
+                    if cancel_event.is_set():
+                        return
+                    ret, frame = cap.read()
+                    if not ret:
+                        break
+                    frames.append(frame)
+            finally:
+                cap.release()
+            self.events.post(
+                self.set_head_frames, vp, preview_path, cancel_event, frames
+            )
+
+        threading.Thread(target=preload, daemon=True).start()
 
+    def set_head_frames(self, vp, preview_path, cancel_event, frames):
+        """Fill the head cache with frames decoded by preload_head_frames"""
+        if (
+            cancel_event.is_set()
+            or vp is not self.vp
+            or vp.preview_path != preview_path
+        ):
+            return
+        for i, frame in enumerate(frames):
+            self.video_cache_for_head.set(i, frame)
         self.status_text.info(
-            f"{t('[n] frames preloaded.').replace('[n]', str(max_frames))}"
+            f"{t('[n] frames preloaded.').replace('[n]', str(len(frames)))}"
         )
 
-        # Reset to frame 0
-        self.vp.cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
-
     def update_frame(self):
+        import cv2
+
         if self.vp is None or self.vp.cap is None:
             return
 
-        if self.current_frame <= self.video_cache_for_head_frame_count:
-            frame = self.video_cache_for_head.get(self.current_frame)
-        else:
-            frame = self.video_cache.get(self.current_frame)
+        frame = None
+        if self.frame_store is not None:
+            # Zero-copy view into the memory map
+            frame = self.frame_store.get(self.current_frame)
+
+        if frame is None:
+            if self.current_frame <= self.video_cache_for_head_frame_count:
+                frame = self.video_cache_for_head.get(self.current_frame)
+            else:
+                frame = self.video_cache.get(self.current_frame)
+
+        if frame is not None:
+            self.vp.reader.record_cache_hit(self.current_frame)
 
         if frame is None:
-            if self.current_frame != self.vp.cap.get(cv2.CAP_PROP_POS_FRAMES):
-                self.vp.cap.set(cv2.CAP_PROP_POS_FRAMES, self.current_frame)
-                if self.current_frame != self.vp.cap.get(
-                    cv2.CAP_PROP_POS_FRAMES
-                ):
-                    print(
-                        "[Warn]Frame seek failed. "
-                        + f"Expected: {self.current_frame}, "
-                        + f"Actual: {self.vp.cap.get(cv2.CAP_PROP_POS_FRAMES)}"
+            reader = self.vp.reader.acquire(self.current_frame)
+            reader.seek(self.current_frame)
+            if not reader.last_seek_exact:
+                # Only possible before the frame index is ready
+                print(
+                    "[Warn]Frame seek failed. "
+                    + f"Expected: {self.current_frame}, "
+                    + f"Actual: {reader.cap.get(cv2.CAP_PROP_POS_FRAMES)}"
+                )
+                self.status_text.warning(
+                    t(
+                        "Frame seek failed. "
+                        + "If problems persist, please reload the video."
                     )
-                    # Sample code for reloading VideoCapture
-                    # self.vp.cap.release()
-                    # self.vp.cap = cv2.VideoCapture(self.vp.video_path)
-                    # self.vp.cap.set(
-                    #     cv2.CAP_PROP_POS_FRAMES, self.current_frame
-                    # )
-                    self.status_text.warning(
-                        t(
-                            "Frame seek failed. "
-                            + "If problems persist, please reload the video."
-                        )
-                        + f"Expected: {self.current_frame}, "
-                        + f"Actual: {self.vp.cap.get(cv2.CAP_PROP_POS_FRAMES)}. "
+                    + f"Expected: {self.current_frame}, "
+                    + f"Actual: {reader.cap.get(cv2.CAP_PROP_POS_FRAMES)}. "
+                )
+                ret, frame = reader.cap.read()
+                if ret:
+                    self.current_frame = (
+                        int(reader.cap.get(cv2.CAP_PROP_POS_FRAMES)) - 1
                     )
-            ret, frame = self.vp.cap.read()
+            else:
+                ret, frame = reader.read(self.current_frame)
 
             if ret:
-                self.current_frame = (
-                    int(self.vp.cap.get(cv2.CAP_PROP_POS_FRAMES)) - 1
-                )
                 if self.current_frame <= self.video_cache_for_head_frame_count:
                     self.video_cache_for_head.set(
                         self.current_frame, frame.copy()
                     )
                 else:
                     self.video_cache.set(self.current_frame, frame.copy())
+            else:
+                frame = None
 
         if frame is None:
             print(f"[Error] Failed to read frame {self.current_frame}")
@@ -1714,25 +2145,7 @@ class VideoSplitterApp(ctk.CTk):
             return
 
         try:
-
-            frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-
-            # Resize
-            h, w = frame.shape[:2]
-            max_width = 1000
-            max_height = 600
-            scale = min(max_width / w, max_height / h)
-            new_w, new_h = round(w * scale), round(h * scale)
-
-            frame = cv2.resize(frame, (new_w, new_h))
-
-            img = Image.fromarray(frame)
-            ctk_img = ctk.CTkImage(
-                light_image=img, dark_image=img, size=(new_w, new_h)
-            )
-
-            self.video_label.configure(image=ctk_img, text="")
-            self.video_label.image = ctk_img
+            self.video_label.show(frame)
         except cv2.error as e:
             print(f"[Error] OpenCV error at frame {self.current_frame}: {e}")
             self.status_text.error(
@@ -1752,6 +2165,8 @@ class VideoSplitterApp(ctk.CTk):
             self.play_video()
 
     def play_video(self):
+        if not self.is_video_ready:
+            return
         if not self.is_playing:
             self.is_playing = True
             self.play_button.configure(
@@ -1759,11 +2174,15 @@ class VideoSplitterApp(ctk.CTk):
                 fg_color="indian red",
                 hover_color="firebrick",
             )
-            threading.Thread(target=self.play_video_core, daemon=True).start()
+            self.get_playback_engine().start(
+                self.current_frame, self.get_playback_speed()
+            )
 
     def pause_video(self):
         if self.is_playing:
             self.is_playing = False
+            if self.playback_engine is not None:
+                self.playback_engine.stop()
             self.play_button.configure(
                 text="▶ " + t("Play"),
                 fg_color="#1f6aa5",
@@ -1773,14 +2192,13 @@ class VideoSplitterApp(ctk.CTk):
     @skip_if_entry_focused
     def goto_prev_frame(self, event=None):
         """Go back 1 frame"""
+        if not self.is_video_ready:
+            return
         self.pause_video()
 
         if self.current_frame > 0:
             self.current_frame -= 1
-            self.update_frame()
-            self.update_seekbar_slider_value()
-            self.update_time_label()
-            self.draw_all_segment_ranges()
+            self.request_render("frame", "slider", "time_label", "segments")
 
     def on_prev_frame_button_press(self, event):
         self.prev_frame_click_count += 1
@@ -1825,45 +2243,63 @@ class VideoSplitterApp(ctk.CTk):
 
     def on_next_frame_button_release(self, event):
         self.next_frame_auto_repeat = False
-    
+
     @skip_if_entry_focused
     def goto_next_frame(self, event=None):
         """Advance 1 frame"""
+        if not self.is_video_ready:
+            return
         self.pause_video()
 
         if self.current_frame < self.vp.total_frames - 1:
             self.current_frame += 1
-            self.update_frame()
-            self.update_seekbar_slider_value()
-            self.update_time_label()
-            self.draw_all_segment_ranges()
+            self.request_render("frame", "slider", "time_label", "segments")
 
-    def play_video_core(self):
-        while (
-            self.is_playing and self.current_frame < self.vp.total_frames - 1
-        ):
-            self.current_frame += 1
-            self.update_frame()
-            self.update_seekbar_slider_value()
-            self.update_time_label()
-            is_seekbar_range_changed = (
-                self.seek_slider.cget("from_") == self.current_frame
-                or self.seek_slider.cget("to") == self.current_frame
+    def get_playback_speed(self):
+        return float(self.speed_selector.get().rstrip("x"))
+
+    def on_speed_selector_change(self, value):
+        if self.is_playing:
+            # Restart from the frame on screen at the new speed
+            self.playback_engine.start(
+                self.current_frame, self.get_playback_speed()
             )
-            if is_seekbar_range_changed:
-                self.draw_all_segment_ranges()
-            else:
-                self.draw_segment_ranges()
 
-            # TODO: Use more precise timing control. Temporary disabled for now.
-            # self.after(round(1000 / self.vp.fps))
+    def get_playback_engine(self):
+        """Engine for the preview video, created on first playback"""
+        vp = self.vp
+        engine = self.playback_engine
+        if engine is None or engine.video_path != vp.preview_path:
+            if engine is not None:
+                engine.close()
+            engine = playback.PlaybackEngine(
+                vp.preview_path,
+                vp.fps,
+                vp.total_frames,
+                on_frame=self.on_playback_frame,
+                on_end=lambda: self.events.post(self.pause_video),
+                index=vp.reader.index,
+                backend=config.get("DEFAULT", "backend"),
+            )
+            self.playback_engine = engine
+        return engine
+
+    def on_playback_frame(self, frame, image):
+        """Called from the playback thread; only the latest frame is shown"""
+        self.events.post(
+            self.show_playback_frame, frame, image, key="playback_frame"
+        )
 
-        if self.current_frame >= self.vp.total_frames - 1:
-            self.pause_video()
+    def show_playback_frame(self, frame, image):
+        if not self.is_playing:
+            return
+        self.current_frame = frame
+        self.video_label.show(image)
+        self.request_render("time_label", "slider", "segments")
 
     @skip_if_entry_focused
     def goto_next_section(self, event=None):
-        if self.vp is None:
+        if not self.is_video_ready:
             return
 
         if self.current_frame >= self.vp.total_frames - 1:
@@ -1906,7 +2342,7 @@ class VideoSplitterApp(ctk.CTk):
 
     @skip_if_entry_focused
     def goto_prev_section(self, event=None):
-        if self.vp is None:
+        if not self.is_video_ready:
             return
 
         if self.current_frame <= 0:
@@ -1964,11 +2400,9 @@ class VideoSplitterApp(ctk.CTk):
     def jump_to_frame(self, frame_num):
         self.current_frame = max(0, min(frame_num, self.vp.total_frames - 1))
         self.update_zoom_range()
-        self.update_frame()
-        self.update_time_label()
-        self.update_seekbar_slider_value()
-        self.update_seekbar_time_labels()
-        self.draw_all_segment_ranges()
+        self.request_render(
+            "frame", "time_label", "slider", "seekbar_labels", "segments"
+        )
 
     def jump_to_time(self, time_sec):
         frame_num = round(time_sec * self.vp.fps)
@@ -2003,6 +2437,8 @@ class VideoSplitterApp(ctk.CTk):
                     )
 
     def take_snapshot(self):
+        import cv2
+
         if self.vp is None:
             return
 
@@ -2021,8 +2457,13 @@ class VideoSplitterApp(ctk.CTk):
         )
 
         if file_path:
-            self.vp.cap.set(cv2.CAP_PROP_POS_FRAMES, self.current_frame)
-            ret, frame = self.vp.cap.read()
+            # Read the source, not the preview proxy
+            cap = video_utils.open_capture(
+                self.vp.video_path, config.get("DEFAULT", "backend")
+            )
+            cap.set(cv2.CAP_PROP_POS_FRAMES, self.current_frame)
+            ret, frame = cap.read()
+            cap.release()
 
             if ret:
                 frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
@@ -2044,9 +2485,7 @@ class VideoSplitterApp(ctk.CTk):
             self.current_frame = max(
                 0, min(self.current_frame, self.vp.total_frames - 1)
             )
-            self.update_frame()
-            self.update_time_label()
-            self.draw_all_segment_ranges()
+            self.request_render("frame", "time_label", "segments")
 
     def seek_video_timer_event(self):
         shift_frames = 0
@@ -2064,11 +2503,10 @@ class VideoSplitterApp(ctk.CTk):
 
             if shift_frames != 0:
                 self.current_frame += shift_frames
-                self.update_frame()
-                self.update_time_label()
                 self.update_zoom_range(shift_frames=shift_frames)
-                self.update_seekbar_time_labels()
-                self.draw_all_segment_ranges()
+                self.request_render(
+                    "frame", "time_label", "seekbar_labels", "segments"
+                )
 
             self.after(int(1000 / self.vp.fps), self.seek_video_timer_event)
 
@@ -2087,9 +2525,7 @@ class VideoSplitterApp(ctk.CTk):
             self.zoom_scale_selector.set(f"{round(int(value))}%")
         self.update_zoom_range_slider()
         self.update_zoom_range()
-        self.update_seekbar_slider_value()
-        self.update_seekbar_time_labels()
-        self.draw_all_segment_ranges()
+        self.request_render("slider", "seekbar_labels", "segments")
 
     def on_zoom_scale_selector_change(self, value):
         self.update_zoom_scale(int(value.rstrip("%")))
@@ -2098,8 +2534,7 @@ class VideoSplitterApp(ctk.CTk):
         """Update zoom range based on slider value"""
         self.update_zoom_range(center_frame=round(value))
         self.update_seekbar_slider_value(adjust_zoom_range=False)
-        self.update_seekbar_time_labels()
-        self.draw_all_segment_ranges()
+        self.request_render("seekbar_labels", "segments")
 
     def update_zoom_range_slider(self):
         if self.vp is None:
@@ -2271,8 +2706,6 @@ class VideoSplitterApp(ctk.CTk):
     def select_segment_id(self, id=None):
         self.selected_segment_id = id
 
-        self.reset_segment_list_id_color()
-
         if id is None:
             segment = None
             self.enable_toggle_link_boundaries(False)
@@ -2291,40 +2724,23 @@ class VideoSplitterApp(ctk.CTk):
             if segment.layer != self.selected_layer:
                 self.change_layer(str(segment.layer), False)
 
-            self.set_segment_list_id_color(id)
-
-        self.draw_all_segment_ranges()
-
-    def set_segment_list_id_color(self, segment_id):
-        for segment in self.vp.segments:
-            if segment.segment_id == segment_id and (
-                segment.layer == self.selected_layer
-                or self.show_full_list.get()
-            ):
-                ui = segment.ui
-                if ui and ui["num_btn"].winfo_exists():
-                    ui["num_btn"].configure(
-                        fg_color="#1F6AA5", hover_color="#36719F"
-                    )
-                else:
-                    print("No UI found for segment:", segment)
+        self.update_segment_list_selection()
+        self.request_render("segments")
 
-    def reset_segment_list_id_color(self):
+    def update_segment_list_selection(self):
+        """Re-color the visible rows and scroll the selected one into view"""
         if self.vp is None:
             return
 
-        for segment in self.vp.segments:
-            ui = segment.ui
-            if (
-                segment.layer == self.selected_layer
-                or self.show_full_list.get()
-            ):
-                if ui and ui["num_btn"].winfo_exists():
-                    ui["num_btn"].configure(
-                        fg_color="gray30", hover_color="gray50"
-                    )
-                else:
-                    print("No UI found for segment:", segment)
+        if self.selected_segment_id is not None:
+            segment = self.vp.segments.get_segment_by_id(
+                self.selected_segment_id
+            )
+            items = self.segment_list_view.items
+            if segment in items:
+                self.segment_list_view.see(items.index(segment))
+
+        self.segment_list_view.refresh()
 
     def unselect_segment_id(self):
         self.select_segment_id()
@@ -2333,6 +2749,289 @@ class VideoSplitterApp(ctk.CTk):
         for canvas_info in self.seek_canvases:
             canvas = canvas_info["seek_canvas"]
             canvas.delete("all")
+            canvas_info["ranges_key"] = None
+
+    def reset_thumbnails(self):
+        """Start a thumbnail cache and worker pool for the loaded video"""
+        import cv2
+
+        if self.thumbnail_generator is not None:
+            self.thumbnail_generator.shutdown()
+        if self.hover_thumbnail_generator is not None:
+            self.hover_thumbnail_generator.shutdown()
+        if self.row_thumbnail_generator is not None:
+            self.row_thumbnail_generator.shutdown()
+        self.filmstrip_photos = {}
+        self.filmstrip_key = None
+        self.row_thumbnail_images = {}
+        self.hide_hover_preview()
+
+        if not self.vp.is_video_open:
+            self.thumbnail_generator = None
+            self.hover_thumbnail_generator = None
+            self.row_thumbnail_generator = None
+            self.hover_thumbnail_cache = None
+            self.row_thumbnail_cache = None
+            return
+
+        width = self.vp.cap.get(cv2.CAP_PROP_FRAME_WIDTH)
+        height = self.vp.cap.get(cv2.CAP_PROP_FRAME_HEIGHT)
+        if width > 0 and height > 0:
+            self.filmstrip_thumb_width = round(
+                self.filmstrip_height * width / height
+            )
+
+        self.thumbnail_cache = thumbnails.ThumbnailCache()
+        self.thumbnail_generator = thumbnails.ThumbnailGenerator(
+            self.vp.preview_path,
+            self.thumbnail_cache,
+            height=self.filmstrip_height,
+            backend=config.get("DEFAULT", "backend"),
+        )
+        # Hover thumbnails are twice the filmstrip height
+        self.hover_thumbnail_cache = thumbnails.ThumbnailCache(max_items=256)
+        self.hover_thumbnail_generator = thumbnails.ThumbnailGenerator(
+            self.vp.preview_path,
+            self.hover_thumbnail_cache,
+            height=90,
+            workers=1,
+            backend=config.get("DEFAULT", "backend"),
+        )
+        # Row thumbnails are kept on disk across sessions; the worker
+        # fingerprints the video, which is not done on the Tk thread
+        self.row_thumbnail_cache = thumbnails.DiskThumbnailCache(
+            self.vp.video_path, self.row_thumbnail_size[1]
+        )
+        self.row_thumbnail_generator = thumbnails.ThumbnailGenerator(
+            self.vp.preview_path,
+            self.row_thumbnail_cache,
+            height=self.row_thumbnail_size[1],
+            workers=1,
+            backend=config.get("DEFAULT", "backend"),
+        )
+
+    def toggle_filmstrip(self):
+        self.update_filmstrip_visibility()
+        self.request_render("filmstrip")
+
+    def update_filmstrip_visibility(self):
+        if self.filmstrip_checkbox.get():
+            self.filmstrip_canvas.grid(
+                row=len(self.layers),
+                column=1,
+                padx=(0, 10),
+                pady=(0, 5),
+                sticky="ew",
+            )
+        else:
+            self.filmstrip_canvas.grid_remove()
+            if self.thumbnail_generator is not None:
+                self.thumbnail_generator.cancel()
+
+    def get_filmstrip_photo(self, frame, image):
+        """Get a cached PhotoImage for a thumbnail"""
+        photo = self.filmstrip_photos.get(frame)
+        if photo is None:
+            if len(self.filmstrip_photos) >= 256:
+                self.filmstrip_photos = {}
+            photo = ImageTk.PhotoImage(Image.fromarray(image))
+            self.filmstrip_photos[frame] = photo
+        return photo
+
+    def draw_filmstrip(self, force=False):
+        """Draw thumbnails evenly spaced over the visible zoom range.
+
+        The image items are retained and moved or re-pointed in place. They
+        are laid out again only when the zoom window or the canvas width
+        change, or when force is set because new thumbnails are ready.
+        """
+        canvas = self.filmstrip_canvas
+
+        canvas_width = canvas.winfo_width()
+        if canvas_width <= 1:
+            canvas_width = 800
+
+        visible_start_frame = self.seek_slider.cget("from_")
+        visible_end_frame = self.seek_slider.cget("to")
+        visible_range = visible_end_frame - visible_start_frame
+
+        if (
+            self.vp is None
+            or self.thumbnail_generator is None
+            or not self.filmstrip_checkbox.get()
+            or visible_range <= 0
+        ):
+            self.layout_filmstrip_items([])
+            self.filmstrip_key = None
+            return
+
+        key = (visible_start_frame, visible_end_frame, canvas_width)
+        if not force and key == self.filmstrip_key:
+            return
+        self.filmstrip_key = key
+
+        frames = thumbnails.filmstrip_frames(
+            visible_start_frame,
+            visible_end_frame,
+            max(1, int(canvas_width // self.filmstrip_thumb_width)),
+        )
+        spacing = visible_range / max(1, len(frames))
+
+        missing = []
+        shown = []
+        for frame in frames:
+            image = self.thumbnail_cache.get(frame)
+            key = frame
+            if image is None:
+                missing.append(frame)
+                # Show a close thumbnail until the exact one is decoded
+                nearest = self.thumbnail_cache.nearest(
+                    frame, max_distance=spacing / 2
+                )
+                if nearest is None:
+                    continue
+                key, image = nearest
+
+            x = ((frame - visible_start_frame) / visible_range) * canvas_width
+            shown.append((x, self.get_filmstrip_photo(key, image)))
+        self.layout_filmstrip_items(shown)
+
+        if missing:
+            self.thumbnail_generator.request(
+                missing,
+                callback=lambda frame: self.events.post(
+                    self.request_render, "filmstrip", key="filmstrip"
+                ),
+            )
+
+    def layout_filmstrip_items(self, shown):
+        """Move the retained image items to the (x, photo) pairs in shown,
+        creating or deleting only the difference in count"""
+        canvas = self.filmstrip_canvas
+        for item, (x, photo) in zip(self.filmstrip_items, shown):
+            canvas.coords(item, x, 0)
+            canvas.itemconfigure(item, image=photo)
+        for x, photo in shown[len(self.filmstrip_items) :]:
+            self.filmstrip_items.append(
+                canvas.create_image(x, 0, image=photo, anchor="nw")
+            )
+        for item in self.filmstrip_items[len(shown) :]:
+            canvas.delete(item)
+        del self.filmstrip_items[len(shown) :]
+
+    def on_seek_canvas_motion(self, event):
+        """Show a thumbnail of the frame under the cursor"""
+        if self.vp is None or self.hover_thumbnail_generator is None:
+            return
+
+        canvas_width = event.widget.winfo_width()
+        visible_start_frame = self.seek_slider.cget("from_")
+        visible_end_frame = self.seek_slider.cget("to")
+        visible_range = visible_end_frame - visible_start_frame
+        if canvas_width <= 1 or visible_range <= 0:
+            return
+
+        # Snap to a grid of about one frame per pixel so that nearby cursor
+        # positions share thumbnails
+        frame = visible_start_frame + event.x / canvas_width * visible_range
+        frame = thumbnails.snap_frame(frame, visible_range / canvas_width)
+        frame = max(0, min(frame, self.vp.total_frames - 1))
+
+        self.hover_frame = frame
+        self.hover_max_distance = visible_range / 20
+        self.hover_pointer = (event.x_root, event.y_root)
+        self.show_hover_preview()
+
+        if frame not in self.hover_thumbnail_cache:
+            self.hover_thumbnail_generator.request(
+                [frame],
+                callback=lambda frame: self.events.post(
+                    self.show_hover_preview, key="hover_preview"
+                ),
+            )
+
+    def show_hover_preview(self):
+        """Update the hover tooltip from the thumbnail cache"""
+        if self.hover_frame is None:
+            return
+
+        frame = self.hover_frame
+        image = self.hover_thumbnail_cache.get(frame)
+        if image is None:
+            # Fall back to the nearest decoded thumbnail
+            nearest = self.hover_thumbnail_cache.nearest(
+                frame, max_distance=self.hover_max_distance
+            )
+            if nearest is not None:
+                image = nearest[1]
+
+        if self.hover_preview is None:
+            self.hover_preview = tk.Toplevel(self)
+            self.hover_preview.overrideredirect(True)
+            self.hover_preview_label = tk.Label(
+                self.hover_preview,
+                compound="top",
+                background="gray10",
+                foreground="white",
+                borderwidth=1,
+                relief="solid",
+            )
+            self.hover_preview_label.pack()
+
+        photo = ""
+        if image is not None:
+            photo = ImageTk.PhotoImage(Image.fromarray(image))
+        self.hover_preview_label.configure(
+            image=photo,
+            text=f"{utils.format_time(frame / self.vp.fps)} (F:{frame})",
+        )
+        self.hover_preview_label.image = photo
+
+        x, y = self.hover_pointer
+        height = self.hover_preview_label.winfo_reqheight()
+        self.hover_preview.geometry(f"+{x + 12}+{y - height - 12}")
+        self.hover_preview.deiconify()
+        self.hover_preview.lift()
+
+    def hide_hover_preview(self, event=None):
+        self.hover_frame = None
+        if self.hover_preview is not None:
+            self.hover_preview.withdraw()
+
+    def request_render(self, *regions):
+        """Mark display regions dirty and repaint them once when idle.
+
+        Regions are "frame", "time_label", "slider", "seekbar_labels" and
+        "segments" (all seekbar canvases) or ("segments", layer).
+        """
+        self.render_scheduler.mark(*regions)
+
+    def render_dirty(self, dirty):
+        """Repaint the dirty display regions in dependency order"""
+        # The slider may shift the zoom range that the labels and canvases
+        # depend on, so it goes first.
+        if "slider" in dirty:
+            self.update_seekbar_slider_value()
+        if "seekbar_labels" in dirty:
+            self.update_seekbar_time_labels()
+        if "frame" in dirty:
+            self.update_frame()
+        if "time_label" in dirty:
+            self.update_time_label()
+        # Playback marks "segments" on every frame; the filmstrip is only
+        # laid out again when its view changed or thumbnails arrived
+        if "segments" in dirty or "filmstrip" in dirty:
+            self.draw_filmstrip(force="filmstrip" in dirty)
+        if "segments" in dirty:
+            self.draw_all_segment_ranges()
+        else:
+            for layer in sorted(
+                region[1]
+                for region in dirty
+                if isinstance(region, tuple) and region[0] == "segments"
+            ):
+                if layer in self.layers:
+                    self.draw_segment_ranges(layer)
 
     def draw_all_segment_ranges(self):
         for layer in self.layers:
@@ -2341,41 +3040,178 @@ class VideoSplitterApp(ctk.CTk):
             )
 
     def draw_segment_ranges(self, layer=None, draw_current=None):
+        """Update a seekbar canvas.
+
+        Segment rectangles are retained canvas items tagged "range" and
+        "segment:<id>". They are rebuilt only when the segments, the zoom
+        window or the canvas size change; otherwise only the selection
+        color and the marker lines are updated in place.
+        """
         if layer is None:
             layer = self.selected_layer
         if draw_current is None:
             draw_current = layer == self.selected_layer
 
-        seek_canvas = self.seek_canvases[layer - 1]["seek_canvas"]
-
-        # Clear the canvas
-        seek_canvas.delete("all")
+        canvas_info = self.seek_canvases[layer - 1]
+        seek_canvas = canvas_info["seek_canvas"]
 
         if self.vp is None or self.vp.total_frames == 0:
+            if canvas_info.get("ranges_key") is not None:
+                seek_canvas.delete("all")
+                canvas_info["ranges_key"] = None
             return
 
         canvas_width = seek_canvas.winfo_width()
         if canvas_width <= 1:
             canvas_width = 800
 
-        canvas_height = seek_canvas.winfo_height()
+        canvas_height = seek_canvas.winfo_height()
+
+        # Calculate zoom range
+        visible_start_frame = self.seek_slider.cget("from_")
+        visible_end_frame = self.seek_slider.cget("to")
+        visible_range = visible_end_frame - visible_start_frame
+
+        selected_id = (
+            self.selected_segment_id
+            if self.get_current_mode() == "Edit"
+            else None
+        )
+
+        ranges_key = (
+            id(self.vp.segments),
+            self.vp.segments.version,
+            visible_start_frame,
+            visible_end_frame,
+            canvas_width,
+            canvas_height,
+        )
+        if canvas_info.get("ranges_key") != ranges_key or (
+            # Aggregated runs carry no per-segment items to recolor
+            canvas_info.get("lod")
+            and canvas_info.get("highlighted_id") != selected_id
+        ):
+            canvas_info["lod"] = self.draw_segment_range_items(
+                seek_canvas,
+                layer,
+                selected_id,
+                visible_start_frame,
+                visible_end_frame,
+                canvas_width,
+                canvas_height,
+            )
+            canvas_info["ranges_key"] = ranges_key
+            canvas_info["highlighted_id"] = selected_id
+        elif canvas_info.get("highlighted_id") != selected_id:
+            previous_id = canvas_info.get("highlighted_id")
+            if previous_id is not None:
+                seek_canvas.itemconfigure(
+                    f"segment:{previous_id}",
+                    fill="#00ff00",
+                    outline="#00ff00",
+                )
+            if selected_id is not None:
+                seek_canvas.itemconfigure(
+                    f"segment:{selected_id}",
+                    fill="#ffff00",
+                    outline="#ffff00",
+                )
+            canvas_info["highlighted_id"] = selected_id
+
+        def frame_to_x(frame):
+            if not visible_start_frame <= frame <= visible_end_frame:
+                return None
+            return (
+                (frame - visible_start_frame) / visible_range
+            ) * canvas_width
+
+        # If start point is set
+        self.move_canvas_marker(
+            seek_canvas,
+            "start_marker",
+            (
+                frame_to_x(self.start_frame)
+                if draw_current and self.start_frame is not None
+                else None
+            ),
+            canvas_height,
+            fill="#ffff00",
+            width=3,
+        )
+
+        # Draw current position
+        self.move_canvas_marker(
+            seek_canvas,
+            "playhead",
+            frame_to_x(self.current_frame) if draw_current else None,
+            canvas_height,
+            fill="#ff0000",
+            width=2,
+        )
+        seek_canvas.tag_raise("playhead")
+
+    def draw_segment_range_items(
+        self,
+        seek_canvas,
+        layer,
+        selected_id,
+        visible_start_frame,
+        visible_end_frame,
+        canvas_width,
+        canvas_height,
+    ):
+        """Recreate the segment rectangles of a seekbar canvas.
+
+        When the visible segments are too dense to tell apart, they are
+        binned into pixel columns and drawn as merged runs, so the number of
+        canvas items is bounded by the canvas width. The selected segment is
+        always drawn on its own.
+
+        Returns:
+            bool: True if the aggregated level of detail was drawn
+        """
+        import numpy as np
+
+        seek_canvas.delete("range")
 
-        # Calculate zoom range
-        visible_start_frame = self.seek_slider.cget("from_")
-        visible_end_frame = self.seek_slider.cget("to")
         visible_range = visible_end_frame - visible_start_frame
 
-        # Draw segment ranges
-        filtered_segment_list = self.vp.segments.filter_by_layers([layer])
+        starts, ends, segment_ids = self.vp.segments.get_frame_arrays(layer)
+        visible_count = np.count_nonzero(
+            (ends >= visible_start_frame) & (starts <= visible_end_frame)
+        )
+        aggregate = visible_count * self.segment_lod_min_width > canvas_width
+        if aggregate:
+            columns = max(1, int(canvas_width))
+            column_width = canvas_width / columns
+            for first, end in self.vp.segments.get_coverage_runs(
+                starts, ends, visible_start_frame, visible_end_frame, columns
+            ):
+                seek_canvas.create_rectangle(
+                    first * column_width,
+                    0,
+                    end * column_width,
+                    canvas_height,
+                    fill="#00ff00",
+                    stipple="gray50",
+                    outline="#00ff00",
+                    width=2,
+                    tags=("range", "coverage"),
+                )
+            filtered_segment_list = (
+                [self.vp.segments.get_segment_by_id(selected_id)]
+                if selected_id is not None and selected_id in segment_ids
+                else []
+            )
+        else:
+            # Draw segment ranges
+            filtered_segment_list = self.vp.segments.filter_by_layers([layer])
 
         for segment in filtered_segment_list:
             start_frame = segment.start_frame
             end_frame = segment.end_frame
 
-            id_is_selected = (
-                segment.segment_id == self.selected_segment_id
-                and self.get_current_mode() == "Edit"
-            )
+            id_is_selected = segment.segment_id == selected_id
             range_color = "#ffff00" if id_is_selected else "#00ff00"
 
             # Draw only if within zoom range
@@ -2404,33 +3240,24 @@ class VideoSplitterApp(ctk.CTk):
                     stipple="gray50",
                     outline=range_color,
                     width=2,
+                    tags=("range", f"segment:{segment.segment_id}"),
                 )
 
-        # If start point is set
-        if draw_current and self.start_frame is not None:
-            start_frame = self.start_frame
-            if (
-                start_frame >= visible_start_frame
-                and start_frame <= visible_end_frame
-            ):
-                x = (
-                    (start_frame - visible_start_frame) / visible_range
-                ) * canvas_width
-                seek_canvas.create_line(
-                    x, 0, x, canvas_height, fill="#ffff00", width=3
-                )
+        # Keep marker lines above the rebuilt rectangles
+        seek_canvas.tag_raise("marker")
+        return aggregate
 
-        # Draw current position
-        if (
-            draw_current
-            and self.current_frame >= visible_start_frame
-            and self.current_frame <= visible_end_frame
-        ):
-            x = (
-                (self.current_frame - visible_start_frame) / visible_range
-            ) * canvas_width
+    def move_canvas_marker(self, seek_canvas, tag, x, canvas_height, **kwargs):
+        """Move a vertical marker line, creating or hiding it as needed"""
+        if x is None:
+            seek_canvas.delete(tag)
+            return
+
+        if seek_canvas.find_withtag(tag):
+            seek_canvas.coords(tag, x, 0, x, canvas_height)
+        else:
             seek_canvas.create_line(
-                x, 0, x, canvas_height, fill="#ff0000", width=2
+                x, 0, x, canvas_height, tags=("marker", tag), **kwargs
             )
 
     def update_time_label(self):
@@ -2471,6 +3298,8 @@ class VideoSplitterApp(ctk.CTk):
 
     @skip_if_entry_focused
     def set_start_point(self, event=None):
+        if not self.is_video_ready:
+            return
         if self.get_current_mode() == "Add":
             self.set_new_start_point()
         else:
@@ -2513,7 +3342,7 @@ class VideoSplitterApp(ctk.CTk):
             hover_color="darkgreen",
         )
 
-        self.draw_segment_ranges()
+        self.request_render(("segments", self.selected_layer))
 
     def edit_start_point(self, id=None):
         """Edit the start point to a specific time"""
@@ -2529,7 +3358,6 @@ class VideoSplitterApp(ctk.CTk):
                 t("Warning"), t("Selected segment not found")
             )
             return
-        old_start_time = segment.start_time
 
         selected_segment = self.vp.segments.get_segment_by_time(
             self.current_frame / self.vp.fps,
@@ -2563,20 +3391,25 @@ class VideoSplitterApp(ctk.CTk):
                         )
                         return
 
-        new_start_time = self.current_frame / self.vp.fps
-
-        self.update_segment_time(id, "start", str(new_start_time))
+        new_start_frame = self.current_frame
 
-        if last_segment is not None and (
-            last_segment.end_time > new_start_time
-            or (
-                last_segment.end_time == old_start_time
-                and self.link_boundaries_enabled.get()
-            )
+        changes = [(segment, "start", new_start_frame)]
+        if (
+            last_segment is not None
+            and last_segment.end_frame > new_start_frame
         ):
-            self.update_segment_time(
-                last_segment.segment_id, "end", str(new_start_time)
-            )
+            changes.append((last_segment, "end", new_start_frame))
+        if self.link_boundaries_enabled.get():
+            changes += [
+                (linked_segment, "end", new_start_frame)
+                for linked_segment in self.vp.segments.get_linked_prev_segments(
+                    segment
+                )
+            ]
+
+        changed = self.apply_segment_changes(changes)
+
+        if len(changed) > 1:
             self.status_text.info(
                 t(
                     "Start point updated and previous segment's end point "
@@ -2586,6 +3419,8 @@ class VideoSplitterApp(ctk.CTk):
 
     @skip_if_entry_focused
     def set_end_point(self, event=None):
+        if not self.is_video_ready:
+            return
         if self.get_current_mode() == "Add":
             self.set_new_end_point()
         else:
@@ -2670,7 +3505,6 @@ class VideoSplitterApp(ctk.CTk):
                 t("Warning"), t("Selected segment not found")
             )
             return
-        old_end_time = segment.end_time
 
         selected_segment = self.vp.segments.get_segment_by_time(
             self.current_frame / self.vp.fps,
@@ -2704,20 +3538,25 @@ class VideoSplitterApp(ctk.CTk):
                         )
                         return
 
-        new_end_time = self.current_frame / self.vp.fps
-
-        self.update_segment_time(id, "end", str(new_end_time))
+        new_end_frame = self.current_frame
 
-        if next_section is not None and (
-            next_section.start_time <= new_end_time
-            or (
-                next_section.start_time == old_end_time
-                and self.link_boundaries_enabled.get()
-            )
+        changes = [(segment, "end", new_end_frame)]
+        if (
+            next_section is not None
+            and next_section.start_frame < new_end_frame
         ):
-            self.update_segment_time(
-                next_section.segment_id, "start", str(new_end_time)
-            )
+            changes.append((next_section, "start", new_end_frame))
+        if self.link_boundaries_enabled.get():
+            changes += [
+                (linked_segment, "start", new_end_frame)
+                for linked_segment in self.vp.segments.get_linked_next_segments(
+                    segment
+                )
+            ]
+
+        changed = self.apply_segment_changes(changes)
+
+        if len(changed) > 1:
             self.status_text.info(
                 t(
                     "End point updated and next segment's start point "
@@ -2732,16 +3571,13 @@ class VideoSplitterApp(ctk.CTk):
             fg_color=["#3B8ED0", "#1F6AA5"],  # Reset to default colors
             hover_color=["#36719F", "#144870"],
         )
-        self.draw_segment_ranges()
+        self.request_render(("segments", self.selected_layer))
 
         self.update_length_label(False)
 
     def refresh_all_segments_in_list(self):
-        # Clear existing list
-        for widget in self.list_container.winfo_children():
-            widget.destroy()
-
         if self.vp is None:
+            self.segment_list_view.set_items([])
             return
 
         # Redisplay the list
@@ -2756,137 +3592,226 @@ class VideoSplitterApp(ctk.CTk):
             segment for segment in self.vp.segments if segment.layer in layers
         ]
 
-        for segment in segment_list:
-            self.append_segment_to_segment_list(segment)
+        self.segment_list_view.set_items(segment_list)
 
     def append_segment_to_segment_list(self, segment):
-        row_frame = ctk.CTkFrame(self.list_container)
-        row_frame.grid(
-            row=len(self.list_container.winfo_children()),
-            column=0,
-            sticky="ew",
-            pady=2,
-        )
-        self.update_segment_in_segment_list(row_frame, segment)
+        self.segment_list_view.append(segment)
 
-    def update_segment_in_segment_list(self, row_frame, segment):
-        segment_id = segment.segment_id
-        layer = segment.layer
-        is_selected = segment_id == self.selected_segment_id
+    def create_segment_row(self, parent):
+        """Create a recyclable segment list row (see bind_segment_row)"""
+        row_frame = ctk.CTkFrame(parent)
+        row_frame.segment = None
+        row_frame.editing = None  # (field, segment) of the focused entry
+        row_frame.bound_text = {}
 
         # Number button (jump to start position on click)
         num_btn = ctk.CTkButton(
             row_frame,
-            text=str(segment_id),
+            text="",
             width=30,
-            command=lambda _id=segment_id: self.select_segment_id_with_jump(
-                _id
+            command=lambda: self.select_segment_id_with_jump(
+                row_frame.segment.segment_id
             ),
-            fg_color="#1F6AA5" if is_selected else "gray30",
+            fg_color="gray30",
             hover_color="gray40",
         )
         num_btn.grid(row=0, column=0, padx=2)
 
         # layer label
-        ctk.CTkLabel(row_frame, text=str(layer), width=30).grid(
-            row=0, column=1, padx=2
+        layer_label = ctk.CTkLabel(row_frame, text="", width=30)
+        layer_label.grid(row=0, column=1, padx=2)
+
+        # Start frame thumbnail (filled in lazily)
+        thumbnail_label = ctk.CTkLabel(
+            row_frame, text="", image=self.row_thumbnail_blank
         )
+        thumbnail_label.grid(row=0, column=2, padx=2)
+        row_frame.thumbnail_frame = None
 
         # Title (editable)
         title_entry = ctk.CTkEntry(row_frame)
-        title_entry.insert(0, segment.title)
-        title_entry.grid(row=0, column=2, padx=2, sticky="ew")
-        title_entry.bind(
-            "<FocusOut>",
-            lambda e, _id=segment_id, entry=title_entry: self.update_segment_title(
-                _id, entry.get()
-            ),
-        )
-        title_entry.bind(
-            "<Return>",
-            lambda e, _id=segment_id, entry=title_entry: self.update_segment_title(
-                _id, entry.get()
-            ),
-        )
+        title_entry.grid(row=0, column=3, padx=2, sticky="ew")
 
         # Start time (editable)
         start_entry = ctk.CTkEntry(row_frame, width=90)
-        start_entry.insert(0, utils.format_time(segment.start_time))
-        start_entry.grid(row=0, column=3, padx=2)
-        start_entry.bind(
-            "<FocusOut>",
-            lambda e, _id=segment_id, entry=start_entry: self.update_segment_time(
-                _id, "start", entry.get()
-            ),
-        )
-        start_entry.bind(
-            "<Return>",
-            lambda e, _id=segment_id, entry=start_entry: self.update_segment_time(
-                _id, "start", entry.get()
-            ),
-        )
+        start_entry.grid(row=0, column=4, padx=2)
 
         # End time (editable)
         end_entry = ctk.CTkEntry(row_frame, width=90)
-        end_entry.insert(0, utils.format_time(segment.end_time))
-        end_entry.grid(row=0, column=4, padx=2)
-        end_entry.bind(
-            "<FocusOut>",
-            lambda e, _id=segment_id, entry=end_entry: self.update_segment_time(
-                _id, "end", entry.get()
-            ),
-        )
-        end_entry.bind(
-            "<Return>",
-            lambda e, _id=segment_id, entry=end_entry: self.update_segment_time(
-                _id, "end", entry.get()
-            ),
-        )
+        end_entry.grid(row=0, column=5, padx=2)
+
+        for field, entry in (
+            ("title", title_entry),
+            ("start", start_entry),
+            ("end", end_entry),
+        ):
+            entry.bind(
+                "<FocusIn>",
+                lambda e, field=field: self.on_segment_row_focus_in(
+                    row_frame, field
+                ),
+            )
+            entry.bind(
+                "<FocusOut>",
+                lambda e, field=field: self.commit_segment_row_edit(
+                    row_frame, field, done=True
+                ),
+            )
+            entry.bind(
+                "<Return>",
+                lambda e, field=field: self.commit_segment_row_edit(
+                    row_frame, field
+                ),
+            )
 
         # Duration (auto-calculated)
-        ctk.CTkLabel(
-            row_frame,
-            text=utils.format_time(segment.duration),
-            width=80,
-        ).grid(row=0, column=5, padx=2)
+        duration_label = ctk.CTkLabel(row_frame, text="", width=80)
+        duration_label.grid(row=0, column=6, padx=2)
 
         # Delete button
         delete_btn = ctk.CTkButton(
             row_frame,
             text="×",
             width=30,
-            command=lambda _id=segment_id: self.delete_segment(_id),
+            command=lambda: self.delete_segment(row_frame.segment.segment_id),
             fg_color="transparent",
             hover_color="darkred",
             border_color="darkred",
             border_width=1,
         )
-        delete_btn.grid(row=0, column=6, padx=2)
+        delete_btn.grid(row=0, column=7, padx=2)
 
-        row_frame.grid_columnconfigure(2, weight=1)
+        row_frame.grid_columnconfigure(3, weight=1)
 
-        segment.ui = {
+        row_frame.widgets = {
             "frame": row_frame,
             "num_btn": num_btn,
+            "layer_label": layer_label,
+            "thumbnail_label": thumbnail_label,
             "title_entry": title_entry,
             "start_entry": start_entry,
             "end_entry": end_entry,
+            "duration_label": duration_label,
         }
+        return row_frame
 
-    def refresh_segment_in_list(self, segment):
-        ui = segment.ui
-        if ui is None:
-            raise Exception("No UI found for segment")
+    def bind_segment_row(self, row_frame, segment):
+        """Show a segment in a recycled row, updating widgets in place"""
+        widgets = row_frame.widgets
+        is_selected = segment.segment_id == self.selected_segment_id
+
+        widgets["num_btn"].configure(
+            text=str(segment.segment_id),
+            fg_color="#1F6AA5" if is_selected else "gray30",
+            hover_color="#36719F" if is_selected else "gray40",
+        )
+        widgets["layer_label"].configure(text=str(segment.layer))
+
+        bound_text = {
+            "title": segment.title,
+            "start": utils.format_time(segment.start_time),
+            "end": utils.format_time(segment.end_time),
+        }
+        for field, text in bound_text.items():
+            entry = widgets[f"{field}_entry"]
+            entry.delete(0, tk.END)
+            entry.insert(0, text)
+
+        widgets["duration_label"].configure(
+            text=utils.format_time(segment.duration)
+        )
+
+        row_frame.segment = segment
+        row_frame.bound_text = bound_text
+        segment.ui = widgets
+
+        self.show_row_thumbnail(row_frame)
+
+    def unbind_segment_row(self, row_frame):
+        """Release a row before it is recycled for another segment"""
+        segment = row_frame.segment
+        if row_frame.editing is not None:
+            # Commit the pending edit to the segment it was typed for
+            field, _ = row_frame.editing
+            self.commit_segment_row_edit(row_frame, field, done=True)
+        if segment is not None:
+            del segment.ui
+        row_frame.segment = None
+
+    def show_row_thumbnail(self, row_frame):
+        """Show the cached start frame thumbnail of a row, or queue it"""
+        segment = row_frame.segment
+        frame = segment.start_frame if segment is not None else None
+        image = None
+        if frame is not None and self.row_thumbnail_cache is not None:
+            image = self.row_thumbnail_images.get(frame)
+            if image is None:
+                thumbnail = self.row_thumbnail_cache.get(frame)
+                if thumbnail is not None:
+                    if len(self.row_thumbnail_images) >= 512:
+                        self.row_thumbnail_images = {}
+                    image = ctk.CTkImage(
+                        Image.fromarray(thumbnail),
+                        size=self.row_thumbnail_size,
+                    )
+                    self.row_thumbnail_images[frame] = image
+                elif not self.row_thumbnail_request_pending:
+                    # Batch the visible rows into one sorted decoding pass
+                    self.row_thumbnail_request_pending = True
+                    self.after_idle(self.request_row_thumbnails)
+
+        shown_frame = frame if image is not None else None
+        if row_frame.thumbnail_frame != shown_frame:
+            row_frame.widgets["thumbnail_label"].configure(
+                image=image or self.row_thumbnail_blank
+            )
+            row_frame.thumbnail_frame = shown_frame
+
+    def request_row_thumbnails(self):
+        """Decode the missing thumbnails of the visible rows"""
+        self.row_thumbnail_request_pending = False
+        if self.row_thumbnail_generator is None:
+            return
+        frames = [
+            row.segment.start_frame
+            for row in self.segment_list_view.rows
+            if row.segment is not None
+        ]
+        self.row_thumbnail_generator.request(
+            frames,
+            callback=lambda frame: self.events.post(
+                self.update_row_thumbnails, key="row_thumbnails"
+            ),
+        )
+
+    def update_row_thumbnails(self):
+        for row_frame in self.segment_list_view.rows:
+            self.show_row_thumbnail(row_frame)
+
+    def on_segment_row_focus_in(self, row_frame, field):
+        row_frame.editing = (field, row_frame.segment)
+
+    def commit_segment_row_edit(self, row_frame, field, done=False):
+        """Apply an edited entry of a row to its segment if it changed"""
+        if row_frame.editing is None or row_frame.editing[0] != field:
+            return
+        segment = row_frame.editing[1]
+        if done:
+            row_frame.editing = None
+        if segment is None or segment is not row_frame.segment:
+            return
 
-        frame = ui["frame"]
-        if not frame.winfo_exists():
-            raise Exception("Segment UI frame does not exist")
+        value = row_frame.widgets[f"{field}_entry"].get()
+        if value == row_frame.bound_text.get(field):
+            return
 
-        # Clear all ui inner frame
-        for widget in frame.winfo_children():
-            widget.destroy()
+        if field == "title":
+            self.update_segment_title(segment.segment_id, value)
+        else:
+            self.update_segment_time(segment.segment_id, field, value)
 
-        self.update_segment_in_segment_list(frame, segment)
+    def refresh_segment_in_list(self, segment):
+        self.segment_list_view.refresh_item(segment)
 
     def update_segment_title(self, id, title):
         """Update title"""
@@ -2895,10 +3820,7 @@ class VideoSplitterApp(ctk.CTk):
             # Remove characters not allowed in filenames
             safe_title = re.sub(r'[\\/:*?"<>|]', "", title.strip())
             segment.title = safe_title
-            try:
-                self.refresh_segment_in_list(segment)
-            except:
-                self.refresh_all_segments_in_list()
+            self.refresh_segment_in_list(segment)
 
     def jump_to_segment(self, id: int, position: str | None = None):
         """Jump to the start or end position of the specified segment.
@@ -2963,16 +3885,13 @@ class VideoSplitterApp(ctk.CTk):
         )
 
         # Stop if playing
-        if self.is_playing:
-            self.is_playing = False
-            self.play_button.configure(text="▶ " + t("Play"))
+        self.pause_video()
 
         # Update display
         self.update_zoom_range()
-        self.update_frame()
-        self.update_seekbar_time_labels()
-        self.update_time_label()
-        self.draw_all_segment_ranges()
+        self.request_render(
+            "frame", "seekbar_labels", "time_label", "segments"
+        )
 
     def update_segment_time(self, id, time_type, time_str):
         """Parse time string and update segment list"""
@@ -2995,40 +3914,56 @@ class VideoSplitterApp(ctk.CTk):
                     messagebox.showwarning(
                         t("Warning"), t("Start time must be before end time")
                     )
-                    try:
-                        self.refresh_segment_in_list(segment)
-                    except:
-                        self.refresh_all_segments_in_list()
+                    self.refresh_segment_in_list(segment)
                     return
-                segment.start_time = total_seconds
+                self.vp.segments.set_segment_frames(
+                    segment, start_frame=round(total_seconds * self.vp.fps)
+                )
             else:  # end
                 if total_seconds <= segment.start_time:
                     messagebox.showwarning(
                         t("Warning"), t("End time must be after start time")
                     )
-                    try:
-                        self.refresh_segment_in_list(segment)
-                    except:
-                        self.refresh_all_segments_in_list()
+                    self.refresh_segment_in_list(segment)
                     return
-                segment.end_time = total_seconds
+                self.vp.segments.set_segment_frames(
+                    segment, end_frame=round(total_seconds * self.vp.fps)
+                )
 
             # Update display
-            try:
-                self.refresh_segment_in_list(segment)
-            except:
-                self.refresh_all_segments_in_list()
-            self.draw_segment_ranges(segment.layer)
+            self.refresh_segment_in_list(segment)
+            self.request_render(("segments", segment.layer))
 
         except (ValueError, IndexError):
             messagebox.showwarning(
                 t("Warning"),
                 t("Time format is incorrect. Format: mm:ss.mmm or mm:ss"),
             )
-            try:
-                self.refresh_segment_in_list(segment)
-            except:
-                self.refresh_all_segments_in_list()
+            self.refresh_segment_in_list(segment)
+
+    def apply_segment_changes(self, changes):
+        """Apply boundary changes as one batch and refresh affected rows.
+
+        Args:
+            changes (list): (segment, "start" | "end", frame) tuples
+
+        Returns:
+            list: The changed segments (empty if the batch was rejected)
+        """
+        try:
+            changed = self.vp.segments.apply_boundary_changes(changes)
+        except ValueError as e:
+            messagebox.showwarning(t("Warning"), t(str(e)))
+            return []
+
+        for segment in changed:
+            self.refresh_segment_in_list(segment)
+
+        self.request_render(
+            *(("segments", segment.layer) for segment in changed)
+        )
+
+        return changed
 
     def delete_segment(self, id):
         segment = self.vp.segments.get_segment_by_id(id)
@@ -3042,7 +3977,7 @@ class VideoSplitterApp(ctk.CTk):
         if self.selected_segment_id == id:
             self.unselect_segment_id()
 
-        self.draw_segment_ranges(layer, layer == self.selected_layer)
+        self.request_render(("segments", layer))
 
         if len(self.vp.segments) == 0:
             self.execute_split_multiple_button.configure(state="disabled")
@@ -3075,8 +4010,7 @@ class VideoSplitterApp(ctk.CTk):
                 )
 
                 self.refresh_all_segments_in_list()
-                for layer in layers:
-                    self.draw_segment_ranges(layer)
+                self.request_render(*(("segments", layer) for layer in layers))
                 self.execute_split_multiple_button.configure(state="disabled")
                 self.execute_split_single_button.configure(state="disabled")
 
@@ -3094,6 +4028,133 @@ class VideoSplitterApp(ctk.CTk):
                 self.refresh_all_segments_in_list()
                 self.status_text.info(t("Segment IDs reset"))
 
+    def open_chunk_dialog(self):
+        if self.vp is None:
+            return
+
+        chunk_window = ChunkDialog(self)
+        chunk_window.grab_set()
+
+    def add_chunks(
+        self, layer, chunk_frames, align_keyframes=False, replace=False
+    ):
+        """Fill a layer with back-to-back chunks of chunk_frames frames"""
+        count = len(self.vp.segments.filter_by_layers([layer]))
+        if (
+            replace
+            and count > 0
+            and not messagebox.askyesno(
+                t("Confirm"),
+                t("Replace the [n] segments in layer [layer]?")
+                .replace("[n]", str(count))
+                .replace("[layer]", str(layer)),
+            )
+        ):
+            return
+
+        vp = self.vp
+        if not align_keyframes:
+            self.apply_chunks(vp, layer, chunk_frames, None, replace)
+            return
+
+        self.status_text.info(f"{t('Scanning keyframes')}...", duration=0)
+
+        def scan():
+            # Reuses the persisted index of the source when there is one
+            index = decoder.FrameIndex.for_video(vp.video_path)
+            keyframes = index.keyframes if index is not None else []
+            self.events.post(
+                self.apply_chunks, vp, layer, chunk_frames, keyframes, replace
+            )
+
+        threading.Thread(target=scan, daemon=True).start()
+
+    def apply_chunks(self, vp, layer, chunk_frames, keyframes, replace):
+        # Keyframes of a video that has been closed meanwhile are dropped
+        if vp is not self.vp:
+            return
+
+        if keyframes is not None and not keyframes:
+            self.status_text.warning(
+                t("Keyframes not available. Chunks are not aligned.")
+            )
+        segments = self.vp.segments.add_chunks(
+            layer, chunk_frames, keyframes=keyframes, replace=replace
+        )
+
+        self.refresh_all_segments_in_list()
+        self.request_render("segments")
+        if len(self.vp.segments) > 0:
+            self.execute_split_multiple_button.configure(state="normal")
+            self.execute_split_single_button.configure(state="normal")
+        if keyframes is None or keyframes:
+            self.status_text.info(
+                t("[n] chunks added.").replace("[n]", str(len(segments)))
+            )
+
+    def import_segments(self):
+        """Import segments from a CSV, EDL, SRT or WebVTT cue list"""
+        if self.vp is None:
+            messagebox.showwarning(t("Warning"), t("No video loaded"))
+            return
+
+        file_path = filedialog.askopenfilename(
+            title=t("Import Segments"),
+            filetypes=[
+                (t("Cue list"), "*.csv *.edl *.srt *.vtt"),
+                (t("Select"), "*.*"),
+            ],
+        )
+        if not file_path:
+            return
+
+        try:
+            records = segment_import.read_segment_records(
+                file_path, self.vp.fps, layer=self.selected_layer
+            )
+        except (OSError, ValueError) as e:
+            messagebox.showerror(
+                t("Error"), f"{t("Segment import failed")}: {str(e)}"
+            )
+            return
+
+        invalid, overlapping = segment_import.validate_segment_records(
+            records,
+            self.vp.total_frames,
+            existing=[
+                (segment.layer, segment.start_frame, segment.end_frame)
+                for segment in self.vp.segments
+            ],
+            layer_count=len(self.layers),
+        )
+        rejected = invalid | overlapping
+        if rejected.any():
+            if not messagebox.askyesno(
+                t("Confirm"),
+                t(
+                    "[invalid] rows are out of range and [overlap] rows overlap."
+                )
+                .replace("[invalid]", str(int(invalid.sum())))
+                .replace("[overlap]", str(int(overlapping.sum())))
+                + "\n"
+                + t("Import the remaining rows?"),
+            ):
+                return
+
+        accepted = [
+            record for record, bad in zip(records, rejected) if not bad
+        ]
+        self.vp.segments.extend_records(accepted)
+
+        self.refresh_all_segments_in_list()
+        self.request_render("segments")
+        if len(self.vp.segments) > 0:
+            self.execute_split_multiple_button.configure(state="normal")
+            self.execute_split_single_button.configure(state="normal")
+        self.status_text.info(
+            t("[n] segments imported.").replace("[n]", str(len(accepted)))
+        )
+
     def select_output_folder(self):
         folder = filedialog.askdirectory(title=t("Select output folder"))
         if folder:
@@ -3112,50 +4173,101 @@ class VideoSplitterApp(ctk.CTk):
             else:
                 layers = [self.selected_layer]
 
-        count_items = len(self.vp.segments.filter_by_layers(layers))
+        # Read the export set from the widgets here, on the Tk thread
+        try:
+            segments = self.get_export_segments(layers)
+        except ValueError as e:
+            messagebox.showwarning(t("Warning"), str(e))
+            return
 
-        if count_items == 0:
+        if len(segments) == 0:
             messagebox.showwarning(t("Warning"), t("No segment settings"))
             return
 
         self.execute_split_multiple_button.configure(state="disabled")
         threading.Thread(
-            target=self.split_multiple_video_thread,
-            args=(layers,),
+            target=self.split_video_thread,
+            args=(segments, self.execute_split_multiple_button),
             daemon=True,
         ).start()
 
-    def split_multiple_video_thread(self, layers):
-        if layers is None:
-            layers = self.layers
+    def get_export_segments(self, layers):
+        """Get the segments to export for the selected export set.
 
-        try:
+        Derived sets use the layers typed in the export layer entry, or
+        the listed layers when it is empty. "Union" and "Intersection"
+        combine them, "Difference" removes the others from the first one
+        (e.g. "1,2" is layer 1 minus layer 2). Derived sets are merged
+        ranges, so overlapping material is encoded only once.
 
-            def progress_callback(i, total):
-                self.progress_label.configure(
-                    text=f"{t("Progress")}: {i+1}/{total}"
+        Raises:
+            ValueError: If the export layer entry is not a list of layers
+        """
+        operation = self.export_set_options.get(
+            self.export_set_selector.get(), "segments"
+        )
+        if operation == "segments":
+            return self.vp.segments.filter_by_layers(layers)
+        layers = self.get_export_layers(layers)
+        if operation == "difference":
+            return self.vp.segments.derive_layer(
+                "difference", layers[:1], layers[1:]
+            )
+        return self.vp.segments.derive_layer(operation, layers)
+
+    def get_export_layers(self, layers):
+        """Layers typed in the export layer entry, in the order typed"""
+        text = self.export_layers_entry.get().strip()
+        if not text:
+            return list(layers)
+
+        chosen = []
+        for value in text.split(","):
+            value = value.strip()
+            if not value:
+                continue
+            if not value.isdigit() or int(value) not in self.layers:
+                raise ValueError(
+                    t("Invalid layer: [layer]").replace("[layer]", value)
                 )
-                self.progress.set(i / total if total else 0)
-
-            filtered_segment_list = self.vp.segments.filter_by_layers(layers)
+            if int(value) not in chosen:
+                chosen.append(int(value))
+        return chosen
 
+    def split_video_thread(self, segments, button):
+        """Export segments; the UI is updated only through the event bus"""
+        error = None
+        try:
             video_utils.split_video(
                 self.vp.video_path,
-                filtered_segment_list,
+                segments,
                 self.vp.output_path,
-                progress_callback=progress_callback,
-                codec=config.get("DEFAULT", "codec"),
+                progress_callback=lambda i, total: self.events.post(
+                    self.show_split_progress, i, total, key="split_progress"
+                ),
+                codec=self.get_export_codec(),
                 backend=config.get("DEFAULT", "backend"),
             )
-            self.progress.set(1.0)
-            self.progress_label.configure(text=t("Complete"))
-            messagebox.showinfo(t("Done"), t("Video splitting completed"))
         except Exception as e:
-            messagebox.showerror(
-                t("Error"), f"{t("Error occurred")}: {str(e)}"
-            )
+            error = e
+        self.events.post(self.on_split_finished, button, error)
+
+    def show_split_progress(self, i, total):
+        self.progress_label.configure(text=f"{t("Progress")}: {i+1}/{total}")
+        self.progress.set(i / total if total else 0)
+
+    def on_split_finished(self, button, error):
+        try:
+            if error is None:
+                self.progress.set(1.0)
+                self.progress_label.configure(text=t("Complete"))
+                messagebox.showinfo(t("Done"), t("Video splitting completed"))
+            else:
+                messagebox.showerror(
+                    t("Error"), f"{t("Error occurred")}: {str(error)}"
+                )
         finally:
-            self.execute_split_multiple_button.configure(state="normal")
+            button.configure(state="normal")
 
     def execute_split_single(self):
         if not self.vp.output_path:
@@ -3185,36 +4297,11 @@ class VideoSplitterApp(ctk.CTk):
 
         self.execute_split_single_button.configure(state="disabled")
         threading.Thread(
-            target=self.split_single_video_thread, args=(segment,), daemon=True
+            target=self.split_video_thread,
+            args=([segment], self.execute_split_single_button),
+            daemon=True,
         ).start()
 
-    def split_single_video_thread(self, segment):
-        try:
-
-            def progress_callback(i, total):
-                self.progress_label.configure(
-                    text=f"{t("Progress")}: {i+1}/{total}"
-                )
-                self.progress.set(i / total if total else 0)
-
-            video_utils.split_video(
-                self.vp.video_path,
-                [segment],
-                self.vp.output_path,
-                progress_callback=progress_callback,
-                codec=config.get("DEFAULT", "codec"),
-                backend=config.get("DEFAULT", "backend"),
-            )
-            self.progress.set(1.0)
-            self.progress_label.configure(text=t("Complete"))
-            messagebox.showinfo(t("Done"), t("Video splitting completed"))
-        except Exception as e:
-            messagebox.showerror(
-                t("Error"), f"{t("Error occurred")}: {str(e)}"
-            )
-        finally:
-            self.execute_split_single_button.configure(state="normal")
-
     def start_resize(self, event):
         """Start resizing"""
         self.resize_start_x = event.x_root
@@ -3255,8 +4342,25 @@ class VideoSplitterApp(ctk.CTk):
                 self.draw_all_segment_ranges()
 
     def on_closing(self):
-        if self.vp is not None and self.vp.cap is not None:
-            self.vp.cap.release()
+        if self.vp is not None and self.vp.reader is not None:
+            print(f"[INFO]Seek planner: {self.vp.reader.planner.summary()}")
+        if self.frame_store_cancel_event is not None:
+            self.frame_store_cancel_event.set()
+        if self.head_preload_cancel_event is not None:
+            self.head_preload_cancel_event.set()
+        if self.proxy_cancel_event is not None:
+            self.proxy_cancel_event.set()
+        if self.playback_engine is not None:
+            self.playback_engine.close()
+        self.events.stop()
+        if self.thumbnail_generator is not None:
+            self.thumbnail_generator.shutdown()
+        if self.hover_thumbnail_generator is not None:
+            self.hover_thumbnail_generator.shutdown()
+        if self.row_thumbnail_generator is not None:
+            self.row_thumbnail_generator.shutdown()
+        if self.vp is not None and self.vp.reader is not None:
+            self.vp.reader.release()
         self.destroy()
 
     @skip_if_entry_focused
@@ -3311,10 +4415,9 @@ class VideoSplitterApp(ctk.CTk):
             return
 
         try:
-            self.vp = VideoProject.load(file_path)
-
-            # Load video
-            self.reset_video_controls()
+            self.pause_video()
+            self.vp = VideoProject.load(file_path, lazy=True)
+            self.reset_thumbnails()
 
             # Restore segment list
             self.refresh_all_segments_in_list()
@@ -3323,16 +4426,63 @@ class VideoSplitterApp(ctk.CTk):
             # Reset start point
             self.reset_start_point()
 
-            if len(self.vp.segments) > 0:
-                self.execute_split_multiple_button.configure(state="normal")
-                self.execute_split_single_button.configure(state="normal")
-
-            messagebox.showinfo(t("Done"), t("Project file loaded"))
-
         except Exception as e:
             messagebox.showerror(
                 t("Error"), f"{t("Project load failed")}: {str(e)}"
             )
+            return
+
+        if self.vp.is_video_open:
+            self.on_project_video_opened(self.vp)
+            return
+
+        # Open the video in the background; the list is already usable.
+        # The controls stay disabled until the probed fps and frame count
+        # are known, since attach_video may move the segments.
+        self.disable_video_controls()
+        self.status_text.info(t("Opening video..."), duration=0)
+        vp = self.vp
+
+        def probe_video():
+            try:
+                video = vp.probe_video()
+            except Exception as e:
+                self.events.post(self.on_project_video_failed, vp, e)
+            else:
+                self.events.post(self.on_project_video_opened, vp, video)
+
+        threading.Thread(target=probe_video, daemon=True).start()
+
+    def on_project_video_opened(self, vp, video=None):
+        if vp is not self.vp:
+            if video is not None:
+                video[0].release()
+            return
+        if video is not None:
+            vp.attach_video(*video)
+        self.status_text.clear()
+        self.video_cache.clear()
+        self.video_cache_for_head.clear()
+        self.preload_head_frames()
+        self.reset_video_controls()
+
+        # The probed metadata may have moved the segments
+        self.refresh_all_segments_in_list()
+
+        if len(self.vp.segments) > 0:
+            self.execute_split_multiple_button.configure(state="normal")
+            self.execute_split_single_button.configure(state="normal")
+
+        messagebox.showinfo(t("Done"), t("Project file loaded"))
+
+    def on_project_video_failed(self, vp, error):
+        if vp is not self.vp:
+            return
+        self.status_text.clear()
+        self.disable_video_controls()
+        messagebox.showerror(
+            t("Error"), t("Failed to load video file.") + f"\n{str(error)}"
+        )
 
 
 if __name__ == "__main__":
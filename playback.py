@@ -0,0 +1,164 @@
+import math
+import threading
+import time
+
+import decoder
+import video_utils
+
+playback_speeds = [-8, -4, -2, -1, -0.5, -0.25, 0.25, 0.5, 1, 2, 4, 8]
+
+
+def display_step(speed, fps, max_display_fps):
+    """Frames advanced per displayed frame so that no more than
+    max_display_fps frames are shown per second"""
+    return max(1, math.ceil(abs(speed) * fps / max_display_fps))
+
+
+class PlaybackEngine:
+    """
+    Play a video at a given speed from a wall clock.
+    Frame k of the playback is shown at start + k * step frames, when
+    k * step / (fps * |speed|) seconds have passed. At high speeds the
+    frames between two shown frames are skipped with grab(). If decoding
+    falls behind the clock, late frames are dropped instead of slowing
+    the playback down. Reverse playback decodes a block from the
+    keyframe before the target forward and hands out the buffered frames
+    backwards, so each GOP is decoded once.
+    The engine owns its capture. Frames are delivered from the playback
+    thread through on_frame(frame, image).
+    """
+
+    def __init__(
+        self,
+        video_path,
+        fps,
+        total_frames,
+        on_frame,
+        on_end=None,
+        index=None,
+        backend="opencv",
+        max_display_fps=30,
+        max_buffer_frames=64,
+    ):
+        self.video_path = video_path
+        self.fps = fps
+        self.total_frames = total_frames
+        self.on_frame = on_frame
+        self.on_end = on_end
+        self.index = index
+        self.backend = backend
+        self.max_display_fps = max_display_fps
+        # Upper bound of frames held by a reverse block
+        self.max_buffer_frames = max_buffer_frames
+
+        self.reader = None
+        self._lock = threading.Lock()
+        self._stop_event = None
+
+    @property
+    def is_playing(self):
+        return self._stop_event is not None and not self._stop_event.is_set()
+
+    def start(self, frame, speed):
+        """
+        Start playing after frame. A running playback is stopped first.
+        Args:
+            frame (int): Frame shown when playback starts
+            speed (float): Playback speed, negative for reverse
+        """
+        self.stop()
+        if speed == 0:
+            return
+        stop_event = threading.Event()
+        self._stop_event = stop_event
+        threading.Thread(
+            target=self._run, args=(frame, speed, stop_event), daemon=True
+        ).start()
+
+    def stop(self):
+        """Stop the playback without waiting for the thread"""
+        if self._stop_event is not None:
+            self._stop_event.set()
+            self._stop_event = None
+
+    def close(self):
+        """Stop the playback and release the capture"""
+        self.stop()
+        with self._lock:
+            if self.reader is not None:
+                self.reader.cap.release()
+                self.reader = None
+
+    def _read(self, frame):
+        if self.reader is None:
+            self.reader = decoder.FrameReader(
+                video_utils.open_capture(self.video_path, self.backend)
+            )
+        self.reader.index = self.index
+        ret, image = self.reader.read(frame)
+        return image if ret else None
+
+    def _decode_block(self, frame, start_frame, step):
+        """Decode the shown frames of the reverse block ending at frame"""
+        if self.index is not None:
+            first = self.index.keyframe_before(frame)
+        else:
+            first = 0
+        first = max(first, frame - (self.max_buffer_frames - 1) * step, 0)
+
+        # Shown frames are start_frame - k * step, and the last is frame 0
+        offset = (start_frame - first) % step
+        frames = list(range(first + offset, frame + 1, step))
+        if first == 0 and (not frames or frames[0] != 0):
+            frames.insert(0, 0)
+
+        block = {}
+        for f in frames:
+            image = self._read(f)
+            if image is not None:
+                block[f] = image
+        return block
+
+    def _run(self, start_frame, speed, stop_event):
+        direction = 1 if speed > 0 else -1
+        step = display_step(speed, self.fps, self.max_display_fps)
+        interval = step / (self.fps * abs(speed))
+        last_frame = self.total_frames - 1 if direction > 0 else 0
+        block = {}
+
+        started = time.perf_counter()
+        k = 1
+        while not stop_event.is_set():
+            # Drop the frames whose time has already passed
+            k = max(k, int((time.perf_counter() - started) / interval))
+            frame = start_frame + direction * k * step
+            is_last = frame * direction >= last_frame * direction
+            if is_last:
+                frame = last_frame
+
+            with self._lock:
+                if stop_event.is_set():
+                    return
+                if direction > 0:
+                    image = self._read(frame)
+                else:
+                    if frame not in block:
+                        block = self._decode_block(frame, start_frame, step)
+                    image = block.pop(frame, None)
+                    # Frames after this one are never shown again
+                    for f in [f for f in block if f > frame]:
+                        del block[f]
+
+            delay = started + k * interval - time.perf_counter()
+            if delay > 0 and stop_event.wait(delay):
+                return
+            if stop_event.is_set():
+                return
+            if image is not None:
+                self.on_frame(frame, image)
+            if is_last or image is None:
+                stop_event.set()
+                if self.on_end is not None:
+                    self.on_end()
+                return
+            k += 1
@@ -0,0 +1,253 @@
+import csv
+import os
+import re
+
+import utils
+
+# A segment record is a (layer, title, start_frame, end_frame) tuple.
+
+timecode_pattern = re.compile(r"^(\d+):(\d\d):(\d\d)([:;.,])(\d+)$")
+edl_event_pattern = re.compile(r"^\d+\s")
+cue_time_pattern = re.compile(r"^\s*([\d:.,]+)\s*-->\s*([\d:.,]+)")
+
+
+def timecode_to_frame(timecode, fps):
+    """Convert an SMPTE timecode (hh:mm:ss:ff, ';' for drop-frame) to frames"""
+    match = timecode_pattern.match(timecode.strip())
+    if match is None:
+        raise ValueError(f"Invalid timecode: {timecode}")
+    hours, minutes, seconds, separator, frames = match.groups()
+    hours, minutes, seconds, frames = (
+        int(hours),
+        int(minutes),
+        int(seconds),
+        int(frames),
+    )
+    nominal_fps = round(fps)
+    frame = ((hours * 60 + minutes) * 60 + seconds) * nominal_fps + frames
+
+    if separator in (";", ","):
+        # Drop-frame: skip frame numbers 0 and 1 (2 and 3 at 60 fps) of
+        # every minute except every tenth minute.
+        drop = round(nominal_fps / 15)
+        total_minutes = hours * 60 + minutes
+        frame -= drop * (total_minutes - total_minutes // 10)
+    return frame
+
+
+def _time_to_frame(value, fps):
+    return round(utils.time_str_to_sec(value.strip().replace(",", ".")) * fps)
+
+
+def iter_csv_records(file, fps, layer=1):
+    """
+    Parse a CSV cue list row by row.
+    The header must contain start/end columns, either as times
+    ("start", "end", "start_time", "end_time", "in", "out") or as frame
+    numbers ("start_frame", "end_frame"). "title" and "layer" are optional.
+    Args:
+        file (Iterable[str]): Open text file or line iterable
+        fps (float): Video frame rate
+        layer (int): Layer used when the row has no layer column
+    Yields:
+        tuple: (layer, title, start_frame, end_frame)
+    """
+    reader = csv.DictReader(file)
+    if reader.fieldnames is None:
+        return
+    fields = {name.strip().lower(): name for name in reader.fieldnames}
+
+    def column(*names):
+        for name in names:
+            if name in fields:
+                return fields[name]
+        return None
+
+    start_frame_col = column("start_frame")
+    end_frame_col = column("end_frame")
+    start_col = column("start", "start_time", "in")
+    end_col = column("end", "end_time", "out")
+    title_col = column("title", "name")
+    layer_col = column("layer")
+
+    if not (start_frame_col or start_col) or not (end_frame_col or end_col):
+        raise ValueError("CSV must contain start and end columns")
+
+    for row in reader:
+        if start_frame_col:
+            start_frame = int(row[start_frame_col])
+        else:
+            start_frame = _time_to_frame(row[start_col], fps)
+        if end_frame_col:
+            end_frame = int(row[end_frame_col])
+        else:
+            end_frame = _time_to_frame(row[end_col], fps)
+        row_layer = (
+            int(row[layer_col]) if layer_col and row[layer_col] else layer
+        )
+        title = row[title_col].strip() if title_col else None
+        yield (row_layer, title or None, start_frame, end_frame)
+
+
+def iter_edl_records(file, fps, layer=1):
+    """
+    Parse the events of a CMX3600 EDL.
+    The source in/out timecodes are used, and a following
+    "* FROM CLIP NAME:" comment becomes the title.
+    Args:
+        file (Iterable[str]): Open text file or line iterable
+        fps (float): Video frame rate
+        layer (int): Layer of the imported segments
+    Yields:
+        tuple: (layer, title, start_frame, end_frame)
+    """
+    pending = None
+    for line in file:
+        line = line.strip()
+        if edl_event_pattern.match(line):
+            if pending is not None:
+                yield pending
+            fields = line.split()
+            if len(fields) < 8:
+                raise ValueError(f"Invalid EDL event: {line}")
+            # The last four fields are source in/out and record in/out
+            source_in, source_out = fields[-4], fields[-3]
+            pending = (
+                layer,
+                None,
+                timecode_to_frame(source_in, fps),
+                timecode_to_frame(source_out, fps),
+            )
+        elif pending is not None and line.upper().startswith(
+            "* FROM CLIP NAME:"
+        ):
+            title = line.split(":", 1)[1].strip()
+            pending = (pending[0], title or None, pending[2], pending[3])
+    if pending is not None:
+        yield pending
+
+
+def iter_cue_records(file, fps, layer=1):
+    """
+    Parse SRT or WebVTT cues. The first text line of a cue is its title.
+    Args:
+        file (Iterable[str]): Open text file or line iterable
+        fps (float): Video frame rate
+        layer (int): Layer of the imported segments
+    Yields:
+        tuple: (layer, title, start_frame, end_frame)
+    """
+    pending = None
+    for line in file:
+        line = line.strip()
+        match = cue_time_pattern.match(line)
+        if match:
+            if pending is not None:
+                yield pending
+            pending = (
+                layer,
+                None,
+                _time_to_frame(match.group(1), fps),
+                _time_to_frame(match.group(2), fps),
+            )
+        elif not line:
+            if pending is not None:
+                yield pending
+                pending = None
+        elif pending is not None and pending[1] is None:
+            pending = (pending[0], line, pending[2], pending[3])
+    if pending is not None:
+        yield pending
+
+
+record_readers = {
+    ".csv": iter_csv_records,
+    ".edl": iter_edl_records,
+    ".srt": iter_cue_records,
+    ".vtt": iter_cue_records,
+}
+
+
+def read_segment_records(file_path, fps, layer=1):
+    """
+    Read segment records from a CSV, EDL, SRT or WebVTT file.
+    Args:
+        file_path (str): Path to the cue list
+        fps (float): Video frame rate
+        layer (int): Default layer of the imported segments
+    Returns:
+        list: (layer, title, start_frame, end_frame) tuples
+    """
+    extension = os.path.splitext(file_path)[1].lower()
+    reader = record_readers.get(extension)
+    if reader is None:
+        raise ValueError(f"Unsupported file type: {extension}")
+    with open(file_path, "r", encoding="utf-8-sig", newline="") as f:
+        return list(reader(f, fps, layer))
+
+
+def validate_segment_records(
+    records, total_frames, existing=None, layer_count=None
+):
+    """
+    Validate segment records in bulk.
+    Overlaps are detected per layer on sorted arrays. A record overlapping
+    an earlier record of the same layer, or an existing segment of the
+    same layer, is flagged; the earliest record of an overlapping run is
+    kept.
+    Args:
+        records (list): (layer, title, start_frame, end_frame) tuples
+        total_frames (int): Total number of frames of the video
+        existing (list, optional): (layer, start_frame, end_frame) tuples of
+            segments already in the project
+        layer_count (int, optional): Number of layers of the project, layers
+            are numbered from 1. Records on other layers are invalid.
+    Returns:
+        tuple: (invalid, overlapping) boolean arrays aligned with records
+    """
+    import numpy as np
+
+    count = len(records)
+    layers = np.fromiter((r[0] for r in records), dtype=np.int64, count=count)
+    starts = np.fromiter((r[2] for r in records), dtype=np.int64, count=count)
+    ends = np.fromiter((r[3] for r in records), dtype=np.int64, count=count)
+
+    invalid = (starts < 0) | (ends > total_frames) | (starts >= ends)
+    if layer_count is not None:
+        invalid |= (layers < 1) | (layers > layer_count)
+    overlapping = np.zeros(count, dtype=bool)
+
+    existing = existing or []
+    existing_layers = np.array([e[0] for e in existing], dtype=np.int64)
+    existing_starts = np.array([e[1] for e in existing], dtype=np.int64)
+    existing_ends = np.array([e[2] for e in existing], dtype=np.int64)
+
+    valid = np.flatnonzero(~invalid)
+    for layer in np.unique(layers[valid]):
+        indices = valid[layers[valid] == layer]
+        order = indices[np.argsort(starts[indices], kind="stable")]
+
+        # Overlaps among the records of this layer
+        if len(order) > 1:
+            running_end = np.maximum.accumulate(ends[order])
+            overlapping[order[1:]] = starts[order[1:]] < running_end[:-1]
+
+        # Overlaps with existing segments of this layer
+        same_layer = existing_layers == layer
+        if not same_layer.any():
+            continue
+        existing_order = np.argsort(existing_starts[same_layer])
+        key_starts = existing_starts[same_layer][existing_order]
+        key_ends = np.maximum.accumulate(
+            existing_ends[same_layer][existing_order]
+        )
+        # The existing segment starting last before each record's end
+        before = np.searchsorted(key_starts, ends[order], side="left") - 1
+        has_before = before >= 0
+        hits = np.zeros(len(order), dtype=bool)
+        hits[has_before] = (
+            key_ends[before[has_before]] > starts[order][has_before]
+        )
+        overlapping[order] |= hits
+
+    return invalid, overlapping
@@ -0,0 +1,103 @@
+"""
+Measure how long the application takes to start.
+
+Every measurement runs in a fresh interpreter so that nothing is cached in
+sys.modules. The import of main is always measured; with --window the time
+until the main window has been drawn is measured as well, which needs a
+display.
+
+    python startup_benchmark.py [--window] [--runs N]
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+# Targets on the kiosk machines, in seconds
+import_target = 0.5
+window_target = 1.5
+
+# Modules that must not be loaded before a video is opened. PIL is not
+# listed: customtkinter imports it at import time for CTkImage, so it is
+# loaded with the GUI toolkit whatever main does.
+heavy_modules = ("cv2", "numpy")
+
+import_script = """
+import sys, time
+start = time.perf_counter()
+import main
+print(time.perf_counter() - start)
+print(",".join(m for m in {heavy!r} if m in sys.modules))
+"""
+
+window_script = """
+import time
+start = time.perf_counter()
+import main
+app = main.VideoSplitterApp()
+app.update()
+print(time.perf_counter() - start)
+app.destroy()
+"""
+
+
+def run(script):
+    """Run a script in a fresh interpreter and return its output lines"""
+    result = subprocess.run(
+        [sys.executable, "-c", script],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=os.path.dirname(os.path.abspath(__file__)),
+    )
+    return result.stdout.strip().splitlines()
+
+
+def measure_import(runs=5):
+    """
+    Returns:
+        tuple: (median seconds to import main, heavy modules it loaded)
+    """
+    times = []
+    loaded = set()
+    for _ in range(runs):
+        lines = run(import_script.format(heavy=heavy_modules))
+        times.append(float(lines[0]))
+        if len(lines) > 1 and lines[1]:
+            loaded.update(lines[1].split(","))
+    return statistics.median(times), sorted(loaded)
+
+
+def measure_window(runs=5):
+    """Median seconds until the main window has been drawn"""
+    return statistics.median(
+        float(run(window_script)[-1]) for _ in range(runs)
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip())
+    parser.add_argument("--window", action="store_true")
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    ok = True
+    seconds, loaded = measure_import(args.runs)
+    print(f"import main: {seconds:.3f}s (target {import_target}s)")
+    ok &= seconds <= import_target
+    if loaded:
+        print(f"heavy modules loaded at import: {', '.join(loaded)}")
+        ok = False
+
+    if args.window:
+        seconds = measure_window(args.runs)
+        print(f"window shown: {seconds:.3f}s (target {window_target}s)")
+        ok &= seconds <= window_target
+
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
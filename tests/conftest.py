@@ -0,0 +1,50 @@
+import cv2
+import numpy as np
+import pytest
+
+
+def write_video(
+    path, duration_sec=2, fps=10, width=160, height=120, numbered=False
+):
+    """Write an mp4v test video.
+
+    Frames are random noise, or get brighter frame by frame when numbered,
+    so that every frame can be told apart after decoding.
+    """
+    fourcc = cv2.VideoWriter_fourcc(*"mp4v")
+    out = cv2.VideoWriter(str(path), fourcc, fps, (width, height))
+    for i in range(int(duration_sec * fps)):
+        if numbered:
+            frame = np.full((height, width, 3), 4 * i, dtype=np.uint8)
+        else:
+            frame = (255 * np.random.rand(height, width, 3)).astype(np.uint8)
+        out.write(frame)
+    out.release()
+
+
+@pytest.fixture
+def create_video():
+    """Function writing a test video, see write_video"""
+    return write_video
+
+
+@pytest.fixture
+def numbered_video(tmp_path):
+    """Path of a 60 frame video at 10 fps written with numbered=True"""
+    path = tmp_path / "test_video.mp4"
+    write_video(path, duration_sec=6, width=64, height=48, numbered=True)
+    return path
+
+
+@pytest.fixture
+def numbered_frames(numbered_video):
+    """Every frame of numbered_video as decoded by OpenCV"""
+    cap = cv2.VideoCapture(str(numbered_video))
+    frames = []
+    while True:
+        ret, image = cap.read()
+        if not ret:
+            break
+        frames.append(image)
+    cap.release()
+    return frames
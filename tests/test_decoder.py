@@ -0,0 +1,118 @@
+import cv2
+import numpy as np
+import decoder
+import video_utils
+
+
+def test_frame_index():
+    index = decoder.FrameIndex([0, 10, 25], np.arange(30) * 100.0)
+    assert index.total_frames == 30
+    assert index.gop_length == 15
+    assert index.keyframe_before(9) == 0
+    assert index.keyframe_before(10) == 10
+    assert index.keyframe_before(29) == 25
+    assert index.keyframe_after(10) == 25
+    assert index.keyframe_after(25) is None
+    assert index.frame_at_time(1050) == 10
+
+    # The first frame is always a keyframe
+    assert decoder.FrameIndex([5], np.arange(10)).keyframes == [0, 5]
+
+
+def test_frame_index_sidecar(tmp_path, numbered_video):
+    video_file = numbered_video
+
+    index = decoder.FrameIndex.for_video(
+        str(video_file), cache_dir=tmp_path / "index"
+    )
+    if not video_utils.has_ffmpeg_support():
+        assert index is None
+        return
+    assert index.total_frames == 60
+    assert list((tmp_path / "index").iterdir())
+
+    reloaded = decoder.FrameIndex.for_video(
+        str(video_file), cache_dir=tmp_path / "index"
+    )
+    assert reloaded.keyframes == index.keyframes
+    assert np.array_equal(reloaded.timestamps, index.timestamps)
+
+
+def test_frame_reader(numbered_video, numbered_frames):
+    video_file = numbered_video
+
+    expected = numbered_frames
+
+    cap = cv2.VideoCapture(str(video_file))
+    index = decoder.FrameIndex(list(range(0, 60, 12)), np.arange(60))
+    reader = decoder.FrameReader(cap, index)
+    for frame in [0, 3, 4, 40, 13, 59, 58, 12]:
+        ret, image = reader.read(frame)
+        assert ret
+        assert np.array_equal(image, expected[frame])
+    cap.release()
+
+
+def test_seek_planner():
+    planner = decoder.SeekPlanner()
+    # Backwards or unknown position always seeks
+    assert planner.plan(10, None) == "seek"
+    assert planner.plan(10, 20, keyframe=0) == "seek"
+    # A hop that stays within the GOP never re-decodes from the keyframe
+    assert planner.plan(500, 100, keyframe=96) == "grab"
+    # Crossing keyframes: compare measured costs
+    assert planner.plan(203, 200, keyframe=201) == "grab"
+    assert planner.plan(300, 100, keyframe=290) == "seek"
+
+    # Once seeks turn out to be slow, longer hops are grabbed instead
+    for _ in range(50):
+        planner.record_seek(1.0)
+    assert planner.plan(300, 100, keyframe=290) == "grab"
+
+    assert planner.summary()["counts"] == {"seek": 3, "grab": 3}
+    assert planner.decisions[-1] == (300, "grab", 100)
+
+
+def test_frame_reader_short_hops_grab(numbered_video):
+    video_file = numbered_video
+
+    cap = cv2.VideoCapture(str(video_file))
+    index = decoder.FrameIndex([0, 12, 24, 36, 48], np.arange(60))
+    reader = decoder.FrameReader(cap, index)
+    reader.read(14)
+    reader.read(17)
+    reader.record_cache_hit(3)
+    cap.release()
+
+    actions = [action for _, action, _ in reader.planner.decisions]
+    assert actions == ["seek", "grab", "cache"]
+
+
+def test_reader_pool(tmp_path, numbered_video, numbered_frames):
+    video_file = numbered_video
+    expected = numbered_frames
+    index = decoder.FrameIndex.for_video(
+        str(video_file), cache_dir=tmp_path / "index"
+    )
+
+    pool = decoder.ReaderPool(
+        lambda: cv2.VideoCapture(str(video_file)), limit=2, index=index
+    )
+    # Toggling between two distant frames keeps one handle at each
+    first = pool.acquire(5)
+    assert first.read(5)[0]
+    second = pool.acquire(50)
+    assert second is not first
+    assert second.read(50)[0]
+    for frame, reader in ((6, first), (51, second), (7, first)):
+        assert pool.acquire(frame) is reader
+        ret, image = reader.read(frame)
+        assert ret
+        assert np.array_equal(image, expected[frame])
+
+    # Lowering the limit closes the least recently used handle
+    pool.limit = 1
+    assert pool.acquire(8) is first
+    assert pool.readers == [first]
+    pool.release()
+    assert pool.readers == []
@@ -0,0 +1,46 @@
+import threading
+
+import numpy as np
+import frame_store
+
+
+def test_frame_store_build(tmp_path, create_video):
+    video_file = tmp_path / "test_video.mp4"
+    create_video(video_file, duration_sec=2, fps=10)
+
+    store = frame_store.FrameStore(tmp_path / "frames.raw", 20, 80, 60)
+    assert store.get(0) is None
+    assert store.build(str(video_file))
+    assert store.complete
+
+    frame = store.get(19)
+    assert frame.shape == (60, 80, 3)
+    assert np.shares_memory(frame, store.frames)
+    assert frame.any()
+    assert store.get(20) is None
+
+
+def test_frame_store_resume(tmp_path, create_video):
+    video_file = tmp_path / "test_video.mp4"
+    create_video(video_file, duration_sec=2, fps=10)
+
+    cancel_event = threading.Event()
+
+    def stop_early(decoded, total):
+        cancel_event.set()
+
+    store = frame_store.FrameStore(tmp_path / "frames.raw", 20, 80, 60)
+    assert not store.build(
+        str(video_file),
+        progress_callback=stop_early,
+        cancel_event=cancel_event,
+        flush_interval=5,
+    )
+    assert store.decoded == 5
+    del store
+
+    # Reopening resumes after the frames already decoded
+    store = frame_store.FrameStore(tmp_path / "frames.raw", 20, 80, 60)
+    assert store.decoded == 5
+    assert store.build(str(video_file))
+    assert store.decoded == 20
@@ -1,3 +1,6 @@
+import threading
+
+import numpy as np
 import pytest
 
 import main
@@ -261,3 +264,336 @@ class TestSegmentManager:
 
         segments = list(manager)
         assert len(segments) == 2
+
+    def test_segment_manager_linked_segments(self):
+        """Test adjacency lookup of touching segments"""
+        manager = main.SegmentManager(fps=30, total_frames=3000)
+        manager.append(layer=1, start_frame=0, end_frame=300, title="Seg1")
+        manager.append(layer=1, start_frame=300, end_frame=600, title="Seg2")
+        manager.append(layer=2, start_frame=600, end_frame=900, title="Seg3")
+        seg1, seg2, seg3 = manager.items
+
+        assert manager.get_linked_next_segments(seg1) == [seg2]
+        assert manager.get_linked_prev_segments(seg2) == [seg1]
+        assert manager.get_linked_next_segments(seg2) == []  # other layer
+        assert manager.get_linked_prev_segments(seg3) == []
+
+    def test_segment_manager_move_boundary_linked(self):
+        """Test linked boundary move cascades to the neighbor"""
+        manager = main.SegmentManager(fps=30, total_frames=3000)
+        manager.append(layer=1, start_frame=0, end_frame=300, title="Seg1")
+        manager.append(layer=1, start_frame=300, end_frame=600, title="Seg2")
+        seg1, seg2 = manager.items
+
+        changed = manager.move_boundary(seg2, "start", 250, link=True)
+        assert changed == [seg2, seg1]
+        assert seg1.end_frame == 250
+        assert seg2.start_frame == 250
+        assert manager.get_linked_prev_segments(seg2) == [seg1]
+
+        changed = manager.move_boundary(seg2, "start", 260)
+        assert changed == [seg2]
+        assert seg1.end_frame == 250
+        assert manager.get_linked_prev_segments(seg2) == []
+
+    def test_segment_manager_apply_boundary_changes_invalid(self):
+        """Test an invalid batch leaves all segments untouched"""
+        manager = main.SegmentManager(fps=30, total_frames=3000)
+        manager.append(layer=1, start_frame=0, end_frame=300, title="Seg1")
+        manager.append(layer=1, start_frame=300, end_frame=600, title="Seg2")
+        seg1, seg2 = manager.items
+
+        with pytest.raises(ValueError):
+            manager.apply_boundary_changes(
+                [(seg2, "start", 100), (seg1, "end", 0)]
+            )
+        assert seg1.end_frame == 300
+        assert seg2.start_frame == 300
+
+    def test_segment_manager_adjacency_after_remove(self):
+        """Test the adjacency index follows removals"""
+        manager = main.SegmentManager(fps=30, total_frames=3000)
+        manager.append(layer=1, start_frame=0, end_frame=300, title="Seg1")
+        manager.append(layer=1, start_frame=300, end_frame=600, title="Seg2")
+        seg1 = manager.items[0]
+
+        manager.remove_segment_by_id(2)
+        assert manager.get_linked_next_segments(seg1) == []
+
+    def test_segment_manager_union_layers(self):
+        """Test union of overlapping segments across layers"""
+        manager = main.SegmentManager(fps=30, total_frames=3000)
+        manager.append(layer=1, start_frame=0, end_frame=300, title="Seg1")
+        manager.append(layer=2, start_frame=200, end_frame=500, title="Seg2")
+        manager.append(layer=1, start_frame=600, end_frame=900, title="Seg3")
+
+        assert manager.union_layers([1, 2]) == [(0, 500), (600, 900)]
+
+    def test_segment_manager_intersect_layers(self):
+        """Test intersection of layers"""
+        manager = main.SegmentManager(fps=30, total_frames=3000)
+        manager.append(layer=1, start_frame=0, end_frame=300, title="Seg1")
+        manager.append(layer=1, start_frame=600, end_frame=900, title="Seg2")
+        manager.append(layer=2, start_frame=200, end_frame=700, title="Seg3")
+
+        assert manager.intersect_layers([1, 2]) == [(200, 300), (600, 700)]
+
+    def test_segment_manager_subtract_layers(self):
+        """Test difference of layers"""
+        manager = main.SegmentManager(fps=30, total_frames=3000)
+        manager.append(layer=1, start_frame=0, end_frame=900, title="Seg1")
+        manager.append(layer=2, start_frame=100, end_frame=200, title="Seg2")
+        manager.append(layer=2, start_frame=500, end_frame=1000, title="Seg3")
+
+        assert manager.subtract_layers([1], [2]) == [(0, 100), (200, 500)]
+
+    def test_segment_manager_derive_layer(self):
+        """Test derived layer segments"""
+        manager = main.SegmentManager(fps=30, total_frames=3000)
+        manager.append(layer=1, start_frame=0, end_frame=300, title="Seg1")
+        manager.append(layer=2, start_frame=300, end_frame=600, title="Seg2")
+
+        derived = manager.derive_layer("union", [1, 2])
+        assert len(derived) == 1
+        assert derived[0].layer == "1+2"
+        assert derived[0].title == "union001"
+        assert (derived[0].start_frame, derived[0].end_frame) == (0, 600)
+        assert len(manager) == 2
+
+        assert manager.derive_layer("intersection", [1, 2]) == []
+        difference = manager.derive_layer("difference", [1], [2, 3])
+        assert difference[0].layer == "1-(2+3)"
+        difference = manager.derive_layer("difference", [1, 2], [3])
+        assert difference[0].layer == "(1+2)-3"
+        assert (difference[0].start_frame, difference[0].end_frame) == (0, 600)
+
+        with pytest.raises(ValueError):
+            manager.derive_layer("xor", [1, 2])
+
+    def test_segment_manager_generate_chunks(self):
+        """Test fixed-length chunk generation"""
+        manager = main.SegmentManager(fps=30, total_frames=1000)
+        assert manager.generate_chunks(300) == [
+            (0, 300),
+            (300, 600),
+            (600, 900),
+            (900, 1000),
+        ]
+        with pytest.raises(ValueError):
+            manager.generate_chunks(0)
+
+    def test_segment_manager_generate_chunks_keyframes(self):
+        """Test chunk boundaries snap to the nearest keyframe"""
+        manager = main.SegmentManager(fps=30, total_frames=1000)
+        keyframes = [0, 250, 320, 610, 980]
+        assert manager.generate_chunks(300, keyframes=keyframes) == [
+            (0, 320),
+            (320, 610),
+            (610, 980),
+            (980, 1000),
+        ]
+
+    def test_segment_manager_add_chunks(self):
+        """Test adding chunks to a layer"""
+        manager = main.SegmentManager(fps=30, total_frames=1000)
+        manager.append(layer=2, start_frame=0, end_frame=100, title="Old")
+        manager.append(layer=1, start_frame=0, end_frame=100, title="Keep")
+
+        segments = manager.add_chunks(2, 500, replace=True)
+        assert [s.title for s in segments] == ["chunk001", "chunk002"]
+        assert len(manager.filter_by_layers([2])) == 2
+        assert len(manager.filter_by_layers([1])) == 1
+
+        # Without replace, chunks only fill the free time of the layer
+        manager.append(layer=1, start_frame=400, end_frame=450, title="Mid")
+        segments = manager.add_chunks(1, 500)
+        assert [(s.start_frame, s.end_frame) for s in segments] == [
+            (100, 400),
+            (450, 500),
+            (500, 1000),
+        ]
+
+    def test_segment_manager_get_frame_arrays(self):
+        """Test frame arrays follow changes to the segment list"""
+        manager = main.SegmentManager(fps=30, total_frames=1000)
+        manager.append(layer=1, start_frame=0, end_frame=100, title="A")
+        starts, ends, ids = manager.get_frame_arrays(1)
+        assert starts.tolist() == [0] and ends.tolist() == [100]
+
+        manager.append(layer=1, start_frame=200, end_frame=300, title="B")
+        starts, ends, ids = manager.get_frame_arrays(1)
+        assert starts.tolist() == [0, 200]
+        assert ids.tolist() == [s.segment_id for s in manager.items]
+
+    def test_segment_manager_get_coverage_runs(self):
+        """Test dense ranges are merged into covered pixel columns"""
+        starts = np.array([0, 10, 20, 500, 2000])
+        ends = np.array([10, 20, 25, 501, 2100])
+        runs = main.SegmentManager.get_coverage_runs(
+            starts, ends, 0, 1000, 100
+        )
+        # Contiguous segments merge; a 1-frame segment still gets a column;
+        # segments outside the visible range are ignored.
+        assert runs == [(0, 3), (50, 51)]
+        assert (
+            main.SegmentManager.get_coverage_runs(
+                starts[:0], ends[:0], 0, 1000, 100
+            )
+            == []
+        )
+
+
+class TestRenderScheduler:
+    """Test RenderScheduler class"""
+
+    class FakeApp:
+        def __init__(self):
+            self.idle_callbacks = []
+
+        def after_idle(self, callback):
+            self.idle_callbacks.append(callback)
+            return len(self.idle_callbacks)
+
+        def run_idle(self):
+            callbacks, self.idle_callbacks = self.idle_callbacks, []
+            for callback in callbacks:
+                callback()
+
+    def test_render_scheduler_coalesces(self):
+        """Test repeated marks result in one render pass"""
+        app = self.FakeApp()
+        renders = []
+        scheduler = main.RenderScheduler(app, renders.append)
+
+        scheduler.mark("frame", "segments")
+        scheduler.mark("frame", ("segments", 2))
+        scheduler.mark("time_label")
+        assert len(app.idle_callbacks) == 1
+
+        app.run_idle()
+        assert renders == [
+            {"frame", "segments", ("segments", 2), "time_label"}
+        ]
+
+        scheduler.mark("frame")
+        app.run_idle()
+        assert renders[-1] == {"frame"}
+        assert len(renders) == 2
+
+
+class TestUIEventBus:
+    """Test UIEventBus class"""
+
+    class FakeApp:
+        def __init__(self):
+            self.timers = {}
+
+        def after(self, ms, callback):
+            self.timers[len(self.timers) + 1] = callback
+            return len(self.timers)
+
+        def after_cancel(self, timer_id):
+            self.timers.pop(timer_id, None)
+
+        def run_timers(self):
+            timers, self.timers = self.timers, {}
+            for callback in timers.values():
+                callback()
+
+    def test_event_bus_order_and_coalescing(self):
+        """Test events run in order and keyed events keep the latest args"""
+        app = self.FakeApp()
+        bus = main.UIEventBus(app)
+        calls = []
+        bus.start()
+        bus.start()
+        assert len(app.timers) == 1
+
+        bus.post(calls.append, "opened")
+        for i in range(100):
+            bus.post(calls.append, ("progress", i), key="progress")
+        bus.post(calls.append, "done")
+        app.run_timers()
+        assert calls == ["opened", ("progress", 99), "done"]
+        # Draining schedules the next drain
+        assert len(app.timers) == 1
+
+        bus.post(calls.append, ("progress", 100), key="progress")
+        app.run_timers()
+        assert calls[-1] == ("progress", 100)
+
+        bus.stop()
+        assert not app.timers
+
+    def test_event_bus_post_from_threads(self):
+        """Test events posted from worker threads are all delivered"""
+        app = self.FakeApp()
+        bus = main.UIEventBus(app)
+        calls = []
+
+        def worker(n):
+            for i in range(200):
+                bus.post(calls.append, (n, i))
+
+        threads = [
+            threading.Thread(target=worker, args=(n,)) for n in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        bus.drain()
+        assert len(calls) == 800
+        for n in range(4):
+            assert [i for m, i in calls if m == n] == list(range(200))
+
+    def test_event_bus_failing_callback(self):
+        """Test a failing callback does not stop the other events"""
+        app = self.FakeApp()
+        bus = main.UIEventBus(app)
+        calls = []
+        bus.post(lambda: 1 / 0)
+        bus.post(calls.append, "after")
+        bus.drain()
+        assert calls == ["after"]
+
+
+class TestVideoProject:
+    """Test VideoProject class"""
+
+    def test_video_project_lazy_load(self, tmp_path, create_video):
+        """Test a project opens from cached video info before the video"""
+        video_file = tmp_path / "test_video.mp4"
+        create_video(video_file, duration_sec=3, width=64, height=48)
+        project_file = tmp_path / "project.json"
+
+        vp = main.VideoProject(str(video_file))
+        vp.segments.append(1, 10, 20, "part001")
+        vp.save(str(project_file))
+
+        lazy = main.VideoProject.load(str(project_file), lazy=True)
+        assert not lazy.is_video_open
+        assert lazy.fps == vp.fps
+        assert lazy.total_frames == vp.total_frames
+        assert [(s.start_frame, s.end_frame) for s in lazy.segments] == [
+            (10, 20)
+        ]
+
+        lazy.open_video()
+        assert lazy.is_video_open
+        assert lazy.segments.items[0].end_frame == 20
+
+    def test_video_project_lazy_load_missing_video(self, tmp_path):
+        """Test a project with a missing video still loads its segments"""
+        project_file = tmp_path / "project.json"
+        project_file.write_text(
+            '{"video_path": "missing.mp4", "output_path": null,'
+            ' "video_info": {"fps": 10, "total_frames": 30},'
+            ' "segment_list": [{"id": 1, "layer": 1, "title": "a",'
+            ' "start": 1.0, "end": 2.0}]}',
+            encoding="utf-8",
+        )
+        vp = main.VideoProject.load(str(project_file), lazy=True)
+        assert len(vp.segments) == 1
+        with pytest.raises(ValueError):
+            vp.open_video()
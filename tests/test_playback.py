@@ -0,0 +1,48 @@
+import threading
+
+import numpy as np
+import decoder
+import playback
+
+
+def play(video_file, index, start_frame, speed):
+    shown = []
+    ended = threading.Event()
+    engine = playback.PlaybackEngine(
+        str(video_file),
+        10,
+        60,
+        on_frame=lambda frame, image: shown.append((frame, image)),
+        on_end=ended.set,
+        index=index,
+    )
+    engine.start(start_frame, speed)
+    assert ended.wait(10)
+    engine.close()
+    return shown
+
+
+def test_display_step():
+    assert playback.display_step(1, 30, 30) == 1
+    assert playback.display_step(0.25, 60, 30) == 1
+    assert playback.display_step(8, 30, 30) == 8
+    assert playback.display_step(-8, 10, 30) == 3
+
+
+def test_playback_engine(tmp_path, numbered_video, numbered_frames):
+    video_file = numbered_video
+    expected = numbered_frames
+    index = decoder.FrameIndex.for_video(
+        str(video_file), cache_dir=tmp_path / "index"
+    )
+
+    for start_frame, speed, last_frame in ((0, 8, 59), (59, -8, 0)):
+        shown = play(video_file, index, start_frame, speed)
+        frames = [frame for frame, _ in shown]
+        assert frames[-1] == last_frame
+        # Late frames may be dropped, but the order and grid are kept
+        assert frames == sorted(frames, reverse=speed < 0)
+        assert len(set(frames)) == len(frames)
+        assert all((frame - start_frame) % 3 == 0 for frame in frames[:-1])
+        for frame, image in shown:
+            assert np.array_equal(image, expected[frame])
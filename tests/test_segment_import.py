@@ -0,0 +1,153 @@
+import io
+
+import pytest
+
+import main
+import segment_import
+
+
+def test_timecode_to_frame():
+    assert segment_import.timecode_to_frame("00:00:01:05", 30) == 35
+    assert segment_import.timecode_to_frame("01:00:00:00", 25) == 90000
+    # Drop-frame: 00:01:00;02 is the first frame of minute 1
+    assert segment_import.timecode_to_frame("00:01:00;02", 29.97) == 1800
+    assert segment_import.timecode_to_frame("00:10:00;00", 29.97) == 17982
+    with pytest.raises(ValueError):
+        segment_import.timecode_to_frame("invalid", 30)
+
+
+def test_iter_csv_records():
+    data = io.StringIO(
+        "title,start,end,layer\n"
+        "Intro,00:00.000,00:10.000,2\n"
+        "Main,10,20.5,\n"
+    )
+    records = list(segment_import.iter_csv_records(data, fps=30, layer=1))
+    assert records == [(2, "Intro", 0, 300), (1, "Main", 300, 615)]
+
+
+def test_iter_csv_records_frames():
+    data = io.StringIO("start_frame,end_frame\n0,30\n30,60\n")
+    records = list(segment_import.iter_csv_records(data, fps=30))
+    assert records == [(1, None, 0, 30), (1, None, 30, 60)]
+
+    with pytest.raises(ValueError):
+        list(segment_import.iter_csv_records(io.StringIO("a,b\n1,2\n"), 30))
+
+
+def test_iter_edl_records():
+    data = io.StringIO(
+        "TITLE: Test\n"
+        "FCM: NON-DROP FRAME\n"
+        "\n"
+        "001  AX       V     C        00:00:01:00 00:00:02:00 "
+        "01:00:00:00 01:00:01:00\n"
+        "* FROM CLIP NAME: shot_a.mov\n"
+        "002  AX       V     C        00:00:05:00 00:00:06:15 "
+        "01:00:01:00 01:00:02:15\n"
+    )
+    records = list(segment_import.iter_edl_records(data, fps=30, layer=3))
+    assert records == [(3, "shot_a.mov", 30, 60), (3, None, 150, 195)]
+
+
+def test_iter_cue_records_srt():
+    data = io.StringIO(
+        "1\n"
+        "00:00:01,000 --> 00:00:02,500\n"
+        "Hello\n"
+        "world\n"
+        "\n"
+        "2\n"
+        "00:00:03,000 --> 00:00:04,000\n"
+        "Bye\n"
+    )
+    records = list(segment_import.iter_cue_records(data, fps=10))
+    assert records == [(1, "Hello", 10, 25), (1, "Bye", 30, 40)]
+
+
+def test_iter_cue_records_vtt():
+    data = io.StringIO(
+        "WEBVTT\n"
+        "\n"
+        "intro\n"
+        "00:01.000 --> 00:02.000 align:start\n"
+        "Intro\n"
+    )
+    records = list(segment_import.iter_cue_records(data, fps=10))
+    assert records == [(1, "Intro", 10, 20)]
+
+
+def test_read_segment_records_unsupported(tmp_path):
+    path = tmp_path / "cues.txt"
+    path.write_text("")
+    with pytest.raises(ValueError):
+        segment_import.read_segment_records(str(path), fps=30)
+
+
+def test_validate_segment_records():
+    records = [
+        (1, "a", 0, 100),
+        (1, "b", 50, 150),  # overlaps "a"
+        (2, "c", 50, 150),  # other layer
+        (1, "d", 200, 100),  # inverted
+        (1, "e", 900, 1100),  # out of range
+        (1, "f", 300, 400),  # overlaps existing
+        (1, "g", 150, 250),
+    ]
+    invalid, overlapping = segment_import.validate_segment_records(
+        records, total_frames=1000, existing=[(1, 350, 500)]
+    )
+    assert invalid.tolist() == [False, False, False, True, True, False, False]
+    assert overlapping.tolist() == [
+        False,
+        True,
+        False,
+        False,
+        False,
+        True,
+        False,
+    ]
+
+
+def test_validate_segment_records_layer_range():
+    records = [
+        (0, "a", 0, 100),
+        (1, "b", 0, 100),
+        (3, "c", 0, 100),
+        (4, "d", 0, 100),
+    ]
+    invalid, overlapping = segment_import.validate_segment_records(
+        records, total_frames=1000, layer_count=3
+    )
+    assert invalid.tolist() == [True, False, False, True]
+    assert not overlapping.any()
+
+
+def test_validate_segment_records_per_layer():
+    # Interleaved layers: only same-layer ranges may overlap
+    records = [
+        (2, "a", 0, 500),
+        (1, "b", 100, 200),
+        (2, "c", 400, 600),  # overlaps "a"
+        (1, "d", 150, 300),  # overlaps "b"
+        (1, "e", 600, 700),  # overlaps existing on layer 1
+        (2, "f", 650, 700),  # existing on layer 1 only
+    ]
+    invalid, overlapping = segment_import.validate_segment_records(
+        records, total_frames=1000, existing=[(1, 550, 650)]
+    )
+    assert not invalid.any()
+    assert overlapping.tolist() == [False, False, True, True, True, False]
+
+
+def test_segment_manager_extend_records():
+    manager = main.SegmentManager(fps=30, total_frames=3000)
+    manager.append(layer=1, start_frame=0, end_frame=300, title="Seg1")
+
+    segments = manager.extend_records(
+        [(1, None, 300, 600), (2, "Other", 0, 100)]
+    )
+    assert len(manager) == 3
+    assert [s.segment_id for s in segments] == [2, 3]
+    assert segments[0].title == "part002"
+    assert manager.get_linked_next_segments(manager.items[0]) == [segments[0]]
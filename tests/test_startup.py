@@ -0,0 +1,41 @@
+import os
+import subprocess
+import sys
+
+import startup_benchmark
+
+
+def loaded_modules(statement, names=("cv2", "numpy", "tkinter", "i18n")):
+    """Modules of interest loaded by a statement in a fresh interpreter"""
+    script = (
+        f"import sys\n{statement}\n"
+        f"print(','.join(m for m in {names!r} if m in sys.modules))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", script],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=os.path.dirname(startup_benchmark.__file__),
+    )
+    return set(filter(None, result.stdout.strip().split(",")))
+
+
+def test_scripting_imports_are_light():
+    assert loaded_modules("import video_utils, utils") == set()
+
+
+def test_core_needs_no_gui():
+    assert loaded_modules("import core") == set()
+
+
+def test_core_defers_video_modules():
+    assert (
+        loaded_modules("import core", names=("decoder", "video_utils"))
+        == set()
+    )
+
+
+def test_main_import_defers_video_machinery():
+    _, loaded = startup_benchmark.measure_import(runs=1)
+    assert loaded == []
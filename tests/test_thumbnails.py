@@ -0,0 +1,128 @@
+import threading
+import time
+
+import numpy as np
+import thumbnails
+import video_utils
+
+
+def test_filmstrip_frames():
+    assert thumbnails.filmstrip_frames(0, 99, 10) == list(range(0, 100, 16))
+    # Zooming in keeps the frames on the same grid
+    zoomed = thumbnails.filmstrip_frames(0, 49, 10)
+    assert zoomed == list(range(0, 50, 8))
+    assert {f for f in range(0, 100, 16) if f < 50} <= set(zoomed)
+    assert thumbnails.filmstrip_frames(10, 20, 100) == list(range(10, 21))
+    assert thumbnails.filmstrip_frames(0, 99, 0) == []
+
+
+def test_snap_frame():
+    assert thumbnails.grid_step(0.3) == 1
+    assert thumbnails.grid_step(5) == 8
+    assert thumbnails.snap_frame(13, 5) == 16
+    assert thumbnails.snap_frame(11, 5) == 8
+    assert thumbnails.snap_frame(11, 1) == 11
+
+
+def test_thumbnail_cache_nearest():
+    cache = thumbnails.ThumbnailCache()
+    assert cache.nearest(10) is None
+    cache.set(0, "a")
+    cache.set(20, "b")
+    assert cache.nearest(8) == (0, "a")
+    assert cache.nearest(12) == (20, "b")
+    assert cache.nearest(50) == (20, "b")
+    assert cache.nearest(50, max_distance=10) is None
+    assert 20 in cache and len(cache) == 2
+
+
+def test_thumbnail_cache_bound():
+    cache = thumbnails.ThumbnailCache(max_items=3)
+    for frame in (0, 10, 20):
+        cache.set(frame, str(frame))
+    # Reading frame 0 makes frame 10 the least recently used
+    assert cache.get(0) == "0"
+    cache.set(30, "30")
+    assert len(cache) == 3
+    assert 10 not in cache and cache.get(10) is None
+    assert [f for f in (0, 20, 30) if f in cache] == [0, 20, 30]
+    # Dropped frames are no longer offered as the nearest thumbnail
+    assert cache.nearest(9) == (0, "0")
+
+
+def test_thumbnail_generator(tmp_path, create_video):
+    video_file = tmp_path / "test_video.mp4"
+    create_video(video_file, duration_sec=3, fps=10)
+
+    cache = thumbnails.ThumbnailCache()
+    generator = thumbnails.ThumbnailGenerator(
+        str(video_file), cache, height=30, workers=2
+    )
+    frames = [0, 5, 12, 20, 29]
+    done = threading.Event()
+    ready = []
+
+    def on_ready(frame):
+        ready.append(frame)
+        if len(ready) == len(frames):
+            done.set()
+
+    generator.request(frames, callback=on_ready)
+    assert done.wait(10)
+    generator.shutdown()
+
+    assert sorted(ready) == frames
+    for frame in frames:
+        assert cache.get(frame).shape == (30, 40, 3)
+
+
+def test_disk_thumbnail_cache(tmp_path, create_video):
+    video_file = tmp_path / "test_video.mp4"
+    create_video(video_file, duration_sec=1, fps=10)
+    fingerprint = video_utils.video_fingerprint(video_file)
+    assert fingerprint == video_utils.video_fingerprint(video_file)
+
+    image = np.full((30, 40, 3), 128, dtype=np.uint8)
+    cache = thumbnails.DiskThumbnailCache(
+        video_file, 30, cache_dir=tmp_path / "cache"
+    )
+    cache.prepare()
+    assert cache.directory.name == f"{fingerprint}_30"
+    cache.set(5, image)
+
+    # A new cache for the same video finds the thumbnail on disk once the
+    # fingerprint is known
+    reloaded = thumbnails.DiskThumbnailCache(
+        video_file, 30, cache_dir=tmp_path / "cache"
+    )
+    assert 5 not in reloaded
+    reloaded.prepare()
+    assert 5 in reloaded and 6 not in reloaded
+    assert reloaded.get(5).shape == (30, 40, 3)
+    assert reloaded.get(6) is None
+
+
+def test_disk_thumbnail_cache_prune(tmp_path, create_video):
+    video_file = tmp_path / "test_video.mp4"
+    create_video(video_file, duration_sec=1, fps=10)
+    image = (255 * np.random.rand(30, 40, 3)).astype(np.uint8)
+
+    cache = thumbnails.DiskThumbnailCache(
+        video_file, 30, cache_dir=tmp_path / "cache"
+    )
+    cache.prepare()
+    for frame in range(4):
+        cache.set(frame, image)
+        time.sleep(0.01)
+    size = cache._file(0).stat().st_size
+    # Reading frame 0 makes frame 1 the least recently used
+    cache.clear()
+    cache.get(0)
+
+    cache.max_bytes = 3 * size
+    cache.prune()
+    assert sorted(int(path.stem) for path in cache.directory.iterdir()) == [
+        0,
+        2,
+        3,
+    ]
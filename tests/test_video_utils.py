@@ -6,19 +6,9 @@ import video_utils
 import main
 
 
-def create_dummy_video(path, duration_sec=2, fps=10, width=640, height=480):
-    fourcc = cv2.VideoWriter_fourcc(*"mp4v")
-    out = cv2.VideoWriter(path, fourcc, fps, (width, height))
-    total_frames = int(duration_sec * fps)
-    for _ in range(total_frames):
-        frame = (255 * np.random.rand(height, width, 3)).astype(np.uint8)
-        out.write(frame)
-    out.release()
-
-
-def test_load_video(tmp_path):
+def test_load_video(tmp_path, create_video):
     video_file = tmp_path / "test_video.mp4"
-    create_dummy_video(video_file, duration_sec=3, fps=10)
+    create_video(video_file, duration_sec=3, fps=10)
 
     cap, total_frames, fps = video_utils.load_video(str(video_file))
     assert total_frames == 30
@@ -34,10 +24,10 @@ def test_load_video(tmp_path):
         cap_ffmpeg.release()
 
 
-def test_split_video(tmp_path):
+def test_split_video(tmp_path, create_video):
     video_file = tmp_path / "test_video.mp4"
     fps = 10
-    create_dummy_video(video_file, duration_sec=5, fps=fps)
+    create_video(video_file, duration_sec=5, fps=fps)
 
     segments = [
         main.Segment(
@@ -69,3 +59,205 @@ def test_split_video(tmp_path):
     }
     actual_filenames = {f.name for f in output_files}
     assert actual_filenames == expected_filenames
+
+
+def test_split_video_derived_layer(tmp_path, create_video):
+    video_file = tmp_path / "test_video.mp4"
+    fps = 10
+    create_video(video_file, duration_sec=5, fps=fps)
+
+    manager = main.SegmentManager(fps=fps, total_frames=50)
+    manager.append(layer=1, start_frame=0, end_frame=20, title="a")
+    manager.append(layer=2, start_frame=10, end_frame=30, title="b")
+    segments = manager.derive_layer("union", [1, 2])
+
+    output_dir = tmp_path / "output"
+    output_dir.mkdir()
+    video_utils.split_video(str(video_file), segments, str(output_dir))
+
+    output_files = list(output_dir.glob("*.mp4"))
+    assert [f.name for f in output_files] == ["test_video_l1+2-union001.mp4"]
+    cap = cv2.VideoCapture(str(output_files[0]))
+    assert int(cap.get(cv2.CAP_PROP_FRAME_COUNT)) == 30
+    cap.release()
+
+
+def test_split_video_sequential(tmp_path, create_video):
+    video_file = tmp_path / "test_video.mp4"
+    fps = 10
+    create_video(video_file, duration_sec=5, fps=fps)
+
+    manager = main.SegmentManager(fps=fps, total_frames=50)
+    segments = manager.add_chunks(1, 20)
+
+    output_dir = tmp_path / "output"
+    output_dir.mkdir()
+    progress = []
+    video_utils.split_video_sequential(
+        str(video_file),
+        segments,
+        str(output_dir),
+        progress_callback=lambda i, total: progress.append((i, total)),
+    )
+
+    assert progress == [(0, 3), (1, 3), (2, 3)]
+    frame_counts = {}
+    for output_file in output_dir.glob("*.mp4"):
+        cap = cv2.VideoCapture(str(output_file))
+        frame_counts[output_file.name] = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+        cap.release()
+    assert frame_counts == {
+        "test_video_l1-chunk001.mp4": 20,
+        "test_video_l1-chunk002.mp4": 20,
+        "test_video_l1-chunk003.mp4": 10,
+    }
+
+
+def test_split_video_sequential_overlap(tmp_path):
+    segments = [
+        main.Segment(
+            fps=10,
+            segment_id=1,
+            layer=1,
+            title="a",
+            start_frame=0,
+            end_frame=20,
+        ),
+        main.Segment(
+            fps=10,
+            segment_id=2,
+            layer=2,
+            title="b",
+            start_frame=10,
+            end_frame=30,
+        ),
+    ]
+    assert video_utils.segments_overlap(segments)
+    with pytest.raises(ValueError):
+        video_utils.split_video_sequential(
+            "unused.mp4", segments, str(tmp_path)
+        )
+
+
+def test_seek_forward_grab_failure():
+    class FailingCapture:
+        def __init__(self, grabs):
+            self.grabs = grabs
+            self.seeks = []
+
+        def grab(self):
+            self.grabs -= 1
+            return self.grabs >= 0
+
+        def set(self, prop, value):
+            self.seeks.append(value)
+            return True
+
+    cap = FailingCapture(grabs=5)
+    assert video_utils.seek_forward(cap, 0, 3, 10) == 3
+    assert cap.seeks == []
+    # grab() fails partway: the position is unknown, not target_frame
+    assert video_utils.seek_forward(cap, 3, 8, 10) is None
+    assert cap.seeks == []
+    assert video_utils.seek_forward(cap, None, 8, 10) == 8
+    assert cap.seeks == [8]
+
+
+def test_create_proxy(tmp_path, create_video):
+    video_file = tmp_path / "test_video.mp4"
+    create_video(video_file, duration_sec=2, fps=10, width=640, height=480)
+
+    proxy_path = video_utils.get_proxy_path(
+        str(video_file), 120, cache_dir=tmp_path / "proxies"
+    )
+    progress = []
+    assert video_utils.create_proxy(
+        str(video_file),
+        proxy_path,
+        height=120,
+        progress_callback=lambda done, total: progress.append(done),
+    )
+    assert progress[-1] == 20
+    assert video_utils.is_valid_proxy(proxy_path, 20)
+    assert not video_utils.is_valid_proxy(proxy_path, 21)
+
+    cap = cv2.VideoCapture(proxy_path)
+    assert int(cap.get(cv2.CAP_PROP_FRAME_WIDTH)) == 160
+    assert int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT)) == 120
+    cap.release()
+
+
+def test_get_video_info(tmp_path, monkeypatch, create_video):
+    video_file = tmp_path / "test_video.mp4"
+    create_video(video_file, duration_sec=2, fps=10, width=640, height=480)
+    cache_path = tmp_path / "video_info.json"
+
+    # Without a packet scan the container values are returned uncached
+    info = video_utils.get_video_info(str(video_file), cache_path=cache_path)
+    assert info["total_frames"] == 20
+    assert info["fps"] == 10.0
+    assert (info["width"], info["height"]) == (640, 480)
+    assert len(info["codec"]) == 4  # FourCC as reported by the decoder
+    assert not info["verified"]
+    assert not cache_path.exists()
+
+    packets = video_utils.scan_packets(str(video_file))
+    if packets is None:
+        return  # Verifying needs the FFMPEG backend
+    info = video_utils.get_video_info(
+        str(video_file), cache_path=cache_path, packets=packets
+    )
+    assert info["verified"] and info["total_frames"] == 20
+
+    # A second lookup is served from the cache without probing
+    def fail(*args, **kwargs):
+        raise AssertionError("probed again")
+
+    probe = video_utils.probe_video_info
+    monkeypatch.setattr(video_utils, "probe_video_info", fail)
+    assert (
+        video_utils.get_video_info(str(video_file), cache_path=cache_path)
+        == info
+    )
+
+    # Replacing the file invalidates the entry
+    monkeypatch.setattr(video_utils, "probe_video_info", probe)
+    create_video(video_file, duration_sec=3, fps=10)
+    info = video_utils.get_video_info(str(video_file), cache_path=cache_path)
+    assert info["total_frames"] == 30 and not info["verified"]
+
+
+def test_get_available_codecs():
+    assert video_utils.codec_probe_key() == video_utils.codec_probe_key()
+
+    codecs = video_utils.get_available_codecs()
+    # Parallel probing keeps the order and agrees with probing one by one
+    assert codecs == [
+        (codec, extension)
+        for codec, extension in video_utils.codec_and_extensions.items()
+        if video_utils.probe_codec(codec, extension)
+    ]
+
+
+def test_benchmark_codecs():
+    frames = video_utils.make_benchmark_frames(64, 48, 5)
+    assert len(frames) == 5
+    assert frames[0].shape == (48, 64, 3)
+    assert not np.array_equal(frames[0], frames[1])
+
+    results = video_utils.benchmark_codecs([("mp4v", ".mp4")], 64, 48, 5)
+    assert results["mp4v"]["fps"] > 0
+    assert results["mp4v"]["bytes_per_frame"] > 0
+
+
+def test_select_codec():
+    benchmarks = {
+        "mp4v": {"fps": 100, "bytes_per_frame": 5000},
+        "MJPG": {"fps": 200, "bytes_per_frame": 9000},
+        "FFV1": {"fps": 20, "bytes_per_frame": 90000},
+        "vp90": None,
+    }
+    assert video_utils.select_codec("auto: fastest", benchmarks) == "MJPG"
+    assert video_utils.select_codec("auto: smallest", benchmarks) == "mp4v"
+    assert video_utils.select_codec("FFV1", benchmarks) == "FFV1"
+    assert video_utils.select_codec("auto: fastest", {}) == "mp4v"
@@ -0,0 +1,351 @@
+import bisect
+import collections
+import math
+import os
+import queue
+import threading
+from pathlib import Path
+
+import video_utils
+
+thumbnail_cache_dir = Path.home() / ".cache" / "video_splitter" / "thumbnails"
+# Size of the on-disk thumbnail cache of all videos together
+thumbnail_cache_max_bytes = 256 * 1024 * 1024
+
+
+def grid_step(spacing):
+    """Smallest power of two that is at least spacing frames"""
+    return 2 ** math.ceil(math.log2(max(1, spacing)))
+
+
+def snap_frame(frame, spacing):
+    """Round frame to the nearest point of the grid_step(spacing) grid"""
+    step = grid_step(spacing)
+    return round(frame / step) * step
+
+
+def filmstrip_frames(visible_start, visible_end, count):
+    """
+    Pick up to count evenly spaced frames in the visible range.
+    The spacing is rounded up to a power of two so that the frames stay on
+    a fixed grid: zooming in by 2x keeps every other thumbnail and zooming
+    out reuses a subset, so cached thumbnails are shared between zoom
+    levels.
+    Args:
+        visible_start (int): First visible frame
+        visible_end (int): Last visible frame
+        count (int): Maximum number of thumbnails
+    Returns:
+        list: Frame numbers in ascending order
+    """
+    if count <= 0 or visible_end < visible_start:
+        return []
+    step = grid_step((visible_end - visible_start + 1) / count)
+    first = math.ceil(visible_start / step) * step
+    return list(range(first, int(visible_end) + 1, step))
+
+
+class ThumbnailCache:
+    """
+    Thread-safe thumbnail store keyed by frame number.
+    At most max_items thumbnails are kept; the least recently used one is
+    dropped when a new one is added beyond that.
+    """
+
+    def __init__(self, max_items=1024):
+        self.max_items = max_items
+        self._frames = []  # Sorted frame numbers
+        self._images = collections.OrderedDict()  # Least recently used first
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._frames)
+
+    def __contains__(self, frame):
+        return frame in self._images
+
+    def get(self, frame):
+        with self._lock:
+            image = self._images.get(frame)
+            if image is not None:
+                self._images.move_to_end(frame)
+            return image
+
+    def set(self, frame, image):
+        with self._lock:
+            if frame not in self._images:
+                bisect.insort(self._frames, frame)
+            self._images[frame] = image
+            self._images.move_to_end(frame)
+            while len(self._images) > max(1, self.max_items):
+                oldest, _ = self._images.popitem(last=False)
+                del self._frames[bisect.bisect_left(self._frames, oldest)]
+
+    def nearest(self, frame, max_distance=None):
+        """
+        Get the cached thumbnail closest to frame.
+        Args:
+            frame (int): Frame number
+            max_distance (int, optional): Largest accepted distance
+        Returns:
+            tuple: (frame, image), or None if nothing is close enough
+        """
+        with self._lock:
+            index = bisect.bisect_left(self._frames, frame)
+            candidates = self._frames[max(0, index - 1) : index + 1]
+            if not candidates:
+                return None
+            nearest = min(candidates, key=lambda f: abs(f - frame))
+            if (
+                max_distance is not None
+                and abs(nearest - frame) > max_distance
+            ):
+                return None
+            return nearest, self._images[nearest]
+
+    def clear(self):
+        with self._lock:
+            self._frames = []
+            self._images = collections.OrderedDict()
+
+    def prepare(self):
+        """Called by a generator worker before it decodes anything"""
+
+
+class DiskThumbnailCache(ThumbnailCache):
+    """
+    Thumbnail cache persisted as JPEG files, one per frame, in a directory
+    per video fingerprint and thumbnail height. Thumbnails read from disk
+    are kept in memory as well.
+    The fingerprint reads the video, so the directory is only known after
+    prepare() has run on a generator worker; until then the cache is
+    memory-only. The files of all videos are kept under max_bytes by
+    deleting the least recently used ones, whose modification time is
+    refreshed on every read.
+    """
+
+    def __init__(
+        self,
+        video_path,
+        height,
+        cache_dir=None,
+        max_bytes=None,
+        max_items=1024,
+    ):
+        super().__init__(max_items)
+        self.video_path = video_path
+        self.height = height
+        self.cache_dir = Path(
+            cache_dir if cache_dir is not None else thumbnail_cache_dir
+        )
+        self.max_bytes = (
+            max_bytes if max_bytes is not None else thumbnail_cache_max_bytes
+        )
+        self.directory = None
+        self._prepare_lock = threading.Lock()
+        # Bytes written since the last prune
+        self._written = 0
+
+    def prepare(self):
+        with self._prepare_lock:
+            if self.directory is not None:
+                return
+            fingerprint = video_utils.video_fingerprint(self.video_path)
+            directory = self.cache_dir / f"{fingerprint}_{self.height}"
+            directory.mkdir(parents=True, exist_ok=True)
+            self.prune()
+            self.directory = directory
+
+    def prune(self):
+        """Delete the least recently used files beyond max_bytes"""
+        files = []
+        for path in self.cache_dir.glob("*/*.jpg"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            files.append((stat.st_mtime_ns, stat.st_size, path))
+        total = sum(size for _, size, _ in files)
+        for _, size, path in sorted(files):
+            if total <= self.max_bytes:
+                break
+            try:
+                path.unlink()
+            except OSError:
+                continue
+            total -= size
+        self._written = 0
+
+    def _file(self, frame):
+        if self.directory is None:
+            return None
+        return self.directory / f"{frame}.jpg"
+
+    def __contains__(self, frame):
+        if super().__contains__(frame):
+            return True
+        path = self._file(frame)
+        return path is not None and path.exists()
+
+    def get(self, frame):
+        import cv2
+
+        image = super().get(frame)
+        path = self._file(frame)
+        if image is None and path is not None and path.exists():
+            image = cv2.imread(str(path))
+            if image is not None:
+                image = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
+                super().set(frame, image)
+                try:
+                    os.utime(path)
+                except OSError:
+                    pass
+        return image
+
+    def set(self, frame, image):
+        import cv2
+
+        super().set(frame, image)
+        path = self._file(frame)
+        if path is None:
+            return
+        cv2.imwrite(
+            str(path),
+            cv2.cvtColor(image, cv2.COLOR_RGB2BGR),
+            [cv2.IMWRITE_JPEG_QUALITY, 90],
+        )
+        try:
+            self._written += path.stat().st_size
+        except OSError:
+            pass
+        if self._written > self.max_bytes // 10:
+            self.prune()
+
+
+class ThumbnailGenerator:
+    """
+    Decode thumbnails in the background with a small pool of workers.
+    Every worker owns a capture and walks a contiguous run of the requested
+    frames in ascending order, skipping between them with grab() and only
+    seeking when the gap is large. A new request supersedes the pending
+    one.
+    """
+
+    def __init__(
+        self,
+        video_path,
+        cache,
+        height=45,
+        workers=2,
+        max_grab_frames=300,
+        backend="opencv",
+    ):
+        self.video_path = video_path
+        self.cache = cache
+        self.height = height
+        self.max_grab_frames = max_grab_frames
+        self.backend = backend
+
+        self._generation = 0
+        self._pending = set()
+        self._lock = threading.Lock()
+        self._tasks = queue.Queue()
+        self._workers = [
+            threading.Thread(target=self._work, daemon=True)
+            for _ in range(max(1, workers))
+        ]
+        for worker in self._workers:
+            worker.start()
+
+    def request(self, frames, callback=None):
+        """
+        Queue the frames that are not cached yet.
+        Args:
+            frames (Iterable[int]): Frame numbers
+            callback (callable, optional): Called as callback(frame) from a
+                worker thread whenever a thumbnail is ready
+        """
+        with self._lock:
+            missing = sorted(
+                frame for frame in set(frames) if frame not in self.cache
+            )
+            if set(missing) <= self._pending:
+                # Everything is already queued; keep the workers going
+                return
+            self._generation += 1
+            generation = self._generation
+            self._pending = set(missing)
+
+        # One contiguous run per worker keeps each capture moving forward
+        run_length = math.ceil(len(missing) / len(self._workers))
+        for i in range(0, len(missing), run_length):
+            self._tasks.put(
+                (generation, missing[i : i + run_length], callback)
+            )
+
+    def cancel(self):
+        with self._lock:
+            self._generation += 1
+            self._pending = set()
+
+    def shutdown(self):
+        """Stop the workers and release their captures"""
+        self.cancel()
+        for _ in self._workers:
+            self._tasks.put(None)
+
+    def _work(self):
+        cap = None
+        position = None
+        try:
+            while True:
+                task = self._tasks.get()
+                if task is None:
+                    return
+                generation, frames, callback = task
+                if cap is None:
+                    self.cache.prepare()
+                    cap = video_utils.open_capture(
+                        self.video_path, self.backend
+                    )
+                for frame in frames:
+                    if generation != self._generation:
+                        break
+                    if frame in self.cache:
+                        # Found on disk after the request was queued
+                        self._pending.discard(frame)
+                        if callback is not None:
+                            callback(frame)
+                        continue
+                    position = video_utils.seek_forward(
+                        cap, position, frame, self.max_grab_frames
+                    )
+                    if position is None:
+                        # grab() failed partway: fall back to a real seek
+                        position = video_utils.seek_forward(
+                            cap, None, frame, 0
+                        )
+                    ret, image = cap.read()
+                    if not ret:
+                        position = None
+                        continue
+                    position = frame + 1
+                    self.cache.set(frame, self.make_thumbnail(image))
+                    self._pending.discard(frame)
+                    if callback is not None:
+                        callback(frame)
+        finally:
+            if cap is not None:
+                cap.release()
+
+    def make_thumbnail(self, image):
+        """Scale a BGR frame to the thumbnail height and convert it to RGB"""
+        import cv2
+
+        h, w = image.shape[:2]
+        width = max(1, round(w * self.height / h))
+        image = cv2.resize(
+            image, (width, self.height), interpolation=cv2.INTER_AREA
+        )
+        return cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
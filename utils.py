@@ -1,15 +1,23 @@
 import configparser
-from tkinter import filedialog
+import functools
+
 
 # --- i18n setup ---
-config = configparser.ConfigParser()
-config["DEFAULT"] = {"language": "en"}
-config.read("config.ini")
+@functools.cache
+def _translations():
+    """Translations of the configured language, loaded on first use"""
+    config = configparser.ConfigParser()
+    config["DEFAULT"] = {"language": "en"}
+    config.read("config.ini")
+
+    import i18n
 
-import i18n
+    lang = config["DEFAULT"].get("language", "en")
+    return i18n.translations[lang]
 
-lang = config["DEFAULT"].get("language", "en")
-t = lambda s: i18n.translations[lang].get(s, s)
+
+def t(s):
+    return _translations().get(s, s)
 
 
 def format_time(seconds, format_type="hh:mm:ss.sss"):
@@ -55,6 +63,8 @@ def time_str_to_sec(time_str):
 
 
 def load_video_dialog():
+    from tkinter import filedialog
+
     return filedialog.askopenfilename(
         title=t("Select video file"),
         filetypes=[
@@ -1,10 +1,15 @@
-import tempfile
-import cv2
+import hashlib
+import json
 import os
+import threading
+import time
 from pathlib import Path
 
-import numpy as np
-
+proxy_cache_dir = Path.home() / ".cache" / "video_splitter" / "proxies"
+video_info_cache_path = (
+    Path.home() / ".cache" / "video_splitter" / "video_info.json"
+)
+_video_info_lock = threading.Lock()
 
 codec_and_extensions = {
     "xvid": ".avi",
@@ -30,6 +35,9 @@ def split_video(
 ):
     """
     Split the video into segments and save them as files.
+    Segments are exported in order of their start time through a single
+    capture, so consecutive or nearby segments are reached by decoding
+    forward instead of re-opening and seeking the file for each one.
     Args:
         video_path (str): Path to the input video file
         segment_list (list): List of Segment objects
@@ -38,36 +46,258 @@ def split_video(
         codec (str): FourCC codec string for output video
         backend (str): Video backend to use ("opencv" or "ffmpeg")
     """
-    video_name = Path(video_path).stem
-    extension = codec_and_extensions.get(codec, ".avi")
-    for i, segment in enumerate(segment_list):
-        if progress_callback:
-            progress_callback(i, len(segment_list))
-        title = segment.title or f"part{i+1:03d}"
-        layer = str(segment.layer)
-        layer = f"l{layer}-" if layer else ""
-        output_file = os.path.join(
-            output_path, f"{video_name}_{layer}{title}{extension}"
+    import cv2
+
+    if not segments_overlap(segment_list):
+        return split_video_sequential(
+            video_path,
+            segment_list,
+            output_path,
+            progress_callback=progress_callback,
+            codec=codec,
+            backend=backend,
         )
-        fourcc = cv2.VideoWriter_fourcc(*codec)
-        if backend == "ffmpeg" and has_ffmpeg_support():
-            cap = cv2.VideoCapture(video_path, cv2.CAP_FFMPEG)
-        else:
-            cap = cv2.VideoCapture(video_path)
-        fps = cap.get(cv2.CAP_PROP_FPS)
-        width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
-        height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
-        out = cv2.VideoWriter(output_file, fourcc, fps, (width, height))
-        start_frame = int(segment.start_time * fps)
-        end_frame = int(segment.end_time * fps)
-        cap.set(cv2.CAP_PROP_POS_FRAMES, start_frame)
-        for frame_num in range(start_frame, end_frame):
-            ret, frame = cap.read()
-            if not ret:
+
+    extension = codec_and_extensions.get(codec, ".avi")
+    fourcc = cv2.VideoWriter_fourcc(*codec)
+    cap = open_capture(video_path, backend)
+    fps = cap.get(cv2.CAP_PROP_FPS)
+    width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
+    height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
+
+    order = sorted(
+        range(len(segment_list)), key=lambda i: segment_list[i].start_time
+    )
+    position = None
+    try:
+        for n, i in enumerate(order):
+            segment = segment_list[i]
+            if progress_callback:
+                progress_callback(n, len(segment_list))
+            output_file = get_output_file(
+                video_path, output_path, segment, i, extension
+            )
+            out = cv2.VideoWriter(output_file, fourcc, fps, (width, height))
+            start_frame = int(segment.start_time * fps)
+            end_frame = int(segment.end_time * fps)
+            position = seek_forward(cap, position, start_frame, round(fps))
+            if position is None:
+                position = seek_forward(cap, None, start_frame, 0)
+            for frame_num in range(start_frame, end_frame):
+                ret, frame = cap.read()
+                if not ret:
+                    position = None
+                    break
+                out.write(frame)
+                position = frame_num + 1
+            out.release()
+    finally:
+        cap.release()
+
+
+def split_video_sequential(
+    video_path,
+    segment_list,
+    output_path,
+    progress_callback=None,
+    codec="mp4v",
+    backend="opencv",
+    queue_size=32,
+):
+    """
+    Split the video into non-overlapping segments in one forward pass.
+    A reader thread decodes every needed frame exactly once into a bounded
+    queue while the calling thread encodes them, rotating to the next
+    writer at each segment boundary. Gaps between segments are skipped
+    with grab(), so back-to-back chunks never trigger a seek.
+    Args:
+        video_path (str): Path to the input video file
+        segment_list (list): List of non-overlapping Segment objects
+        output_path (str): Output directory
+        progress_callback (callable, optional): Callback to notify progress (index, total)
+        codec (str): FourCC codec string for output video
+        backend (str): Video backend to use ("opencv" or "ffmpeg")
+        queue_size (int): Maximum number of decoded frames held in memory
+    """
+    import queue
+    import cv2
+
+    if segments_overlap(segment_list):
+        raise ValueError("Segments must not overlap for sequential export")
+
+    extension = codec_and_extensions.get(codec, ".avi")
+    fourcc = cv2.VideoWriter_fourcc(*codec)
+    cap = open_capture(video_path, backend)
+    fps = cap.get(cv2.CAP_PROP_FPS)
+    width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
+    height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
+
+    order = sorted(
+        range(len(segment_list)), key=lambda i: segment_list[i].start_time
+    )
+    frames = queue.Queue(maxsize=queue_size)
+    stop = threading.Event()
+    reader_error = []
+
+    def put(item):
+        while not stop.is_set():
+            try:
+                frames.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def reader():
+        position = None
+        try:
+            for n, i in enumerate(order):
+                segment = segment_list[i]
+                start_frame = int(segment.start_time * fps)
+                end_frame = int(segment.end_time * fps)
+                position = seek_forward(cap, position, start_frame, round(fps))
+                if position is None:
+                    position = seek_forward(cap, None, start_frame, 0)
+                for frame_num in range(start_frame, end_frame):
+                    ret, frame = cap.read()
+                    if not ret:
+                        position = None
+                        break
+                    if not put((n, frame)):
+                        return
+                    position = frame_num + 1
+                if not put((n, None)):
+                    return
+        except Exception as e:
+            reader_error.append(e)
+        finally:
+            put(None)
+
+    reader_thread = threading.Thread(target=reader, daemon=True)
+    reader_thread.start()
+
+    out = None
+    try:
+        while True:
+            item = frames.get()
+            if item is None:
                 break
+            n, frame = item
+            if frame is None:
+                # Segment finished: rotate the writer
+                if out is not None:
+                    out.release()
+                    out = None
+                continue
+            if out is None:
+                i = order[n]
+                if progress_callback:
+                    progress_callback(n, len(segment_list))
+                output_file = get_output_file(
+                    video_path, output_path, segment_list[i], i, extension
+                )
+                out = cv2.VideoWriter(
+                    output_file, fourcc, fps, (width, height)
+                )
             out.write(frame)
+    finally:
+        stop.set()
+        reader_thread.join()
+        if out is not None:
+            out.release()
         cap.release()
-        out.release()
+
+    if reader_error:
+        raise reader_error[0]
+
+
+def segments_overlap(segment_list):
+    """Check whether any two segments overlap in time"""
+    ranges = sorted(
+        (segment.start_time, segment.end_time) for segment in segment_list
+    )
+    return any(
+        next_start < end
+        for (_, end), (next_start, _) in zip(ranges, ranges[1:])
+    )
+
+
+def get_output_file(video_path, output_path, segment, index, extension):
+    """Build the output file path of a segment"""
+    video_name = Path(video_path).stem
+    title = segment.title or f"part{index+1:03d}"
+    layer = str(segment.layer)
+    layer = f"l{layer}-" if layer else ""
+    return os.path.join(output_path, f"{video_name}_{layer}{title}{extension}")
+
+
+def open_capture(video_path, backend="opencv"):
+    """Open a capture with the requested backend if it is available"""
+    import cv2
+
+    if backend == "ffmpeg" and has_ffmpeg_support():
+        return cv2.VideoCapture(video_path, cv2.CAP_FFMPEG)
+    return cv2.VideoCapture(video_path)
+
+
+def scan_packets(video_path, cancel_event=None):
+    """
+    Read every packet without decoding and collect keyframes and timestamps.
+    Requires the FFMPEG backend.
+    Args:
+        video_path (str): Path to the input video file
+        cancel_event (threading.Event, optional): Set to stop early
+    Returns:
+        tuple: (keyframes, timestamps) lists of keyframe numbers and
+            per-frame timestamps in milliseconds, or None if the packets
+            cannot be read or the scan was cancelled
+    """
+    import cv2
+
+    if not has_ffmpeg_support():
+        return None
+    cap = cv2.VideoCapture(video_path, cv2.CAP_FFMPEG)
+    try:
+        # -1 switches the capture to raw (undecoded) packet reading
+        if not cap.isOpened() or not cap.set(cv2.CAP_PROP_FORMAT, -1):
+            return None
+        keyframes = []
+        timestamps = []
+        while cap.grab():
+            if cancel_event is not None and cancel_event.is_set():
+                return None
+            if cap.get(cv2.CAP_PROP_LRF_HAS_KEY_FRAME):
+                keyframes.append(len(timestamps))
+            timestamps.append(cap.get(cv2.CAP_PROP_POS_MSEC))
+        return keyframes, timestamps
+    finally:
+        cap.release()
+
+
+def seek_forward(cap, position, target_frame, max_grab_frames):
+    """
+    Move the capture to target_frame, decoding forward when it is close.
+    Args:
+        cap (cv2.VideoCapture): Video capture object
+        position (int | None): Current frame position, None if unknown
+        target_frame (int): Frame to move to
+        max_grab_frames (int): Largest forward gap skipped with grab()
+    Returns:
+        int | None: The new position (target_frame), or None when grab()
+            failed and the position is unknown
+    """
+    import cv2
+
+    if (
+        position is not None
+        and 0 <= target_frame - position <= max_grab_frames
+    ):
+        for _ in range(target_frame - position):
+            if not cap.grab():
+                return None
+    else:
+        cap.set(cv2.CAP_PROP_POS_FRAMES, target_frame)
+    return target_frame
 
 
 def load_video(video_path, backend="opencv"):
@@ -81,6 +311,8 @@ def load_video(video_path, backend="opencv"):
         total_frames (int): Total number of frames
         fps (float): Video frame rate
     """
+    import cv2
+
     cap = None
     if backend == "ffmpeg" and has_ffmpeg_support():
         cap = cv2.VideoCapture(video_path, cv2.CAP_FFMPEG)
@@ -101,13 +333,272 @@ def load_video(video_path, backend="opencv"):
     if cap is None:
         cap = cv2.VideoCapture(video_path)
 
+    if cap.isOpened():
+        info = get_video_info(video_path, cap=cap)
+        return cap, info["total_frames"], info["fps"]
+
     total_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
     fps = cap.get(cv2.CAP_PROP_FPS)
     return cap, total_frames, fps
 
 
+def probe_video_info(video_path, backend="opencv", cap=None, packets=None):
+    """
+    Read the metadata of a video from its container.
+    The frame count reported by the container can be an estimate, so it is
+    replaced by the number of packets when a packet scan is given, which
+    also gives the keyframe interval. The scan is not run here: it reads
+    the whole file.
+    Args:
+        video_path (str): Path to the input video file
+        backend (str): Video backend to use ("opencv" or "ffmpeg")
+        cap (cv2.VideoCapture, optional): Open capture of the video
+        packets (tuple, optional): (keyframes, timestamps) of a packet
+            scan, see scan_packets()
+    Returns:
+        dict: "total_frames", "fps", "width", "height", "codec" (FourCC),
+            "keyframe_interval" (longest, None if unknown) and "verified"
+            (whether the frame count comes from a packet scan), or None if
+            the video cannot be opened
+    """
+    import cv2
+
+    own_cap = cap is None
+    if own_cap:
+        cap = open_capture(video_path, backend)
+    try:
+        if not cap.isOpened():
+            return None
+        fourcc = int(cap.get(cv2.CAP_PROP_FOURCC))
+        info = {
+            "total_frames": int(cap.get(cv2.CAP_PROP_FRAME_COUNT)),
+            "fps": cap.get(cv2.CAP_PROP_FPS),
+            "width": int(cap.get(cv2.CAP_PROP_FRAME_WIDTH)),
+            "height": int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT)),
+            "codec": "".join(
+                chr((fourcc >> 8 * i) & 0xFF) for i in range(4)
+            ).strip("\x00 "),
+            "keyframe_interval": None,
+            "verified": False,
+        }
+    finally:
+        if own_cap:
+            cap.release()
+
+    if packets is not None and len(packets[1]):
+        keyframes, timestamps = packets
+        bounds = sorted(set([0] + keyframes)) + [len(timestamps)]
+        info["total_frames"] = len(timestamps)
+        info["keyframe_interval"] = max(
+            b - a for a, b in zip(bounds, bounds[1:])
+        )
+        info["verified"] = True
+    return info
+
+
+def get_video_info(
+    video_path, backend="opencv", cap=None, cache_path=None, packets=None
+):
+    """
+    Get the metadata of a video without scanning it.
+    Only verified metadata is cached: a cached entry is returned as is,
+    otherwise the container values are read. Passing the packets of a scan
+    done elsewhere (e.g. for a FrameIndex) verifies the frame count and
+    stores the result. Entries are keyed by the absolute path and are valid
+    while the size, modification time and content fingerprint of the file
+    are unchanged.
+    Args:
+        video_path (str): Path to the input video file
+        backend (str): Video backend used when the video must be probed
+        cap (cv2.VideoCapture, optional): Open capture of the video
+        cache_path (str, optional): JSON file of the cache
+        packets (tuple, optional): (keyframes, timestamps) of a packet scan
+    Returns:
+        dict: Same as probe_video_info()
+    """
+    if cache_path is None:
+        cache_path = video_info_cache_path
+    key = os.path.abspath(video_path)
+    try:
+        stat = os.stat(video_path)
+        fingerprint = video_fingerprint(video_path)
+    except OSError:
+        return probe_video_info(video_path, backend, cap, packets)
+
+    with _video_info_lock:
+        entry = _read_video_info_cache(cache_path).get(key)
+    if (
+        entry is not None
+        and entry.get("size") == stat.st_size
+        and entry.get("mtime_ns") == stat.st_mtime_ns
+        and entry.get("fingerprint") == fingerprint
+        and entry["info"].get("verified")
+    ):
+        return entry["info"]
+
+    info = probe_video_info(video_path, backend, cap, packets)
+    if info is None or not info["verified"]:
+        return info
+    with _video_info_lock:
+        entries = _read_video_info_cache(cache_path)
+        entries[key] = {
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "fingerprint": fingerprint,
+            "info": info,
+        }
+        _write_video_info_cache(cache_path, entries)
+    return info
+
+
+def _read_video_info_cache(cache_path):
+    try:
+        with open(cache_path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _write_video_info_cache(cache_path, entries):
+    os.makedirs(os.path.dirname(cache_path) or ".", exist_ok=True)
+    part_path = f"{cache_path}.part"
+    try:
+        with open(part_path, "w", encoding="utf-8") as f:
+            json.dump(entries, f, ensure_ascii=False)
+        os.replace(part_path, cache_path)
+    except OSError as e:
+        print(f"[Warn]Failed to write video info cache: {e}")
+
+
+def video_fingerprint(video_path, head_size=1024 * 1024):
+    """
+    Identify a video file by its size, modification time and first bytes.
+    Unlike the path, the fingerprint survives moving or renaming the file
+    and changes when the file is replaced.
+    """
+    stat = os.stat(video_path)
+    digest = hashlib.sha1(f"{stat.st_size}:{stat.st_mtime_ns}".encode())
+    with open(video_path, "rb") as f:
+        digest.update(f.read(head_size))
+    return digest.hexdigest()
+
+
+def get_proxy_path(video_path, height, cache_dir=None):
+    """Path of the editing proxy of a video in the proxy cache directory"""
+    if cache_dir is None:
+        cache_dir = proxy_cache_dir
+    return str(
+        Path(cache_dir) / f"{video_fingerprint(video_path)}_{height}p.avi"
+    )
+
+
+def is_valid_proxy(proxy_path, total_frames):
+    """Check that a proxy exists and has the same frame numbering"""
+    import cv2
+
+    if not os.path.exists(proxy_path):
+        return False
+    cap = cv2.VideoCapture(proxy_path)
+    try:
+        return (
+            cap.isOpened()
+            and int(cap.get(cv2.CAP_PROP_FRAME_COUNT)) == total_frames
+        )
+    finally:
+        cap.release()
+
+
+def create_proxy(
+    video_path,
+    proxy_path,
+    height=360,
+    backend="opencv",
+    progress_callback=None,
+    cancel_event=None,
+    total_frames=None,
+):
+    """
+    Transcode a video to a low-resolution, all-intra MJPG proxy.
+    Every source frame is written, so a frame number means the same image
+    in the source and the proxy. The proxy is written to a temporary file
+    and only moved into place once complete.
+    Args:
+        video_path (str): Path to the source video
+        proxy_path (str): Path of the proxy (.avi)
+        height (int): Proxy height; the width keeps the aspect ratio
+        backend (str): Video backend to read the source with
+        progress_callback (callable, optional): Called with (done, total)
+        cancel_event (threading.Event, optional): Set to stop early
+        total_frames (int, optional): Frame count the proxy must have,
+            defaults to that of get_video_info()
+    Returns:
+        bool: True if the proxy was created
+    """
+    import cv2
+    import numpy as np
+
+    cap = open_capture(video_path, backend)
+    info = get_video_info(video_path, backend, cap=cap)
+    if total_frames is None and info is not None:
+        total_frames = info["total_frames"]
+    if info is None or info["height"] <= 0 or not total_frames:
+        cap.release()
+        return False
+    fps = info["fps"]
+    source_width, source_height = info["width"], info["height"]
+
+    # Even dimensions keep codecs happy; never upscale
+    height = min(height, int(source_height)) // 2 * 2
+    width = round(source_width * height / source_height) // 2 * 2
+
+    os.makedirs(os.path.dirname(proxy_path) or ".", exist_ok=True)
+    temp_path = proxy_path + ".part.avi"
+    out = cv2.VideoWriter(
+        temp_path, cv2.VideoWriter_fourcc(*"MJPG"), fps, (width, height)
+    )
+    resized = np.empty((height, width, 3), dtype=np.uint8)
+    written = 0
+    last_frame = None
+    try:
+        while written < total_frames:
+            if cancel_event is not None and cancel_event.is_set():
+                break
+            ret, frame = cap.read()
+            if ret:
+                cv2.resize(
+                    frame,
+                    (width, height),
+                    dst=resized,
+                    interpolation=cv2.INTER_AREA,
+                )
+                last_frame = resized
+            elif last_frame is None:
+                break
+            # Repeat the last good frame for undecodable ones so frame
+            # numbers stay aligned with the source
+            out.write(last_frame)
+            written += 1
+            if progress_callback is not None and written % 100 == 0:
+                progress_callback(written, total_frames)
+    finally:
+        cap.release()
+        out.release()
+
+    if written < total_frames or not is_valid_proxy(temp_path, total_frames):
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        return False
+
+    os.replace(temp_path, proxy_path)
+    if progress_callback is not None:
+        progress_callback(written, total_frames)
+    return True
+
+
 def has_ffmpeg_support() -> bool:
     """Check if OpenCV is built with FFMPEG support."""
+    import cv2
+
     try:
         info = cv2.getBuildInformation()
     except Exception:
@@ -116,39 +607,185 @@ def has_ffmpeg_support() -> bool:
     return "FFMPEG:YES" in info.upper().replace(" ", "")
 
 
-def get_available_codecs():
-    """Test which codecs are actually available"""
+def codec_probe_key():
+    """Identify the OpenCV build; codec availability changes with it"""
+    import cv2
+
+    build_hash = hashlib.sha1(cv2.getBuildInformation().encode()).hexdigest()
+    return f"{cv2.__version__}:{build_hash[:16]}"
+
+
+def probe_codec(codec, extension):
+    """Check whether a codec can write a frame to a file"""
+    import tempfile
+    import cv2
+    import numpy as np
+
     test_frame = np.zeros((480, 640, 3), dtype=np.uint8)
     test_fps = 30
+    fourcc = cv2.VideoWriter_fourcc(*codec)
 
-    available_codecs = []
-    for codec, extension in codec_and_extensions.items():
-        fourcc = cv2.VideoWriter_fourcc(*codec)
+    with tempfile.NamedTemporaryFile(
+        suffix=extension, delete=False
+    ) as tmp_file:
+        tmp_path = tmp_file.name
 
-        with tempfile.NamedTemporaryFile(
-            suffix=extension, delete=False
-        ) as tmp_file:
-            tmp_path = tmp_file.name
+    available = False
+    try:
+        test_writer = cv2.VideoWriter(
+            tmp_path, fourcc, test_fps, test_frame.shape[1::-1]
+        )
+        if test_writer.isOpened():
+            test_writer.write(test_frame)
+            test_writer.release()
 
-        available = False
-        try:
-            test_writer = cv2.VideoWriter(
-                tmp_path, fourcc, test_fps, test_frame.shape[1::-1]
-            )
-            if test_writer.isOpened():
-                test_writer.write(test_frame)
-                test_writer.release()
+            if os.path.exists(tmp_path) and os.path.getsize(tmp_path) > 0:
+                available = True
 
-                if os.path.exists(tmp_path) and os.path.getsize(tmp_path) > 0:
-                    available = True
+    except Exception as e:
+        print(f"Error testing codec {codec}: {e}")
 
-        except Exception as e:
-            print(f"Error testing codec {codec}: {e}")
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+    return available
+
+
+def get_available_codecs(max_workers=None):
+    """
+    Test which codecs are actually available.
+    Codecs are probed in parallel; the result keeps the order of
+    codec_and_extensions.
+    Args:
+        max_workers (int, optional): Number of probing threads
+    Returns:
+        list: (codec, extension) tuples
+    """
+    import concurrent.futures
+
+    items = list(codec_and_extensions.items())
+    with concurrent.futures.ThreadPoolExecutor(
+        max_workers=max_workers or len(items)
+    ) as executor:
+        results = list(executor.map(lambda item: probe_codec(*item), items))
+    return [item for item, available in zip(items, results) if available]
+
+
+# Codec choices resolved from benchmark results: metric and whether higher
+# values are better
+auto_codecs = {
+    "auto: fastest": ("fps", True),
+    "auto: smallest": ("bytes_per_frame", False),
+}
 
-        finally:
-            if available:
-                available_codecs.append((codec, extension))
-            if os.path.exists(tmp_path):
-                os.remove(tmp_path)
 
-    return available_codecs
+def make_benchmark_frames(width, height, frame_count):
+    """Synthetic clip: a gradient panning across the frame plus noise, so
+    that both motion and detail cost something to encode"""
+    import numpy as np
+
+    rng = np.random.default_rng(0)
+    ramp = np.linspace(0, 255, width * 2, dtype=np.float32)
+    rows = np.linspace(0, 64, height, dtype=np.float32)[:, None]
+    frames = []
+    for i in range(frame_count):
+        shift = i * width // max(1, frame_count)
+        base = ramp[shift : shift + width][None, :] + rows
+        frame = np.empty((height, width, 3), dtype=np.uint8)
+        for channel, scale in enumerate((1.0, 0.7, 0.4)):
+            noise = rng.integers(0, 4, (height, width), dtype=np.uint8)
+            frame[:, :, channel] = np.clip(base * scale, 0, 251) + noise
+        frames.append(frame)
+    return frames
+
+
+def benchmark_codec(codec, extension, frames, fps=30, time_limit=2.0):
+    """
+    Encode frames with a codec and measure its speed and output size.
+    Args:
+        codec (str): FourCC codec string
+        extension (str): Container extension
+        frames (list): BGR frames of the same size
+        fps (float): Frame rate written to the file
+        time_limit (float): Seconds after which a slow codec stops early
+    Returns:
+        dict: "fps" (encoded frames per second) and "bytes_per_frame", or
+            None if the codec cannot write the frames
+    """
+    import tempfile
+    import cv2
+
+    height, width = frames[0].shape[:2]
+    with tempfile.NamedTemporaryFile(suffix=extension, delete=False) as f:
+        tmp_path = f.name
+    try:
+        start = time.perf_counter()
+        writer = cv2.VideoWriter(
+            tmp_path, cv2.VideoWriter_fourcc(*codec), fps, (width, height)
+        )
+        if not writer.isOpened():
+            return None
+        written = 0
+        for frame in frames:
+            writer.write(frame)
+            written += 1
+            if written >= 2 and time.perf_counter() - start > time_limit:
+                break
+        writer.release()
+        elapsed = time.perf_counter() - start
+        size = os.path.getsize(tmp_path)
+        if size == 0:
+            return None
+        return {
+            "fps": written / elapsed if elapsed > 0 else float("inf"),
+            "bytes_per_frame": size / written,
+        }
+    except Exception as e:
+        print(f"Error benchmarking codec {codec}: {e}")
+        return None
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def benchmark_codecs(codecs, width, height, frame_count=30):
+    """
+    Benchmark codecs one after another on the same synthetic clip.
+    Args:
+        codecs (list): (codec, extension) tuples
+        width (int): Frame width, usually that of the source video
+        height (int): Frame height
+        frame_count (int): Length of the clip
+    Returns:
+        dict: codec -> benchmark_codec() result
+    """
+    frames = make_benchmark_frames(width, height, frame_count)
+    return {
+        codec: benchmark_codec(codec, extension, frames)
+        for codec, extension in codecs
+    }
+
+
+def select_codec(choice, benchmarks, fallback="mp4v"):
+    """
+    Resolve an automatic codec choice from benchmark results.
+    Args:
+        choice (str): A codec, or a key of auto_codecs
+        benchmarks (dict): codec -> benchmark result (None if unusable)
+        fallback (str): Codec used when nothing was measured
+    Returns:
+        str: FourCC codec string
+    """
+    if choice not in auto_codecs:
+        return choice
+    metric, higher_is_better = auto_codecs[choice]
+    measured = {
+        codec: result[metric]
+        for codec, result in (benchmarks or {}).items()
+        if result is not None
+    }
+    if not measured:
+        return fallback
+    pick = max if higher_is_better else min
+    return pick(measured, key=measured.get)